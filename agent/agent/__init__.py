@@ -1,3 +1,5 @@
+from . import startup  # noqa: F401  - first, so startup timings cover every import
+
 import uvicorn
 from .server import app
 
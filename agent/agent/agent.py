@@ -1,4 +1,5 @@
 from typing import Any, Dict, List, Optional
+import json
 import os
 from dotenv import load_dotenv
 
@@ -7,6 +8,22 @@ from llama_index.core.tools import FunctionTool, ToolOutput
 from llama_index.core.workflow import Context
 from llama_index.protocols.ag_ui.router import get_ag_ui_workflow_router
 
+from .feed_filter import (
+    DEFAULT_FEED_FILTER,
+    _apply_feed_filter_to_cases,
+    _map_injury_preference,
+    _map_property_preference,
+    _map_sort_preference,
+    _summarize_feed_filter,
+    _trimmed_unique,
+    case_set_version,
+    search_cases,
+)
+from .metrics import get_case_metrics
+from .similarity import find_similar_cases
+from .state_projection import CASE_SUMMARY_FIELDS, case_summary
+from .state_sync import DashboardChatWorkflow, patch_state
+
 # Load environment variables early to support local development via .env
 load_dotenv()
 
@@ -86,17 +103,6 @@ _sheet_list_tool = FunctionTool.from_defaults(
 # Shared dashboard state structure
 # ---------------------------------------------------------------------------- #
 
-DEFAULT_FEED_FILTER: Dict[str, Any] = {
-    "summary": "",
-    "searchText": "",
-    "categories": [],
-    "jurisdictions": [],
-    "injury": None,
-    "propertyDamage": None,
-    "incidentIds": [],
-}
-
-
 INITIAL_STATE: Dict[str, Any] = {
     "cases": [],
     "queuedCases": [],
@@ -129,168 +135,15 @@ INITIAL_STATE: Dict[str, Any] = {
         "injuryCount": 0,
         "propertyDamageCount": 0,
         "casesByCategory": {},
+        "casesByJurisdiction": {},
+        "casesByFaultDetermination": {},
+        "casesByResolution": {},
+        "casesByDay": {},
+        "casesByHour": {},
     },
 }
 
 
-# ---------------------------------------------------------------------------- #
-# Feed filter utilities
-# ---------------------------------------------------------------------------- #
-
-SEARCHABLE_FIELDS: List[str] = [
-    "incidentId",
-    "incidentCategory",
-    "incidentDescription",
-    "location",
-    "fullName",
-    "resolution",
-    "faultDetermination",
-]
-
-
-def _trimmed_unique(values: Optional[List[str]]) -> List[str]:
-    if not values:
-        return []
-
-    seen: set[str] = set()
-    result: List[str] = []
-    for value in values:
-        if not isinstance(value, str):
-            continue
-        trimmed = value.strip()
-        if not trimmed:
-            continue
-        key = trimmed.lower()
-        if key in seen:
-            continue
-        seen.add(key)
-        result.append(trimmed)
-    return result
-
-
-def _normalize_text(value: Any) -> str:
-    if isinstance(value, str):
-        return value.strip().lower()
-    return ""
-
-
-def _map_injury_preference(value: Optional[str]) -> Optional[bool]:
-    normalized = _normalize_text(value)
-    if normalized in {"requires_injury", "require_injury", "injury_required", "only_injury"}:
-        return True
-    if normalized in {"exclude_injury", "no_injury", "without_injury"}:
-        return False
-    return None
-
-
-def _map_property_preference(value: Optional[str]) -> Optional[bool]:
-    normalized = _normalize_text(value)
-    if normalized in {"requires_damage", "require_damage", "damage_required"}:
-        return True
-    if normalized in {"exclude_damage", "no_damage", "without_damage"}:
-        return False
-    return None
-
-
-def _apply_feed_filter_to_cases(
-    cases: List[Dict[str, Any]], feed_filter: Dict[str, Any]
-) -> List[Dict[str, Any]]:
-    if not cases:
-        return []
-
-    tokens = [token for token in _normalize_text(feed_filter.get("searchText", "")).split() if token]
-    category_match = {
-        _normalize_text(category)
-        for category in feed_filter.get("categories", [])
-        if isinstance(category, str)
-    }
-    jurisdiction_match = {
-        _normalize_text(jurisdiction)
-        for jurisdiction in feed_filter.get("jurisdictions", [])
-        if isinstance(jurisdiction, str)
-    }
-    incident_id_match = {
-        _normalize_text(incident_id)
-        for incident_id in feed_filter.get("incidentIds", [])
-        if isinstance(incident_id, str)
-    }
-
-    injury_preference = feed_filter.get("injury")
-    property_preference = feed_filter.get("propertyDamage")
-
-    filtered: List[Dict[str, Any]] = []
-    for case in cases:
-        incident_id = _normalize_text(case.get("incidentId"))
-        if incident_id_match and incident_id not in incident_id_match:
-            continue
-
-        category = _normalize_text(case.get("incidentCategory"))
-        if category_match and category not in category_match:
-            continue
-
-        jurisdiction = _normalize_text(case.get("jurisdiction"))
-        if jurisdiction_match and jurisdiction not in jurisdiction_match:
-            continue
-
-        if injury_preference is not None:
-            if bool(case.get("injuryReported")) != bool(injury_preference):
-                continue
-
-        if property_preference is not None:
-            if bool(case.get("propertyDamage")) != bool(property_preference):
-                continue
-
-        if tokens:
-            haystack = " ".join(_normalize_text(case.get(field, "")) for field in SEARCHABLE_FIELDS)
-            if not all(token in haystack for token in tokens):
-                continue
-
-        filtered.append(case)
-
-    return filtered
-
-
-def _summarize_feed_filter(filter_state: Dict[str, Any]) -> str:
-    if not filter_state:
-        return ""
-
-    summary = (filter_state.get("summary") or "").strip()
-    if summary:
-        return summary
-
-    parts: List[str] = []
-
-    categories = _trimmed_unique(filter_state.get("categories"))
-    if categories:
-        parts.append(f"Categories: {', '.join(categories)}")
-
-    jurisdictions = _trimmed_unique(filter_state.get("jurisdictions"))
-    if jurisdictions:
-        parts.append(f"Jurisdictions: {', '.join(jurisdictions)}")
-
-    injury_pref = filter_state.get("injury")
-    if injury_pref is True:
-        parts.append("Requires injury")
-    elif injury_pref is False:
-        parts.append("Exclude injury cases")
-
-    property_pref = filter_state.get("propertyDamage")
-    if property_pref is True:
-        parts.append("Requires property damage")
-    elif property_pref is False:
-        parts.append("Exclude property damage cases")
-
-    incident_ids = _trimmed_unique(filter_state.get("incidentIds"))
-    if incident_ids:
-        parts.append(f"Incident IDs: {', '.join(incident_ids)}")
-
-    search_text = (filter_state.get("searchText") or "").strip()
-    if search_text:
-        parts.append(f'Text contains "{search_text}"')
-
-    return " • ".join(parts) if parts else "Custom filter"
-
-
 async def filter_live_feed_cases_tool(
     ctx: Context,
     intent: str = "apply",
@@ -301,6 +154,7 @@ async def filter_live_feed_cases_tool(
     injury: Optional[str] = None,
     propertyDamage: Optional[str] = None,
     incidentIds: Optional[List[str]] = None,
+    sort: Optional[str] = None,
 ) -> ToolOutput:
     """Adjust the live incident feed filter.
 
@@ -312,6 +166,7 @@ async def filter_live_feed_cases_tool(
     :param injury: "requires_injury" to require injury cases, "exclude_injury" to reject them, "any" otherwise.
     :param propertyDamage: "requires_damage" to require property damage, "exclude_damage" to reject it, "any" otherwise.
     :param incidentIds: Restrict results to specific incident IDs.
+    :param sort: "relevance" to order matches by how well they match searchText, best first; omit for sheet order.
     """
 
     raw_input = {
@@ -323,12 +178,14 @@ async def filter_live_feed_cases_tool(
         "injury": injury,
         "propertyDamage": propertyDamage,
         "incidentIds": incidentIds,
+        "sort": sort,
     }
 
+    # Only feedFilter, activeCaseId and lastAction change; they are sent to the
+    # dashboard as a state delta rather than a copy of every case.
     state = await ctx.store.get("state", default={})
     if not isinstance(state, dict):
         state = {}
-    state = {**state}
 
     cases = state.get("cases") or []
     if not isinstance(cases, list):
@@ -337,12 +194,16 @@ async def filter_live_feed_cases_tool(
     intent_value = (intent or "apply").strip().lower()
 
     if intent_value == "clear":
-        state["feedFilter"] = dict(DEFAULT_FEED_FILTER)
+        cleared_filter = dict(DEFAULT_FEED_FILTER)
         matching_ids = [case.get("incidentId") for case in cases if case.get("incidentId")]
-        state["activeCaseId"] = matching_ids[0] if matching_ids else None
-        state["lastAction"] = "Cleared live feed filter"
-
-        await ctx.store.set("state", state)
+        await patch_state(
+            ctx,
+            {
+                "feedFilter": cleared_filter,
+                "activeCaseId": matching_ids[0] if matching_ids else None,
+                "lastAction": "Cleared live feed filter",
+            },
+        )
 
         return ToolOutput(
             tool_name="filter_live_feed_cases",
@@ -351,7 +212,7 @@ async def filter_live_feed_cases_tool(
             raw_output={
                 "matchingIncidentIds": matching_ids,
                 "matchingCount": len(matching_ids),
-                "feedFilter": state["feedFilter"],
+                "feedFilter": cleared_filter,
             },
         )
 
@@ -363,34 +224,59 @@ async def filter_live_feed_cases_tool(
         "injury": _map_injury_preference(injury),
         "propertyDamage": _map_property_preference(propertyDamage),
         "incidentIds": _trimmed_unique(incidentIds),
+        "sort": _map_sort_preference(sort),
+        "rankedIncidentIds": [],
     }
 
-    filtered_cases = _apply_feed_filter_to_cases(cases, new_filter)
+    sheet = state.get("sheet") if isinstance(state.get("sheet"), dict) else None
+    # One version for the index, the relevance search and the view metrics.
+    version = case_set_version(cases, sheet)
+    filtered_cases = _apply_feed_filter_to_cases(cases, new_filter, sheet, version=version)
     matching_ids = [case.get("incidentId") for case in filtered_cases if case.get("incidentId")]
-
-    state["feedFilter"] = new_filter
-
-    current_active = state.get("activeCaseId")
+    ranked: List[Dict[str, Any]] = []
+    if new_filter["sort"] == "relevance":
+        ranked = search_cases(cases, new_filter, sheet=sheet, version=version)["matches"]
+        new_filter["rankedIncidentIds"] = [match["incidentId"] for match in ranked if match["incidentId"]]
+        ranked_ids = set(new_filter["rankedIncidentIds"])
+        matching_ids = new_filter["rankedIncidentIds"] + [
+            incident_id for incident_id in matching_ids if incident_id not in ranked_ids
+        ]
+
+    active_case_id = state.get("activeCaseId")
     if matching_ids:
-        if current_active not in matching_ids:
-            state["activeCaseId"] = matching_ids[0]
+        if active_case_id not in matching_ids:
+            active_case_id = matching_ids[0]
     else:
-        state["activeCaseId"] = None
+        active_case_id = None
 
+    view_metrics = get_case_metrics(cases, version).summarize(matching_ids)
     summary_text = _summarize_feed_filter(new_filter)
-    state["lastAction"] = (
-        f"Applied live feed filter: {summary_text}"
-        if summary_text
-        else "Applied live feed filter"
+    await patch_state(
+        ctx,
+        {
+            "feedFilter": new_filter,
+            "activeCaseId": active_case_id,
+            "lastAction": (
+                f"Applied live feed filter: {summary_text}"
+                if summary_text
+                else "Applied live feed filter"
+            ),
+        },
     )
 
-    await ctx.store.set("state", state)
-
     message = (
         f"Filtered live feed to {summary_text} ({len(filtered_cases)} matches)."
         if summary_text
         else f"Filtered live feed ({len(filtered_cases)} matches)."
     )
+    message += (
+        f" {view_metrics['injuryCount']} with injuries, "
+        f"{view_metrics['propertyDamageCount']} with property damage."
+    )
+    if ranked:
+        message += " Best matches: " + ", ".join(
+            f"{match['incidentId']} ({match['score']})" for match in ranked[:10]
+        ) + "."
 
     return ToolOutput(
         tool_name="filter_live_feed_cases",
@@ -401,6 +287,10 @@ async def filter_live_feed_cases_tool(
             "matchingCount": len(filtered_cases),
             "feedFilter": new_filter,
             "summary": summary_text,
+            "metrics": view_metrics,
+            "rankedMatches": [
+                {"incidentId": match["incidentId"], "score": match["score"]} for match in ranked
+            ],
         },
     )
 
@@ -411,7 +301,125 @@ _filter_live_feed_tool = FunctionTool.from_defaults(
     description=(
         "Apply or clear filters on the live incident feed. Use the 'intent' parameter "
         "('apply' or 'clear') along with optional fields like summary, searchText, "
-        "categories, jurisdictions, injury, propertyDamage, and incidentIds."
+        "categories, jurisdictions, injury, propertyDamage, and incidentIds. Set sort to "
+        "'relevance' to rank broad searchText matches best-first."
+    ),
+)
+
+
+CASE_DETAILS_LIMIT = 10
+
+
+async def get_case_details_tool(
+    ctx: Context,
+    incidentIds: List[str],
+    fields: Optional[List[str]] = None,
+) -> ToolOutput:
+    """Fetch complete case records from the dashboard state.
+
+    :param incidentIds: Incident IDs to look up (at most 10 per call).
+    :param fields: Optional CaseRecord fields to return; all fields when omitted.
+    """
+
+    state = await ctx.store.get("state", default={})
+    if not isinstance(state, dict):
+        state = {}
+
+    wanted = _trimmed_unique(incidentIds)[:CASE_DETAILS_LIMIT]
+    by_id: Dict[str, Dict[str, Any]] = {}
+    for key in ("cases", "queuedCases"):
+        for case in state.get(key) or []:
+            if isinstance(case, dict) and case.get("incidentId") in wanted:
+                by_id.setdefault(case["incidentId"], case)
+
+    selected_fields = _trimmed_unique(fields)
+    records = []
+    for incident_id in wanted:
+        case = by_id.get(incident_id)
+        if case is None:
+            continue
+        if selected_fields:
+            case = {field: case.get(field) for field in ["incidentId", *selected_fields]}
+        records.append(case)
+    missing = [incident_id for incident_id in wanted if incident_id not in by_id]
+
+    content = json.dumps({"cases": records, "notFound": missing}, default=str)
+    return ToolOutput(
+        tool_name="get_case_details",
+        content=content,
+        raw_input={"incidentIds": incidentIds, "fields": fields},
+        raw_output={"cases": records, "notFound": missing},
+    )
+
+
+_case_details_tool = FunctionTool.from_defaults(
+    async_fn=get_case_details_tool,
+    name="get_case_details",
+    description=(
+        "Fetch the complete CaseRecord for specific incident IDs (up to 10 per call), "
+        "optionally limited to certain fields. Use it when relevantCases in the state "
+        "does not include a case or its full description."
+    ),
+)
+
+
+async def find_similar_cases_tool(
+    ctx: Context,
+    text: Optional[str] = None,
+    incidentId: Optional[str] = None,
+    limit: int = 5,
+) -> ToolOutput:
+    """Find incidents whose descriptions are most similar to some text or to an existing case.
+
+    :param text: Free-text description to compare against, e.g. "rear-end collision with neck injury".
+    :param incidentId: Use this case's description as the query instead of text.
+    :param limit: Number of similar incidents to return (default 5).
+    """
+
+    state = await ctx.store.get("state", default={})
+    if not isinstance(state, dict):
+        state = {}
+    cases = [
+        case
+        for key in ("cases", "queuedCases")
+        for case in state.get(key) or []
+        if isinstance(case, dict)
+    ]
+    sheet = state.get("sheet") if isinstance(state.get("sheet"), dict) else {}
+
+    raw_input = {"text": text, "incidentId": incidentId, "limit": limit}
+    try:
+        matches = find_similar_cases(
+            cases,
+            key=("state", sheet.get("sheetId"), sheet.get("sheetName")),
+            text=text,
+            incident_id=incidentId,
+            limit=limit,
+        )
+    except ValueError as exc:
+        return ToolOutput(
+            tool_name="find_similar_cases",
+            content=str(exc),
+            raw_input=raw_input,
+            raw_output=str(exc),
+            is_error=True,
+        )
+
+    results = [{"score": match["score"], **case_summary(match["case"])} for match in matches]
+    return ToolOutput(
+        tool_name="find_similar_cases",
+        content=json.dumps({"matches": results}, default=str),
+        raw_input=raw_input,
+        raw_output={"matches": results},
+    )
+
+
+_similar_cases_tool = FunctionTool.from_defaults(
+    async_fn=find_similar_cases_tool,
+    name="find_similar_cases",
+    description=(
+        "Find incidents whose descriptions are most similar to a free-text description or to an "
+        "existing case (by incidentId). Returns the top matches with similarity scores."
     ),
 )
 
@@ -423,14 +431,18 @@ _filter_live_feed_tool = FunctionTool.from_defaults(
 SYSTEM_PROMPT = (
     "You are Legal Copilot, assisting personal injury lawyers with a real-time "
     "dashboard of police reports.\n"
-    "Shared state schema (DashboardState):\n"
-    "- cases: Array of CaseRecord objects sourced from Google Sheets.\n"
-    "- queuedCases: Array of CaseRecord objects waiting to appear in the live feed.\n"
-    "- activeCaseId: incidentId of the case currently opened by the lawyer.\n"
-    "- feedFilter: Criteria constraining which cases appear in the live feed (summary, search text, injury/property toggles, etc.).\n"
+    "Each message includes a condensed view of the dashboard state (DashboardState):\n"
+    "- caseCounts: Number of loaded cases, queued cases and cases matching the feed filter.\n"
+    "- relevantCases: The cases most relevant to the message, with key fields only ("
+    + ", ".join(CASE_SUMMARY_FIELDS)
+    + ", shortened incidentDescription). Other cases exist but are not listed; call\n"
+    "  `get_case_details` with incident IDs to read complete records.\n"
+    "- activeCaseId / activeCase: The case currently opened by the lawyer.\n"
+    "- feedFilter: Criteria constraining which cases appear in the live feed (summary, search text, injury/property toggles, etc.);\n"
+    "  with sort \"relevance\", rankedIncidentIds lists the best searchText matches first.\n"
     "- profile: Lawyer profile with triagePreferences (categoriesOfInterest, "
     "requireInjury, includePropertyDamage, citiesOfInterest).\n"
-    "- notifications: Alerts previously raised for new incidents.\n"
+    "- recentNotifications: The latest alerts raised for new incidents.\n"
     "- liveFeed: Controls the simulated real-time stream (enabled, nextCaseIndex, intervalMs).\n"
     "- sheet: Metadata about the connected Google Sheet.\n"
     "- metrics: Summary statistics derived from the current cases.\n"
@@ -447,7 +459,11 @@ SYSTEM_PROMPT = (
     "   appropriate filter arguments (summary, categories, jurisdictions, injury/property toggles,\n"
     "   etc.). The UI reads feedFilter to determine which cases to display. Example payload:\n"
     "   {\"intent\": \"apply\", \"categories\": [\"Bicycle vs Vehicle\"], \"jurisdictions\": [\"SF\"]}.\n"
-    "6. Provide concise, actionable responses optimized for legal review workflows.\n"
+    "   For broad text searches pass sort: \"relevance\" so feedFilter.rankedIncidentIds lists the\n"
+    "   best matches first, and work from those instead of every match.\n"
+    "6. To find incidents like a given case or description (e.g. \"cases like this rear-end collision\"),\n"
+    "   call `find_similar_cases` with text or an incidentId.\n"
+    "7. Provide concise, actionable responses optimized for legal review workflows.\n"
 )
 
 
@@ -455,14 +471,41 @@ SYSTEM_PROMPT = (
 # Router configuration
 # ---------------------------------------------------------------------------- #
 
-_backend_tools: List[Any] = _load_composio_tools()
-_backend_tools.append(_sheet_list_tool)
-_backend_tools.append(_filter_live_feed_tool)
-print(f"Backend tools loaded: {len(_backend_tools)} tools")
+# Composio tools need network calls, so they are added by load_backend_tools()
+# once the server is up rather than when this module is imported.
+_backend_tools: List[Any] = [
+    _sheet_list_tool,
+    _filter_live_feed_tool,
+    _case_details_tool,
+    _similar_cases_tool,
+]
 
-agentic_chat_router = get_ag_ui_workflow_router(
-    llm=OpenAI(model="gpt-4.1"),
-    backend_tools=_backend_tools,
-    system_prompt=SYSTEM_PROMPT,
-    initial_state=INITIAL_STATE,
-)
+_llm: Optional[OpenAI] = None
+
+
+def load_backend_tools() -> int:
+    """Prepend the configured Composio tools to the backend tools; returns the tool count."""
+    _backend_tools[:0] = _load_composio_tools()
+    print(f"Backend tools loaded: {len(_backend_tools)} tools")
+    return len(_backend_tools)
+
+
+def _get_llm() -> OpenAI:
+    global _llm
+    if _llm is None:
+        # Usage on the last streamed chunk gives the real prompt size per call.
+        _llm = OpenAI(model="gpt-4.1", additional_kwargs={"stream_options": {"include_usage": True}})
+    return _llm
+
+
+async def _workflow_factory() -> DashboardChatWorkflow:
+    return DashboardChatWorkflow(
+        llm=_get_llm(),
+        backend_tools=_backend_tools,
+        system_prompt=SYSTEM_PROMPT,
+        initial_state=INITIAL_STATE,
+        timeout=120,
+    )
+
+
+agentic_chat_router = get_ag_ui_workflow_router(workflow_factory=_workflow_factory)
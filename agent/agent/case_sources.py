@@ -0,0 +1,173 @@
+"""Local case sources that feed the same import pipeline as Google Sheets."""
+
+from __future__ import annotations
+
+import csv
+import json
+import os
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+# Sheet ids starting with this prefix name a file under CASE_SOURCE_DIR
+# instead of a Google spreadsheet, e.g. "file:claude_police_reports.csv".
+LOCAL_SOURCE_PREFIX = "file:"
+
+CASE_SOURCE_DIR = Path(
+    os.getenv("CASE_SOURCE_DIR", str(Path(__file__).resolve().parents[2] / "data"))
+)
+
+CSV_SUFFIXES = (".csv",)
+NDJSON_SUFFIXES = (".ndjson", ".jsonl")
+
+# Alternative header names (after normalize_header) and the expected column they stand for.
+# Headers whose values are coded differently (injury_severity, driver_at_fault)
+# keep their own name and are recoded by row_to_case.
+HEADER_ALIASES: Dict[str, str] = {
+    "id": "incident_id",
+    "case_id": "incident_id",
+    "report_id": "incident_id",
+    "name": "full_name",
+    "full_legal_name": "full_name",
+    "home_address_blocklevel": "home_address",
+    "address": "home_address",
+    "phone": "phone_number",
+    "date": "incident_date",
+    "time": "incident_time",
+    "incident_location": "location",
+    "category": "incident_category",
+    "injury": "injury_reported",
+    "injured": "injury_reported",
+    "damage": "property_damage",
+    "fault": "fault_determination",
+    "description": "incident_description",
+    "narrative": "incident_description",
+}
+
+
+class CaseSourceError(ValueError):
+    """Raised for a ``file:`` sheet id that does not name a readable case source."""
+
+
+class CaseSourceNotFoundError(CaseSourceError):
+    """Raised for a ``file:`` sheet id whose file does not exist."""
+
+
+def normalize_header(value: str) -> str:
+    return str(value).strip().lower().replace(" ", "_")
+
+
+def canonical_headers(cells: List[Any]) -> List[str]:
+    """Normalize a header row and map known aliases onto the expected column names."""
+    headers = []
+    for cell in cells:
+        header = normalize_header(cell)
+        headers.append(HEADER_ALIASES.get(header, header))
+    return headers
+
+
+def _cell(value: Any) -> str:
+    if value is None:
+        return ""
+    if isinstance(value, (dict, list)):
+        return json.dumps(value)
+    return str(value)
+
+
+class LocalFileSource:
+    """A CSV or NDJSON file read as a single-tab sheet.
+
+    Rows are streamed with the ``csv`` module (or line by line for NDJSON),
+    so ``iter_pages`` never holds more than one page of raw rows. NDJSON lines
+    may be objects, whose keys in the first line become the header row, or
+    arrays, in which case the first line is the header row.
+    """
+
+    def __init__(self, path: Path, source_id: str) -> None:
+        self.path = path
+        self.source_id = source_id
+        self.sheet_name = path.stem
+
+    def sheet_names(self) -> List[str]:
+        return [self.sheet_name]
+
+    def metadata(self) -> Dict[str, Any]:
+        return {
+            "spreadsheet_id": self.source_id,
+            "sheet_name": self.sheet_name,
+            "title": self.path.name,
+            "available_sheets": self.sheet_names(),
+        }
+
+    def accepts(self, sheet_name: Optional[str]) -> bool:
+        return not sheet_name or sheet_name == self.sheet_name
+
+    def iter_rows(self) -> Iterator[List[str]]:
+        """Yield the header row followed by every data row."""
+        if self.path.suffix.lower() in NDJSON_SUFFIXES:
+            yield from self._iter_ndjson_rows()
+            return
+        with self.path.open(newline="", encoding="utf-8-sig") as handle:
+            yield from csv.reader(handle)
+
+    def _iter_ndjson_rows(self) -> Iterator[List[str]]:
+        keys: Optional[List[str]] = None
+        with self.path.open(encoding="utf-8-sig") as handle:
+            for line in handle:
+                line = line.strip()
+                if not line:
+                    continue
+                record = json.loads(line)
+                if isinstance(record, dict):
+                    if keys is None:
+                        keys = list(record)
+                        yield keys
+                    yield [_cell(record.get(key)) for key in keys]
+                else:
+                    yield [_cell(value) for value in record]
+
+    def read(self) -> Dict[str, Any]:
+        """The whole file in the shape returned by ``get_sheet_data``."""
+        return {**self.metadata(), "rows": list(self.iter_rows())}
+
+    def open_pages(self, page_size: int) -> Tuple[List[str], Iterator[List[List[str]]]]:
+        """The header row and a generator of ``page_size``-row windows of data rows."""
+        rows = self.iter_rows()
+        header = next(rows, [])
+        page_size = max(1, page_size)
+
+        def pages() -> Iterator[List[List[str]]]:
+            page: List[List[str]] = []
+            for row in rows:
+                page.append(row)
+                if len(page) >= page_size:
+                    yield page
+                    page = []
+            if page:
+                yield page
+
+        return header, pages()
+
+
+def resolve_case_source(sheet_id: str) -> Optional[LocalFileSource]:
+    """Return the local source named by a ``file:`` sheet id, or None for Google Sheets ids.
+
+    Only readable CSV/NDJSON files inside CASE_SOURCE_DIR can be named; any
+    other ``file:`` id raises CaseSourceError (CaseSourceNotFoundError when the
+    file does not exist) rather than being passed on as a spreadsheet id.
+    """
+    if not sheet_id or not sheet_id.startswith(LOCAL_SOURCE_PREFIX):
+        return None
+    relative = sheet_id[len(LOCAL_SOURCE_PREFIX):].strip()
+    if not relative:
+        raise CaseSourceError("Case source id names no file.")
+    root = CASE_SOURCE_DIR.resolve()
+    path = (root / relative).resolve()
+    if root not in path.parents:
+        print(f"Rejected case source outside {root}: {relative}")
+        raise CaseSourceError(f"Case source '{relative}' is outside the case source directory.")
+    if path.suffix.lower() not in CSV_SUFFIXES + NDJSON_SUFFIXES:
+        raise CaseSourceError(f"Case source '{relative}' is not a CSV or NDJSON file.")
+    if not path.is_file():
+        print(f"Case source not found: {relative}")
+        raise CaseSourceNotFoundError(f"Case source '{relative}' was not found.")
+    return LocalFileSource(path, sheet_id)
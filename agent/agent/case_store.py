@@ -0,0 +1,285 @@
+"""Column-oriented storage for parsed cases."""
+
+from __future__ import annotations
+
+from array import array
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple, Union
+
+# Field order of a CaseRecord as produced by ``row_to_case``.
+CASE_FIELDS: Tuple[str, ...] = (
+    "incidentId",
+    "fullName",
+    "sex",
+    "homeAddress",
+    "phoneNumber",
+    "incidentDate",
+    "incidentTime",
+    "location",
+    "incidentCategory",
+    "resolution",
+    "injuryReported",
+    "propertyDamage",
+    "faultDetermination",
+    "incidentDescription",
+    "jurisdiction",
+)
+
+# Low-cardinality fields stored as integer codes into a shared value table.
+DICTIONARY_FIELDS: Tuple[str, ...] = (
+    "sex",
+    "incidentDate",
+    "incidentTime",
+    "incidentCategory",
+    "resolution",
+    "faultDetermination",
+    "jurisdiction",
+)
+
+# Boolean fields packed one bit per case.
+BOOLEAN_FIELDS: Tuple[str, ...] = ("injuryReported", "propertyDamage")
+
+TEXT_FIELDS: Tuple[str, ...] = tuple(
+    field for field in CASE_FIELDS if field not in DICTIONARY_FIELDS and field not in BOOLEAN_FIELDS
+)
+
+
+class CaseRecord(dict):
+    """A parsed case. Serializes as a plain dict but can carry cached
+    derived values (such as normalized triage fields) as attributes."""
+
+    __slots__ = ("triage_fields",)
+
+
+class ValueDictionary:
+    """Append-only value table shared by stores built from the same sheet."""
+
+    __slots__ = ("values", "codes")
+
+    def __init__(self) -> None:
+        self.values: List[Any] = []
+        self.codes: Dict[Any, int] = {}
+
+    def encode(self, value: Any) -> int:
+        code = self.codes.get(value)
+        if code is None:
+            code = len(self.values)
+            self.codes[value] = code
+            self.values.append(value)
+        return code
+
+
+def bits_from_positions(positions: Iterable[int], size: int) -> int:
+    """Pack case positions into an int bitset (bit i set <=> case i matches)."""
+    packed = bytearray((size + 7) // 8)
+    for position in positions:
+        packed[position >> 3] |= 1 << (position & 7)
+    return int.from_bytes(bytes(packed), "little")
+
+
+def positions_from_bits(bits: int) -> Iterator[int]:
+    binary = format(bits, "b")[::-1] if bits else ""
+    position = binary.find("1")
+    while position != -1:
+        yield position
+        position = binary.find("1", position + 1)
+
+
+class _BitColumn:
+    __slots__ = ("bits", "size")
+
+    def __init__(self) -> None:
+        self.bits = bytearray()
+        self.size = 0
+
+    def append(self, value: bool) -> None:
+        if self.size % 8 == 0:
+            self.bits.append(0)
+        if value:
+            self.bits[self.size >> 3] |= 1 << (self.size & 7)
+        self.size += 1
+
+    def __getitem__(self, position: int) -> bool:
+        return bool(self.bits[position >> 3] & (1 << (position & 7)))
+
+    def as_int(self) -> int:
+        """The column as an int bitset (bit i set <=> case i is true)."""
+        return int.from_bytes(bytes(self.bits), "little")
+
+    def count(self) -> int:
+        return bin(self.as_int()).count("1")
+
+
+class CaseStore:
+    """Cases held column-wise instead of as a list of 15-key dicts.
+
+    Low-cardinality fields are dictionary-encoded, booleans are bit-packed and
+    free text is kept as one list per field. The store behaves like a read-only
+    sequence of case dicts: indexing, slicing and iteration materialize
+    ``CaseRecord`` dicts on demand, so full dicts only exist while a payload is
+    being serialized. Aggregates such as ``value_counts`` and
+    ``count_true`` work on the encoded columns directly.
+    """
+
+    def __init__(self, dictionaries: Optional[Dict[str, ValueDictionary]] = None) -> None:
+        self.dictionaries: Dict[str, ValueDictionary] = dictionaries or {
+            field: ValueDictionary() for field in DICTIONARY_FIELDS
+        }
+        self._codes: Dict[str, array] = {field: array("I") for field in DICTIONARY_FIELDS}
+        self._booleans: Dict[str, _BitColumn] = {field: _BitColumn() for field in BOOLEAN_FIELDS}
+        self._text: Dict[str, List[str]] = {field: [] for field in TEXT_FIELDS}
+        self._size = 0
+        self._lowered: Dict[str, Tuple[int, List[str]]] = {}
+
+    @classmethod
+    def from_cases(
+        cls,
+        cases: Iterable[Dict[str, Any]],
+        dictionaries: Optional[Dict[str, ValueDictionary]] = None,
+    ) -> "CaseStore":
+        store = cls(dictionaries)
+        store.extend(cases)
+        return store
+
+    @classmethod
+    def from_columns(cls, columns: Dict[str, Sequence[Any]]) -> "CaseStore":
+        """Rebuild a store from ``to_columns`` output without going through case dicts."""
+        store = cls()
+        size = len(columns.get("incidentId", ()))
+        for field in DICTIONARY_FIELDS:
+            encode = store.dictionaries[field].encode
+            store._codes[field] = array("I", (encode(value) for value in columns.get(field, [""] * size)))
+        for field in BOOLEAN_FIELDS:
+            column = store._booleans[field]
+            for value in columns.get(field, [False] * size):
+                column.append(bool(value))
+        for field in TEXT_FIELDS:
+            store._text[field] = list(columns.get(field, [""] * size))
+        store._size = size
+        return store
+
+    def to_columns(self) -> Dict[str, List[Any]]:
+        """Plain per-field value lists, e.g. for persisting the store."""
+        return {field: list(self.column(field)) for field in CASE_FIELDS}
+
+    def append(self, case: Dict[str, Any]) -> None:
+        for field in DICTIONARY_FIELDS:
+            self._codes[field].append(self.dictionaries[field].encode(case.get(field, "")))
+        for field in BOOLEAN_FIELDS:
+            self._booleans[field].append(bool(case.get(field)))
+        for field in TEXT_FIELDS:
+            self._text[field].append(case.get(field, ""))
+        self._size += 1
+
+    def extend(self, cases: Iterable[Dict[str, Any]]) -> None:
+        for case in cases:
+            self.append(case)
+
+    def append_from(self, other: "CaseStore", position: int) -> None:
+        """Copy one case from a store sharing this store's dictionaries, without decoding it."""
+        for field in DICTIONARY_FIELDS:
+            self._codes[field].append(other._codes[field][position])
+        for field in BOOLEAN_FIELDS:
+            self._booleans[field].append(other._booleans[field][position])
+        for field in TEXT_FIELDS:
+            self._text[field].append(other._text[field][position])
+        self._size += 1
+
+    def __len__(self) -> int:
+        return self._size
+
+    def get(self, position: int) -> Dict[str, Any]:
+        """Materialize the case at ``position`` as a CaseRecord dict."""
+        record = CaseRecord()
+        for field in CASE_FIELDS:
+            record[field] = self.value(field, position)
+        return record
+
+    def value(self, field: str, position: int) -> Any:
+        if field in self._codes:
+            return self.dictionaries[field].values[self._codes[field][position]]
+        if field in self._booleans:
+            return self._booleans[field][position]
+        return self._text[field][position]
+
+    def __getitem__(self, key: Union[int, slice]) -> Any:
+        if isinstance(key, slice):
+            return [self.get(position) for position in range(*key.indices(self._size))]
+        if key < 0:
+            key += self._size
+        if not 0 <= key < self._size:
+            raise IndexError("CaseStore index out of range")
+        return self.get(key)
+
+    def __iter__(self) -> Iterator[Dict[str, Any]]:
+        for position in range(self._size):
+            yield self.get(position)
+
+    def to_dicts(self, start: int = 0, stop: Optional[int] = None) -> List[Dict[str, Any]]:
+        return self[start:stop]
+
+    def column(self, field: str) -> Sequence[Any]:
+        """All values of one field, in case order."""
+        if field in self._codes:
+            values = self.dictionaries[field].values
+            return [values[code] for code in self._codes[field]]
+        if field in self._booleans:
+            column = self._booleans[field]
+            return [column[position] for position in range(self._size)]
+        return self._text[field]
+
+    def lowered_column(self, field: str) -> List[str]:
+        """Lowercased values of a text or dictionary field, computed once per store size."""
+        cached = self._lowered.get(field)
+        if cached is not None and cached[0] == self._size:
+            return cached[1]
+        if field in self._codes:
+            lowered_values = [(value or "").lower() for value in self.dictionaries[field].values]
+            column = [lowered_values[code] for code in self._codes[field]]
+        else:
+            column = [(value or "").lower() for value in self._text[field]]
+        self._lowered[field] = (self._size, column)
+        return column
+
+    def codes(self, field: str) -> array:
+        return self._codes[field]
+
+    def mask(self, field: str) -> int:
+        """Int bitset of the cases where a boolean field is true."""
+        return self._booleans[field].as_int()
+
+    def flags(self, field: str) -> List[bool]:
+        """A boolean field as a list, unpacked from its bitset in one pass."""
+        if not self._size:
+            return []
+        return [bit == "1" for bit in format(self.mask(field), f"0{self._size}b")[::-1]]
+
+    def code_mask(self, field: str, predicate: Callable[[Any], bool]) -> int:
+        """Int bitset of the cases whose ``field`` value satisfies ``predicate``.
+
+        ``predicate`` runs once per distinct value; cases are matched on their codes.
+        """
+        allowed = [bool(predicate(value)) for value in self.dictionaries[field].values]
+        if not any(allowed):
+            return 0
+        if all(allowed):
+            return (1 << self._size) - 1
+        return bits_from_positions(
+            (position for position, code in enumerate(self._codes[field]) if allowed[code]), self._size
+        )
+
+    def count_true(self, field: str) -> int:
+        return self._booleans[field].count()
+
+    def value_counts(self, field: str) -> Dict[Any, int]:
+        counts = [0] * len(self.dictionaries[field].values)
+        for code in self._codes[field]:
+            counts[code] += 1
+        values = self.dictionaries[field].values
+        return {values[code]: count for code, count in enumerate(counts) if count}
+
+
+def case_column(cases: Union[CaseStore, Sequence[Dict[str, Any]]], field: str) -> Sequence[Any]:
+    """Values of ``field`` for a CaseStore or a list of case dicts."""
+    if isinstance(cases, CaseStore):
+        return cases.column(field)
+    return [case.get(field) for case in cases]
@@ -0,0 +1,575 @@
+"""Live feed filter state and the search index that evaluates it."""
+
+from __future__ import annotations
+
+import base64
+import hashlib
+import heapq
+import json
+import math
+import threading
+from bisect import bisect_left, bisect_right
+from collections import OrderedDict
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple, Union
+
+from .case_store import CASE_FIELDS, CaseStore, bits_from_positions, case_column, positions_from_bits
+
+DEFAULT_FEED_FILTER: Dict[str, Any] = {
+    "summary": "",
+    "searchText": "",
+    "categories": [],
+    "jurisdictions": [],
+    "injury": None,
+    "propertyDamage": None,
+    "incidentIds": [],
+    # "relevance" orders the feed by rankedIncidentIds, best BM25 match first.
+    "sort": None,
+    "rankedIncidentIds": [],
+}
+
+# Filter keys that only affect how matches are presented, not which cases match.
+_PRESENTATION_FILTER_KEYS = frozenset({"summary", "sort", "rankedIncidentIds"})
+
+
+SEARCHABLE_FIELDS: List[str] = [
+    "incidentId",
+    "incidentCategory",
+    "incidentDescription",
+    "location",
+    "fullName",
+    "resolution",
+    "faultDetermination",
+]
+
+
+def _trimmed_unique(values: Optional[List[str]]) -> List[str]:
+    if not values:
+        return []
+
+    seen: set[str] = set()
+    result: List[str] = []
+    for value in values:
+        if not isinstance(value, str):
+            continue
+        trimmed = value.strip()
+        if not trimmed:
+            continue
+        key = trimmed.lower()
+        if key in seen:
+            continue
+        seen.add(key)
+        result.append(trimmed)
+    return result
+
+
+def _normalize_text(value: Any) -> str:
+    if isinstance(value, str):
+        return value.strip().lower()
+    return ""
+
+
+def _map_injury_preference(value: Optional[str]) -> Optional[bool]:
+    normalized = _normalize_text(value)
+    if normalized in {"requires_injury", "require_injury", "injury_required", "only_injury"}:
+        return True
+    if normalized in {"exclude_injury", "no_injury", "without_injury"}:
+        return False
+    return None
+
+
+def _map_property_preference(value: Optional[str]) -> Optional[bool]:
+    normalized = _normalize_text(value)
+    if normalized in {"requires_damage", "require_damage", "damage_required"}:
+        return True
+    if normalized in {"exclude_damage", "no_damage", "without_damage"}:
+        return False
+    return None
+
+
+def _map_sort_preference(value: Optional[str]) -> Optional[str]:
+    return "relevance" if _normalize_text(value) in {"relevance", "relevant", "ranked", "best_match"} else None
+
+
+# ---------------------------------------------------------------------------- #
+# Case search index
+# ---------------------------------------------------------------------------- #
+
+# Number of case sets whose indexes are kept around for reuse.
+CASE_INDEX_CACHE_SIZE = 8
+# Sorted match lists kept per index, one per (filter, sort) combination.
+QUERY_ORDER_CACHE_SIZE = 16
+
+SORTABLE_FIELDS = ("incidentDate", "incidentTime")
+
+# BM25 term-frequency saturation and document-length normalization.
+BM25_K1 = 1.2
+BM25_B = 0.75
+# Cases kept by a relevance-ranked search.
+RANKED_RESULTS_LIMIT = 50
+
+
+class CaseSearchIndex:
+    """Inverted index and bitsets over one immutable set of cases.
+
+    Text search keeps the substring semantics of the original scan: a query
+    token has no whitespace, so it occurs in a case's joined
+    ``SEARCHABLE_FIELDS`` text exactly when it occurs inside one of that case's
+    whitespace-delimited terms. Tokens are therefore resolved against the
+    (much smaller) vocabulary and the posting lists of every matching term.
+    """
+
+    def __init__(self, cases: Union[CaseStore, List[Dict[str, Any]]], version: str = "") -> None:
+        self.version = version
+        # Kept so an identity-keyed entry can check it still indexes this object.
+        self.source = cases
+        self.cases = cases if isinstance(cases, CaseStore) else list(cases)
+        size = len(self.cases)
+        self.all_bits = (1 << size) - 1
+
+        postings: Dict[str, List[int]] = {}
+        frequencies: Dict[str, List[int]] = {}
+        lengths: List[int] = []
+        searchable = [case_column(self.cases, field) for field in SEARCHABLE_FIELDS]
+        for position, values in enumerate(zip(*searchable)):
+            length = 0
+            for value in values:
+                for term in _normalize_text(value).split():
+                    length += 1
+                    term_postings = postings.setdefault(term, [])
+                    if not term_postings or term_postings[-1] != position:
+                        term_postings.append(position)
+                        frequencies.setdefault(term, []).append(1)
+                    else:
+                        frequencies[term][-1] += 1
+            lengths.append(length)
+
+        self.size = size
+        self.postings = postings
+        self.frequencies = frequencies
+        self.lengths = lengths
+        self.average_length = (sum(lengths) / size) if size else 0.0
+        self.category_bits = self._value_bits("incidentCategory")
+        self.jurisdiction_bits = self._value_bits("jurisdiction")
+        self.incident_id_bits = self._value_bits("incidentId")
+        self.injury_bits = self._flag_bits("injuryReported")
+        self.property_damage_bits = self._flag_bits("propertyDamage")
+        self._token_bits: Dict[str, int] = {}
+        self._token_frequencies: Dict[str, Dict[int, int]] = {}
+        self._orders: "OrderedDict[Tuple[str, Tuple[str, ...]], List[Tuple[Any, ...]]]" = OrderedDict()
+        self._orders_lock = threading.Lock()
+
+    def _value_bits(self, field: str) -> Dict[str, int]:
+        positions: Dict[str, List[int]] = {}
+        for position, value in enumerate(case_column(self.cases, field)):
+            positions.setdefault(_normalize_text(value), []).append(position)
+        return {value: bits_from_positions(found, self.size) for value, found in positions.items()}
+
+    def _flag_bits(self, field: str) -> int:
+        if isinstance(self.cases, CaseStore):
+            return self.cases.mask(field)
+        return bits_from_positions(
+            (position for position, value in enumerate(case_column(self.cases, field)) if value),
+            self.size,
+        )
+
+    def _matching_terms(self, token: str) -> List[str]:
+        return [term for term in self.postings if token in term]
+
+    def token_frequencies(self, token: str) -> Dict[int, int]:
+        """Occurrences of ``token`` per case position, summed over every term containing it."""
+        cached = self._token_frequencies.get(token)
+        if cached is not None:
+            return cached
+        counts: Dict[int, int] = {}
+        for term in self._matching_terms(token):
+            for position, count in zip(self.postings[term], self.frequencies[term]):
+                counts[position] = counts.get(position, 0) + count
+        self._token_frequencies[token] = counts
+        return counts
+
+    def token_bits(self, token: str) -> int:
+        cached = self._token_bits.get(token)
+        if cached is not None:
+            return cached
+        exact = self.postings.get(token)
+        matching_terms = self._matching_terms(token)
+        if exact is not None and len(matching_terms) == 1:
+            bits = bits_from_positions(exact, self.size)
+        else:
+            bits = bits_from_positions(
+                (position for term in matching_terms for position in self.postings[term]),
+                self.size,
+            )
+        self._token_bits[token] = bits
+        return bits
+
+    def _union(self, lookup: Dict[str, int], values: Iterable[Any]) -> Optional[int]:
+        wanted = {_normalize_text(value) for value in values if isinstance(value, str)}
+        if not wanted:
+            return None
+        bits = 0
+        for value in wanted:
+            bits |= lookup.get(value, 0)
+        return bits
+
+    def match_bits(self, feed_filter: Dict[str, Any]) -> int:
+        bits = self.all_bits
+
+        for lookup, key in (
+            (self.incident_id_bits, "incidentIds"),
+            (self.category_bits, "categories"),
+            (self.jurisdiction_bits, "jurisdictions"),
+        ):
+            selected = self._union(lookup, feed_filter.get(key, []) or [])
+            if selected is not None:
+                bits &= selected
+
+        injury_preference = feed_filter.get("injury")
+        if injury_preference is not None:
+            bits &= self.injury_bits if bool(injury_preference) else ~self.injury_bits
+
+        property_preference = feed_filter.get("propertyDamage")
+        if property_preference is not None:
+            bits &= self.property_damage_bits if bool(property_preference) else ~self.property_damage_bits
+
+        for token in _normalize_text(feed_filter.get("searchText", "")).split():
+            if not bits:
+                break
+            bits &= self.token_bits(token)
+
+        return bits & self.all_bits
+
+    def matching_positions(self, feed_filter: Dict[str, Any]) -> List[int]:
+        return list(positions_from_bits(self.match_bits(feed_filter)))
+
+    def filter(self, feed_filter: Dict[str, Any]) -> List[Dict[str, Any]]:
+        return [self.cases[position] for position in self.matching_positions(feed_filter)]
+
+    def ranked_matches(
+        self, feed_filter: Dict[str, Any], limit: int = RANKED_RESULTS_LIMIT, *, any_token: bool = False
+    ) -> Tuple[int, List[Tuple[int, float]]]:
+        """Match count and the ``limit`` best ``(position, BM25 score)`` pairs, best first.
+
+        Matching is unchanged; the ``searchText`` tokens only score the
+        matches. ``heapq.nlargest`` keeps ``limit`` candidates instead of
+        sorting every match. Ties, and filters without search text, keep sheet
+        order. With ``any_token`` a case needs only one of the tokens to match.
+        """
+        if any_token:
+            bits = 0
+            for token in _normalize_text(feed_filter.get("searchText", "")).split():
+                bits |= self.token_bits(token)
+            positions = list(positions_from_bits(bits & self.match_bits({**feed_filter, "searchText": ""})))
+        else:
+            positions = self.matching_positions(feed_filter)
+        weighted: List[Tuple[float, Dict[int, int]]] = []
+        for token in dict.fromkeys(_normalize_text(feed_filter.get("searchText", "")).split()):
+            frequencies = self.token_frequencies(token)
+            if frequencies:
+                matches = len(frequencies)
+                weighted.append((math.log(1.0 + (self.size - matches + 0.5) / (matches + 0.5)), frequencies))
+
+        def score(position: int) -> float:
+            if not weighted:
+                return 0.0
+            saturation = BM25_K1 * (1.0 - BM25_B + BM25_B * self.lengths[position] / (self.average_length or 1.0))
+            total = 0.0
+            for idf, frequencies in weighted:
+                frequency = frequencies.get(position)
+                if frequency:
+                    total += idf * frequency * (BM25_K1 + 1.0) / (frequency + saturation)
+            return total
+
+        best = heapq.nlargest(max(0, limit), ((score(position), -position) for position in positions))
+        return len(positions), [(-negated, round(value, 4)) for value, negated in best]
+
+    def value(self, field: str, position: int) -> Any:
+        if isinstance(self.cases, CaseStore):
+            return self.cases.value(field, position)
+        return self.cases[position].get(field)
+
+    def sorted_matches(self, feed_filter: Dict[str, Any], sort_fields: Tuple[str, ...] = ()) -> List[Tuple[Any, ...]]:
+        """Sort keys of the matching cases in ascending order, cached per filter and sort.
+
+        Each key is ``(*sort values, incidentId, position)`` so keys are unique
+        and a page boundary can be found with a binary search; without sort
+        fields the key is just ``(position,)``, i.e. sheet order.
+        """
+        cache_key = (_filter_key(feed_filter), sort_fields)
+        with self._orders_lock:
+            keys = self._orders.get(cache_key)
+            if keys is not None:
+                self._orders.move_to_end(cache_key)
+                return keys
+
+        positions = positions_from_bits(self.match_bits(feed_filter))
+        if sort_fields:
+            keys = sorted(
+                (
+                    *(self.value(field, position) or "" for field in sort_fields),
+                    str(self.value("incidentId", position) or ""),
+                    position,
+                )
+                for position in positions
+            )
+        else:
+            keys = [(position,) for position in positions]
+
+        with self._orders_lock:
+            self._orders[cache_key] = keys
+            while len(self._orders) > QUERY_ORDER_CACHE_SIZE:
+                self._orders.popitem(last=False)
+        return keys
+
+
+def _incident_id_at(cases: Union[CaseStore, List[Dict[str, Any]]], position: int) -> Any:
+    if isinstance(cases, CaseStore):
+        return cases.value("incidentId", position)
+    case = cases[position]
+    return case.get("incidentId") if isinstance(case, dict) else None
+
+
+def case_set_version(
+    cases: Union[CaseStore, List[Dict[str, Any]]],
+    sheet: Optional[Dict[str, Any]] = None,
+    *,
+    scope: str = "cases",
+) -> str:
+    """A key for a case set held in dashboard state, computed without reading every case.
+
+    The dashboard's ``cases`` and ``queuedCases`` are slices of one sync: they
+    are replaced wholesale by the next sync (a new ``syncVersion`` in
+    ``sheet``) and otherwise only change as the live feed moves queued cases
+    into the feed, which changes their sizes and end ids. ``scope`` tells the
+    two lists apart. Without a sync version the set is keyed on the list object.
+    """
+    size = len(cases)
+    ends = f"{_incident_id_at(cases, 0)}\x1f{_incident_id_at(cases, size - 1)}" if size else ""
+    sync_version = sheet.get("syncVersion") if sheet else None
+    if sync_version:
+        return f"state:{sync_version}:{scope}:{size}:{ends}"
+    return f"object:{id(cases)}:{size}:{ends}"
+
+
+_case_indexes: "OrderedDict[str, CaseSearchIndex]" = OrderedDict()
+_case_indexes_lock = threading.Lock()
+
+
+def get_case_index(
+    cases: Union[CaseStore, List[Dict[str, Any]]],
+    sheet: Optional[Dict[str, Any]] = None,
+    *,
+    version: Optional[str] = None,
+    scope: str = "cases",
+) -> CaseSearchIndex:
+    """Return the index for this case set, building it on first use.
+
+    Callers that hold the set's version (such as a sync snapshot's
+    ``version``) pass it; otherwise it comes from ``case_set_version``.
+    """
+    version = version or case_set_version(cases, sheet, scope=scope)
+    with _case_indexes_lock:
+        index = _case_indexes.get(version)
+        if index is not None and (not version.startswith("object:") or index.source is cases):
+            _case_indexes.move_to_end(version)
+            return index
+
+    index = CaseSearchIndex(cases, version)
+    with _case_indexes_lock:
+        _case_indexes[version] = index
+        while len(_case_indexes) > CASE_INDEX_CACHE_SIZE:
+            _case_indexes.popitem(last=False)
+    return index
+
+
+def _apply_feed_filter_to_cases(
+    cases: Union[CaseStore, List[Dict[str, Any]]],
+    feed_filter: Dict[str, Any],
+    sheet: Optional[Dict[str, Any]] = None,
+    *,
+    version: Optional[str] = None,
+) -> List[Dict[str, Any]]:
+    if not cases:
+        return []
+    return get_case_index(cases, sheet, version=version).filter(feed_filter)
+
+
+def search_cases(
+    cases: Union[CaseStore, List[Dict[str, Any]]],
+    feed_filter: Dict[str, Any],
+    *,
+    sheet: Optional[Dict[str, Any]] = None,
+    version: Optional[str] = None,
+    limit: int = RANKED_RESULTS_LIMIT,
+) -> Dict[str, Any]:
+    """The ``limit`` cases matching ``feed_filter`` that best match its ``searchText``, ranked by BM25."""
+    if not cases:
+        return {"matches": [], "totalMatches": 0}
+    index = get_case_index(cases, sheet, version=version)
+    total, ranked = index.ranked_matches(feed_filter, limit)
+    return {
+        "matches": [
+            {"incidentId": index.value("incidentId", position), "score": score, "case": index.cases[position]}
+            for position, score in ranked
+        ],
+        "totalMatches": total,
+    }
+
+
+# ---------------------------------------------------------------------------- #
+# Paged case queries
+# ---------------------------------------------------------------------------- #
+
+
+class InvalidCursorError(ValueError):
+    """Raised when a pagination cursor is malformed or belongs to another query."""
+
+
+def _filter_key(feed_filter: Dict[str, Any]) -> str:
+    """Canonical form of the parts of a feed filter that affect matching."""
+    return json.dumps(
+        {
+            key: feed_filter.get(key, default)
+            for key, default in DEFAULT_FEED_FILTER.items()
+            if key not in _PRESENTATION_FILTER_KEYS
+        },
+        sort_keys=True,
+        default=str,
+    )
+
+
+def _encode_cursor(payload: Dict[str, Any]) -> str:
+    raw = json.dumps(payload, separators=(",", ":")).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def _decode_cursor(cursor: str) -> Dict[str, Any]:
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+    except Exception as exc:
+        raise InvalidCursorError("Malformed cursor.") from exc
+    if not isinstance(payload, dict) or not isinstance(payload.get("k"), list):
+        raise InvalidCursorError("Malformed cursor.")
+    return payload
+
+
+def _cursor_key(payload: Dict[str, Any], sort_fields: Tuple[str, ...]) -> Tuple[Any, ...]:
+    """The decoded sort key, checked against the shape ``sorted_matches`` produces."""
+    key = payload["k"]
+    # (*sort values, incidentId, position) when sorted, else (position,).
+    expected = (str,) * (len(sort_fields) + 1) + (int,) if sort_fields else (int,)
+    if len(key) != len(expected) or not all(
+        isinstance(value, kind) and not isinstance(value, bool) for value, kind in zip(key, expected)
+    ):
+        raise InvalidCursorError("Cursor does not match this query's sort order.")
+    return tuple(key)
+
+
+def query_cases(
+    cases: Union[CaseStore, List[Dict[str, Any]]],
+    feed_filter: Dict[str, Any],
+    *,
+    sheet: Optional[Dict[str, Any]] = None,
+    version: Optional[str] = None,
+    sort_fields: Sequence[str] = (),
+    descending: bool = False,
+    fields: Optional[Sequence[str]] = None,
+    cursor: Optional[str] = None,
+    limit: int = 50,
+) -> Dict[str, Any]:
+    """One page of the cases matching ``feed_filter``, with a cursor for the next page.
+
+    Uses the same index and matching rules as the live feed filter. Cursors
+    are keyset positions (the last returned sort key), so paging stays
+    consistent while the query is unchanged. ``fields`` limits each returned
+    case to those keys (``incidentId`` is always included).
+    """
+    sort_fields = tuple(sort_fields)
+    for field in sort_fields:
+        if field not in SORTABLE_FIELDS:
+            raise ValueError(f"Cannot sort by '{field}'; choose from {', '.join(SORTABLE_FIELDS)}.")
+    if fields is not None:
+        unknown = [field for field in fields if field not in CASE_FIELDS]
+        if unknown:
+            raise ValueError(f"Unknown fields: {', '.join(unknown)}.")
+        fields = ["incidentId", *(field for field in fields if field != "incidentId")]
+
+    query_id = hashlib.blake2b(
+        json.dumps([_filter_key(feed_filter), sort_fields, descending]).encode("utf-8"), digest_size=8
+    ).hexdigest()
+
+    index = get_case_index(cases, sheet, version=version)
+    keys = index.sorted_matches(feed_filter, sort_fields)
+    limit = max(1, limit)
+
+    after: Optional[Tuple[Any, ...]] = None
+    if cursor:
+        payload = _decode_cursor(cursor)
+        if payload.get("q") != query_id:
+            raise InvalidCursorError("Cursor does not belong to this query.")
+        after = _cursor_key(payload, sort_fields)
+
+    if descending:
+        end = len(keys) if after is None else bisect_left(keys, after)
+        page = keys[max(0, end - limit):end][::-1]
+        has_more = end - limit > 0
+    else:
+        start = 0 if after is None else bisect_right(keys, after)
+        page = keys[start:start + limit]
+        has_more = start + limit < len(keys)
+
+    if fields is None:
+        page_cases = [index.cases[key[-1]] for key in page]
+    else:
+        page_cases = [{field: index.value(field, key[-1]) for field in fields} for key in page]
+
+    return {
+        "cases": page_cases,
+        "nextCursor": _encode_cursor({"q": query_id, "k": list(page[-1])}) if has_more and page else None,
+        "totalMatches": len(keys),
+    }
+
+
+def _summarize_feed_filter(filter_state: Dict[str, Any]) -> str:
+    if not filter_state:
+        return ""
+
+    summary = (filter_state.get("summary") or "").strip()
+    if summary:
+        return summary
+
+    parts: List[str] = []
+
+    categories = _trimmed_unique(filter_state.get("categories"))
+    if categories:
+        parts.append(f"Categories: {', '.join(categories)}")
+
+    jurisdictions = _trimmed_unique(filter_state.get("jurisdictions"))
+    if jurisdictions:
+        parts.append(f"Jurisdictions: {', '.join(jurisdictions)}")
+
+    injury_pref = filter_state.get("injury")
+    if injury_pref is True:
+        parts.append("Requires injury")
+    elif injury_pref is False:
+        parts.append("Exclude injury cases")
+
+    property_pref = filter_state.get("propertyDamage")
+    if property_pref is True:
+        parts.append("Requires property damage")
+    elif property_pref is False:
+        parts.append("Exclude property damage cases")
+
+    incident_ids = _trimmed_unique(filter_state.get("incidentIds"))
+    if incident_ids:
+        parts.append(f"Incident IDs: {', '.join(incident_ids)}")
+
+    search_text = (filter_state.get("searchText") or "").strip()
+    if search_text:
+        parts.append(f'Text contains "{search_text}"')
+
+    if filter_state.get("sort") == "relevance":
+        parts.append("Ranked by relevance")
+
+    return " • ".join(parts) if parts else "Custom filter"
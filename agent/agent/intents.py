@@ -0,0 +1,194 @@
+"""Deterministic parsing of common dashboard commands, so they can skip the LLM.
+
+Only commands whose every word is accounted for are recognized: a filter
+command may mention known jurisdictions, words from known incident
+categories, and injury/property-damage qualifiers, plus filler words. Anything
+else (questions, dates, unknown words, conflicting qualifiers) returns None
+and the turn goes to the LLM as usual.
+"""
+
+from __future__ import annotations
+
+import re
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+
+# (tool name, tool kwargs)
+Command = Tuple[str, Dict[str, Any]]
+
+_FILTER_VERBS = {"show", "filter", "only", "display", "narrow", "limit", "just", "give"}
+
+_FILLER_WORDS = {
+    "show", "me", "only", "just", "filter", "display", "narrow", "limit", "give",
+    "the", "a", "an", "all", "any", "of", "to", "by", "for", "in", "from", "at",
+    "and", "or", "with", "that", "which", "have", "has", "had", "involving",
+    "cases", "case", "incidents", "incident", "reports", "report", "feed", "live",
+    "down", "please", "now", "those", "ones", "where", "there", "was", "were",
+}
+
+_INJURY_WORDS = {"injury", "injuries", "injured"}
+
+_CLEAR_PATTERN = re.compile(
+    r"(?:please\s+)?(?:clear|reset|remove|drop)\s+(?:the\s+|all\s+|my\s+|any\s+)*"
+    r"(?:live\s+)?(?:feed\s+)?(?:filters?|search(?:es)?)(?:\s+please)?"
+    r"|show\s+(?:me\s+)?(?:all|every)(?:\s+the)?\s+(?:cases|incidents|reports)(?:\s+again)?"
+    r"|show\s+(?:me\s+)?everything(?:\s+again)?"
+)
+
+_LIST_SHEETS_PATTERN = re.compile(
+    r"(?:please\s+)?(?:list|show(?:\s+me)?|what\s+are)\s+(?:the\s+|all\s+(?:the\s+)?)?"
+    r"(?:available\s+)?(?:sheets|tabs|sheet\s+names|sheet\s+tabs)"
+    r"(?:\s+(?:in|for|of|on)(?:\s+(?:the|this|my))?(?:\s+(?:spreadsheet|sheet|workbook))?)?"
+    r"(?:\s+(?P<sheet_id>file:[\w.\-]+|[A-Za-z0-9_\-]{20,}))?"
+)
+
+# Qualifier phrases, matched before the remaining words are read as categories.
+_QUALIFIERS: List[Tuple[re.Pattern, str, bool]] = [
+    (re.compile(r"\b(?:without|no|non)[\s\-]+(?:an?\s+)?(?:injur(?:y|ies)|injured)\b"), "injury", False),
+    (re.compile(r"\buninjured\b"), "injury", False),
+    (re.compile(r"\b(?:with|w/|having)\s+(?:an?\s+)?(?:reported\s+)?(?:injur(?:y|ies))\b"), "injury", True),
+    (re.compile(r"\binjured\b"), "injury", True),
+    (re.compile(r"\b(?:without|no)\s+(?:any\s+)?(?:property\s+)?damage\b"), "propertyDamage", False),
+    (re.compile(r"\b(?:with\s+)?property\s+damage\b|\bwith\s+damage\b|\bdamaged\b"), "propertyDamage", True),
+]
+
+_WORD_PATTERN = re.compile(r"[a-z0-9]+(?:'[a-z0-9]+)*")
+
+
+def _normalize(text: str) -> str:
+    text = text.strip().lower()
+    text = re.sub(r"\s+", " ", text)
+    return text.rstrip(" .!")
+
+
+def _stem(word: str) -> str:
+    if len(word) > 3 and word.endswith("ies"):
+        return word[:-3] + "y"
+    if len(word) > 3 and word.endswith("s") and not word.endswith("ss"):
+        return word[:-1]
+    return word
+
+
+def _words(text: str) -> List[str]:
+    return _WORD_PATTERN.findall(text)
+
+
+def _known_values(state: Dict[str, Any], field: str) -> List[str]:
+    values: Set[str] = set()
+    for key in ("cases", "queuedCases"):
+        cases = state.get(key)
+        if not isinstance(cases, list):
+            continue
+        for case in cases:
+            if isinstance(case, dict):
+                value = case.get(field)
+                if isinstance(value, str) and value.strip():
+                    values.add(value.strip())
+    return sorted(values)
+
+
+def _match_categories(run: List[str], categories: Iterable[Tuple[str, Set[str]]]) -> List[str]:
+    wanted = {_stem(word) for word in run}
+    return [name for name, words in categories if wanted <= words]
+
+
+def _parse_filter(text: str, state: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    words = _words(text)
+    if not words or words[0] not in _FILTER_VERBS:
+        return None
+
+    flags: Dict[str, bool] = {}
+    for pattern, key, value in _QUALIFIERS:
+        for _ in pattern.finditer(text):
+            if flags.get(key, value) != value:
+                return None  # e.g. "with injuries ... without injuries"
+            flags[key] = value
+        text = pattern.sub(" ", text)
+
+    jurisdictions: List[str] = []
+    for name in sorted(_known_values(state, "jurisdiction"), key=len, reverse=True):
+        pattern = re.compile(r"\b" + re.escape(name.lower()) + r"\b")
+        if pattern.search(text):
+            jurisdictions.append(name)
+            text = pattern.sub(" ", text)
+
+    categories = [
+        (name, {_stem(word) for word in _words(name.lower())})
+        for name in _known_values(state, "incidentCategory")
+    ]
+    vocabulary = set().union(*(words for _, words in categories)) if categories else set()
+
+    selected: List[str] = []
+    run: List[str] = []
+    for word in _words(text) + [""]:
+        if word and _stem(word) in vocabulary:
+            run.append(word)
+            continue
+        while run and run[-1] in _FILLER_WORDS:
+            run.pop()
+        while run and run[0] in _FILLER_WORDS:
+            run.pop(0)
+        if run:
+            if set(run) <= _INJURY_WORDS:
+                # "injury cases" asks for injuries, not the "... Injury" categories.
+                if not flags.get("injury", True):
+                    return None
+                flags["injury"] = True
+            else:
+                matches = _match_categories(run, categories)
+                if not matches:
+                    return None
+                selected.extend(name for name in matches if name not in selected)
+            run = []
+        if word and word not in _FILLER_WORDS:
+            if word in _INJURY_WORDS and flags.get("injury", True):
+                flags["injury"] = True
+                continue
+            return None
+
+    if not (selected or jurisdictions or flags):
+        return None
+
+    kwargs: Dict[str, Any] = {"intent": "apply"}
+    if selected:
+        kwargs["categories"] = selected
+    if jurisdictions:
+        kwargs["jurisdictions"] = jurisdictions
+    if "injury" in flags:
+        kwargs["injury"] = "requires_injury" if flags["injury"] else "exclude_injury"
+    if "propertyDamage" in flags:
+        kwargs["propertyDamage"] = "requires_damage" if flags["propertyDamage"] else "exclude_damage"
+    return kwargs
+
+
+def parse_command(message: str, state: Dict[str, Any], tool_names: Iterable[str]) -> Optional[Command]:
+    """Map a chat message to a backend tool call, or None if it needs the LLM."""
+    if not isinstance(message, str):
+        return None
+    text = _normalize(message)
+    if not text or "?" in text or len(text) > 200:
+        return None
+    tools = set(tool_names)
+
+    if "filter_live_feed_cases" in tools:
+        if _CLEAR_PATTERN.fullmatch(text):
+            return "filter_live_feed_cases", {"intent": "clear"}
+        kwargs = _parse_filter(text, state)
+        if kwargs is not None:
+            kwargs["summary"] = message.strip()
+            return "filter_live_feed_cases", kwargs
+
+    if "list_sheet_names" in tools:
+        match = _LIST_SHEETS_PATTERN.fullmatch(text)
+        if match:
+            sheet_id = match.group("sheet_id")
+            if sheet_id:
+                # Spreadsheet ids are case-sensitive; take it from the original message.
+                found = re.search(re.escape(sheet_id), message, re.IGNORECASE)
+                sheet_id = found.group(0) if found else sheet_id
+            else:
+                sheet = state.get("sheet") if isinstance(state.get("sheet"), dict) else {}
+                sheet_id = sheet.get("sheetId") or None
+            if sheet_id:
+                return "list_sheet_names", {"sheet_id": sheet_id}
+
+    return None
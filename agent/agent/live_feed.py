@@ -0,0 +1,273 @@
+"""Server-driven live feed: queued cases released over time and fanned out to clients."""
+
+from __future__ import annotations
+
+import asyncio
+import os
+import time
+import uuid
+from collections import deque
+from itertools import islice
+from typing import Any, AsyncIterator, Awaitable, Callable, Deque, Dict, Optional, Tuple
+
+from .profile import get_profile
+from .triage import compile_triage_preferences
+
+# Seconds between released cases; matches liveFeed.intervalMs on the dashboard.
+LIVE_FEED_INTERVAL_SECONDS = float(os.getenv("LIVE_FEED_INTERVAL_SECONDS", "5"))
+# Released events kept per channel for clients that reconnect or fall behind.
+LIVE_FEED_BACKLOG = int(os.getenv("LIVE_FEED_BACKLOG", "1000"))
+# Seconds a channel may go without subscribers before the hub drops it.
+LIVE_FEED_IDLE_SECONDS = float(os.getenv("LIVE_FEED_IDLE_SECONDS", "300"))
+# Most events written to one client before waiting for the next change.
+LIVE_FEED_MAX_BATCH = 50
+LIVE_FEED_HEARTBEAT_SECONDS = 15.0
+
+# (sheet_id, sheet_name, profile_id, visible_case_limit)
+ChannelKey = Tuple[str, str, str, int]
+SnapshotLoader = Callable[[], Awaitable[Optional[Dict[str, Any]]]]
+
+
+class LiveFeedChannel:
+    """One shared release schedule for a synced tab, viewed by any number of clients.
+
+    Cases past ``visible_case_limit`` are released one per interval while at
+    least one client is connected, together with the triage notifications
+    they raise for the channel's profile. Released events go into a bounded
+    backlog with sequence numbers; every client keeps its own cursor into it,
+    so a slow client only falls behind itself and a reconnecting client
+    resumes from its last cursor. A client whose cursor has left the backlog,
+    or that was issued by an earlier process, receives a ``reset`` event and
+    should resync through /sheets/sync. A client connecting without a cursor
+    first receives a ``released`` event holding every case the schedule has
+    already released, so all clients of a channel show the same feed.
+    """
+
+    def __init__(
+        self,
+        key: ChannelKey,
+        load_snapshot: SnapshotLoader,
+        *,
+        interval_seconds: float = LIVE_FEED_INTERVAL_SECONDS,
+        backlog: int = LIVE_FEED_BACKLOG,
+    ) -> None:
+        self.key = key
+        self.profile_id = key[2]
+        self.epoch = uuid.uuid4().hex[:8]
+        self.interval_seconds = interval_seconds
+        self.next_index = key[3]
+        # Position after the last released case whose event has been published.
+        self.released_until = key[3]
+        self.seq = 0
+        self.subscribers = 0
+        self.idle_since: Optional[float] = time.monotonic()
+        self._load_snapshot = load_snapshot
+        self._events: Deque[Tuple[int, Dict[str, Any]]] = deque(maxlen=max(1, backlog))
+        self._changed = asyncio.Condition()
+        self._active = asyncio.Event()
+        self._task: Optional["asyncio.Task[None]"] = None
+
+    # Cursors -------------------------------------------------------------- #
+
+    def cursor(self, seq: int) -> str:
+        return f"{self.epoch}:{seq}"
+
+    def _parse_cursor(self, cursor: str) -> Optional[int]:
+        """Sequence number a client has seen, or None if the cursor cannot be resumed."""
+        epoch, _, raw_seq = cursor.partition(":")
+        if epoch != self.epoch or not raw_seq.isdigit():
+            return None
+        seq = int(raw_seq)
+        if seq > self.seq or seq + 1 < self._oldest_seq():
+            return None
+        return seq
+
+    def _oldest_seq(self) -> int:
+        return self._events[0][0] if self._events else self.seq + 1
+
+    # Producer ------------------------------------------------------------- #
+
+    def _ensure_running(self) -> None:
+        if self._task is None or self._task.done():
+            self._task = asyncio.ensure_future(self._run())
+
+    async def _run(self) -> None:
+        while True:
+            await self._active.wait()
+            try:
+                await self._release_next()
+            except Exception as exc:  # pragma: no cover - defensive logging
+                print(f"Live feed release failed for {self.key[0]}: {exc}")
+            await asyncio.sleep(self.interval_seconds)
+
+    async def _release_next(self) -> None:
+        snapshot = await self._load_snapshot()
+        if not snapshot:
+            return
+        cases = snapshot["cases"]
+        if self.next_index >= len(cases):
+            return
+        position = self.next_index
+        case = cases[position]
+        self.next_index += 1
+
+        preferences = get_profile(self.profile_id).get("triagePreferences", {})
+        await self.publish(
+            {
+                "type": "case",
+                "position": position,
+                "remaining": len(cases) - self.next_index,
+                "syncVersion": snapshot.get("version"),
+                "case": case,
+                "notifications": compile_triage_preferences(preferences).evaluate([case]),
+            }
+        )
+
+    async def _released_event(self, released_until: int) -> Optional[Dict[str, Any]]:
+        """The cases released before ``released_until``, for a client joining mid-schedule."""
+        first = self.key[3]
+        if released_until <= first:
+            return None
+        snapshot = await self._load_snapshot()
+        if not snapshot:
+            return None
+        return {
+            "type": "released",
+            "syncVersion": snapshot.get("version"),
+            "fromPosition": first,
+            "cases": snapshot["cases"][first:released_until],
+        }
+
+    async def publish(self, event: Dict[str, Any]) -> None:
+        async with self._changed:
+            self.seq += 1
+            self._events.append((self.seq, event))
+            if isinstance(event.get("position"), int):
+                self.released_until = max(self.released_until, event["position"] + 1)
+            self._changed.notify_all()
+
+    # Consumers ------------------------------------------------------------ #
+
+    async def subscribe(self, cursor: Optional[str] = None) -> AsyncIterator[Tuple[Optional[str], Dict[str, Any]]]:
+        """Yield ``(cursor, event)`` pairs after ``cursor``; ``(None, heartbeat)`` while idle."""
+        self.subscribers += 1
+        self.idle_since = None
+        self._active.set()
+        self._ensure_running()
+        try:
+            if cursor:
+                position = self._parse_cursor(cursor)
+            else:
+                # Read with the seq under the lock, so the stream resumes right after these cases.
+                async with self._changed:
+                    position, released_until = self.seq, self.released_until
+                released = await self._released_event(released_until)
+                if released is not None:
+                    yield self.cursor(position), released
+            if position is None:
+                position = self.seq
+                yield self.cursor(position), {"type": "reset", "reason": "cursor-expired"}
+
+            while True:
+                async with self._changed:
+                    try:
+                        await asyncio.wait_for(
+                            self._changed.wait_for(lambda: self.seq > position),
+                            timeout=LIVE_FEED_HEARTBEAT_SECONDS,
+                        )
+                    except asyncio.TimeoutError:
+                        pass
+                    oldest = self._oldest_seq()
+                    if self.seq > position and position + 1 < oldest:
+                        batch = None
+                    else:
+                        start = position + 1 - oldest
+                        batch = list(islice(self._events, start, start + LIVE_FEED_MAX_BATCH))
+
+                if batch is None:
+                    # Fell further behind than the backlog holds.
+                    position = self.seq
+                    yield self.cursor(position), {"type": "reset", "reason": "backlog-overflow"}
+                    continue
+                if not batch:
+                    yield None, {"type": "heartbeat"}
+                    continue
+                for seq, event in batch:
+                    position = seq
+                    yield self.cursor(seq), event
+        finally:
+            self.subscribers -= 1
+            if self.subscribers <= 0:
+                self._active.clear()
+                self.idle_since = time.monotonic()
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "sheetId": self.key[0],
+            "sheetName": self.key[1] or None,
+            "profileId": self.profile_id,
+            "subscribers": self.subscribers,
+            "released": self.seq,
+            "nextIndex": self.next_index,
+            "cursor": self.cursor(self.seq),
+        }
+
+    def idle_for(self, now: float) -> float:
+        return now - self.idle_since if self.idle_since is not None else 0.0
+
+    def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+
+    async def close(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except (asyncio.CancelledError, Exception):
+                pass
+
+
+class LiveFeedHub:
+    """Channels keyed by tab, profile and visible case limit, shared by every client.
+
+    A channel without subscribers for ``idle_seconds`` is dropped the next
+    time the hub is used; its clients' cursors then reset.
+    """
+
+    def __init__(self, idle_seconds: float = LIVE_FEED_IDLE_SECONDS) -> None:
+        self.idle_seconds = idle_seconds
+        self._channels: Dict[ChannelKey, LiveFeedChannel] = {}
+
+    def _evict_idle(self) -> None:
+        now = time.monotonic()
+        for key, channel in list(self._channels.items()):
+            if channel.idle_for(now) >= self.idle_seconds:
+                channel.stop()
+                del self._channels[key]
+
+    def channel(self, key: ChannelKey, load_snapshot: SnapshotLoader) -> LiveFeedChannel:
+        self._evict_idle()
+        channel = self._channels.get(key)
+        if channel is None:
+            channel = LiveFeedChannel(key, load_snapshot)
+            self._channels[key] = channel
+        return channel
+
+    def stats(self) -> Dict[str, Any]:
+        self._evict_idle()
+        return {"channels": [channel.stats() for channel in self._channels.values()]}
+
+    async def close(self) -> None:
+        for channel in list(self._channels.values()):
+            await channel.close()
+        self._channels.clear()
+
+
+def sse_message(event: Dict[str, Any], data: bytes, event_id: Optional[str] = None) -> bytes:
+    """Frame one server-sent event; ``data`` is the already-encoded JSON payload."""
+    lines = []
+    if event_id is not None:
+        lines.append(f"id: {event_id}")
+    lines.append(f"event: {event.get('type', 'message')}")
+    return ("\n".join(lines) + "\n").encode("utf-8") + b"data: " + data + b"\n\n"
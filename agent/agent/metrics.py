@@ -0,0 +1,188 @@
+"""Dashboard metrics maintained incrementally as cases are added, edited and removed."""
+
+from __future__ import annotations
+
+import re
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Union
+
+from .case_store import DICTIONARY_FIELDS, CaseStore, case_column
+
+# Metrics key -> (case field, label for empty values). Hours are bucketed from incidentTime.
+ROLLUPS: Dict[str, Tuple[str, str]] = {
+    "casesByCategory": ("incidentCategory", "Uncategorized"),
+    "casesByJurisdiction": ("jurisdiction", "Unknown"),
+    "casesByFaultDetermination": ("faultDetermination", "Unknown"),
+    "casesByResolution": ("resolution", "Unknown"),
+    "casesByDay": ("incidentDate", "Unknown"),
+    "casesByHour": ("incidentTime", "Unknown"),
+}
+
+_HOUR_PATTERN = re.compile(r"(\d{1,2}):")
+
+# (rollup labels in ROLLUPS order, injuryReported, propertyDamage)
+Entry = Tuple[Tuple[str, ...], bool, bool]
+
+
+def _label(key: str, value: Any) -> str:
+    empty = ROLLUPS[key][1]
+    if not isinstance(value, str) or not value.strip():
+        return empty
+    value = value.strip()
+    if key == "casesByHour":
+        match = _HOUR_PATTERN.match(value)
+        return f"{int(match.group(1)):02d}" if match and int(match.group(1)) < 24 else empty
+    return value
+
+
+def _label_column(cases: Union[CaseStore, List[Dict[str, Any]]], key: str) -> List[str]:
+    """Rollup labels of every case; a CaseStore's are computed once per dictionary code."""
+    field = ROLLUPS[key][0]
+    if isinstance(cases, CaseStore) and field in DICTIONARY_FIELDS:
+        labels = [_label(key, value) for value in cases.dictionaries[field].values]
+        return [labels[code] for code in cases.codes(field)]
+    return [_label(key, value) for value in case_column(cases, field)]
+
+
+def _flag_column(cases: Union[CaseStore, List[Dict[str, Any]]], field: str) -> List[bool]:
+    if isinstance(cases, CaseStore):
+        return cases.flags(field)
+    return [bool(value) for value in case_column(cases, field)]
+
+
+class CaseMetrics:
+    """Totals and per-dimension rollups keyed by incident id.
+
+    Each case's contribution is kept, so adding, editing or removing a case
+    only touches that case's counters, and the metrics of any subset of
+    cases (a filtered view) are summed from the kept contributions without
+    reading the cases again. ``version`` names the case set the counters
+    currently describe.
+    """
+
+    def __init__(self, version: Optional[str] = None) -> None:
+        self.version = version
+        self._entries: Dict[str, Entry] = {}
+        self._injuries = 0
+        self._property_damage = 0
+        self._rollups: Dict[str, Dict[str, int]] = {key: {} for key in ROLLUPS}
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_cases(
+        cls, cases: Union[CaseStore, List[Dict[str, Any]]], version: Optional[str] = None
+    ) -> "CaseMetrics":
+        metrics = cls(version)
+        metrics.upsert(cases)
+        return metrics
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _apply(self, entry: Entry, sign: int) -> None:
+        labels, injury, damage = entry
+        self._injuries += sign * injury
+        self._property_damage += sign * damage
+        for key, label in zip(ROLLUPS, labels):
+            counts = self._rollups[key]
+            count = counts.get(label, 0) + sign
+            if count:
+                counts[label] = count
+            else:
+                counts.pop(label, None)
+
+    def _upsert_locked(self, cases: Union[CaseStore, List[Dict[str, Any]]]) -> None:
+        labels = zip(*(_label_column(cases, key) for key in ROLLUPS))
+        for incident_id, case_labels, injured, damaged in zip(
+            case_column(cases, "incidentId"),
+            labels,
+            _flag_column(cases, "injuryReported"),
+            _flag_column(cases, "propertyDamage"),
+        ):
+            if not incident_id:
+                continue
+            entry: Entry = (case_labels, injured, damaged)
+            previous = self._entries.get(incident_id)
+            if previous == entry:
+                continue
+            if previous is not None:
+                self._apply(previous, -1)
+            self._entries[incident_id] = entry
+            self._apply(entry, 1)
+
+    def _remove_locked(self, incident_ids: Iterable[str]) -> None:
+        for incident_id in incident_ids:
+            previous = self._entries.pop(incident_id, None)
+            if previous is not None:
+                self._apply(previous, -1)
+
+    def upsert(self, cases: Union[CaseStore, List[Dict[str, Any]]]) -> None:
+        """Add new cases and replace the contribution of cases already counted."""
+        with self._lock:
+            self._upsert_locked(cases)
+
+    def remove(self, incident_ids: Iterable[str]) -> None:
+        with self._lock:
+            self._remove_locked(incident_ids)
+
+    def apply_delta(
+        self,
+        upserted: Union[CaseStore, List[Dict[str, Any]]],
+        removed: Iterable[str],
+        *,
+        base_version: Optional[str],
+        version: Optional[str],
+    ) -> bool:
+        """Move from ``base_version`` to ``version``; False (and no change) if not at ``base_version``."""
+        with self._lock:
+            if self.version != base_version:
+                return False
+            self._remove_locked(removed)
+            self._upsert_locked(upserted)
+            self.version = version
+            return True
+
+    def summary(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "totalCases": len(self._entries),
+                "injuryCount": self._injuries,
+                "propertyDamageCount": self._property_damage,
+                **{key: dict(counts) for key, counts in self._rollups.items()},
+            }
+
+    def summarize(self, incident_ids: Iterable[str]) -> Dict[str, Any]:
+        """Metrics of the counted cases among ``incident_ids``, e.g. a filtered view."""
+        with self._lock:
+            entries = [self._entries.get(incident_id) for incident_id in dict.fromkeys(incident_ids)]
+        subset = CaseMetrics()
+        for entry in entries:
+            if entry is not None:
+                subset._apply(entry, 1)
+        metrics = subset.summary()
+        metrics["totalCases"] = sum(entry is not None for entry in entries)
+        return metrics
+
+
+# Case sets (by version) whose metrics are kept for filtered-view summaries.
+CASE_METRICS_CACHE_SIZE = 8
+
+_case_metrics: "OrderedDict[str, CaseMetrics]" = OrderedDict()
+_case_metrics_lock = threading.Lock()
+
+
+def get_case_metrics(cases: Union[CaseStore, List[Dict[str, Any]]], version: str) -> CaseMetrics:
+    """Metrics for a case set identified by ``version``, built on first use."""
+    with _case_metrics_lock:
+        metrics = _case_metrics.get(version)
+        if metrics is not None:
+            _case_metrics.move_to_end(version)
+            return metrics
+
+    metrics = CaseMetrics.from_cases(cases, version)
+    with _case_metrics_lock:
+        _case_metrics[version] = metrics
+        while len(_case_metrics) > CASE_METRICS_CACHE_SIZE:
+            _case_metrics.popitem(last=False)
+    return metrics
@@ -1,8 +1,11 @@
 from __future__ import annotations
 
+import threading
 from copy import deepcopy
 from datetime import datetime
-from typing import Dict, List
+from typing import Dict, List, Optional
+
+DEFAULT_PROFILE_ID = "default"
 
 DEFAULT_TRIAGE_PREFERENCES: Dict[str, object] = {
     "categoriesOfInterest": [],
@@ -12,39 +15,102 @@ DEFAULT_TRIAGE_PREFERENCES: Dict[str, object] = {
 }
 
 DEFAULT_PROFILE: Dict[str, object] = {
-    "id": "default",
+    "id": DEFAULT_PROFILE_ID,
     "displayName": "Trial Lawyer",
     "triagePreferences": deepcopy(DEFAULT_TRIAGE_PREFERENCES),
     "email": None,
     "updatedAt": datetime.utcnow().isoformat(),
 }
 
-_current_profile: Dict[str, object] = deepcopy(DEFAULT_PROFILE)
+# Every lawyer profile keyed by id. The default profile always exists.
+_profiles: Dict[str, Dict[str, object]] = {DEFAULT_PROFILE_ID: deepcopy(DEFAULT_PROFILE)}
+# Bumped on every change so derived structures (the subscription index) know to rebuild.
+_profiles_version = 0
+_profiles_lock = threading.Lock()
 
 
-def get_profile() -> Dict[str, object]:
-    """Return a copy of the current lawyer profile."""
-    return deepcopy(_current_profile)
+def _touch() -> None:
+    global _profiles_version
+    _profiles_version += 1
 
 
-def update_triage_preferences(preferences: Dict[str, object]) -> Dict[str, object]:
-    """Update triage preferences and return the new profile."""
-    global _current_profile
+def profiles_version() -> int:
+    """Counter that changes whenever any profile is created, updated or removed."""
+    return _profiles_version
+
+
+def get_profile(profile_id: str = DEFAULT_PROFILE_ID) -> Dict[str, object]:
+    """Return a copy of a lawyer profile, falling back to the default profile."""
+    with _profiles_lock:
+        profile = _profiles.get(profile_id) or _profiles[DEFAULT_PROFILE_ID]
+        return deepcopy(profile)
+
+
+def list_profiles() -> List[Dict[str, object]]:
+    """Return copies of every stored profile."""
+    with _profiles_lock:
+        return [deepcopy(profile) for profile in _profiles.values()]
+
+
+def upsert_profile(
+    profile_id: str,
+    *,
+    display_name: Optional[str] = None,
+    email: Optional[str] = None,
+    triage_preferences: Optional[Dict[str, object]] = None,
+) -> Dict[str, object]:
+    """Create a profile or update the given fields of an existing one."""
+    with _profiles_lock:
+        profile = _profiles.get(profile_id)
+        if profile is None:
+            profile = deepcopy(DEFAULT_PROFILE)
+            profile["id"] = profile_id
+            _profiles[profile_id] = profile
+
+        if display_name is not None:
+            profile["displayName"] = display_name
+        if email is not None:
+            profile["email"] = email
+        if triage_preferences is not None:
+            _merge_triage_preferences(profile, triage_preferences)
 
-    merged_preferences = deepcopy(_current_profile.get("triagePreferences", {}))
+        profile["updatedAt"] = datetime.utcnow().isoformat()
+        _touch()
+    return get_profile(profile_id)
+
+
+def delete_profile(profile_id: str) -> bool:
+    """Remove a profile. The default profile cannot be removed."""
+    if profile_id == DEFAULT_PROFILE_ID:
+        return False
+    with _profiles_lock:
+        removed = _profiles.pop(profile_id, None) is not None
+        if removed:
+            _touch()
+    return removed
+
+
+def _merge_triage_preferences(profile: Dict[str, object], preferences: Dict[str, object]) -> None:
+    merged_preferences = deepcopy(profile.get("triagePreferences", {}))
 
     for key, value in preferences.items():
         if key in merged_preferences:
             merged_preferences[key] = value
 
-    _current_profile["triagePreferences"] = merged_preferences
-    _current_profile["updatedAt"] = datetime.utcnow().isoformat()
-    return get_profile()
+    profile["triagePreferences"] = merged_preferences
+
+
+def update_triage_preferences(
+    preferences: Dict[str, object], profile_id: str = DEFAULT_PROFILE_ID
+) -> Dict[str, object]:
+    """Update triage preferences and return the new profile."""
+    return upsert_profile(profile_id, triage_preferences=preferences)
 
 
 def reset_profile() -> Dict[str, object]:
     """Reset to the default profile and return it."""
-    global _current_profile
-    _current_profile = deepcopy(DEFAULT_PROFILE)
+    global _profiles
+    with _profiles_lock:
+        _profiles = {DEFAULT_PROFILE_ID: deepcopy(DEFAULT_PROFILE)}
+        _touch()
     return get_profile()
-
@@ -0,0 +1,69 @@
+"""Cache of finished agent replies, keyed on the question and what the LLM saw."""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import re
+import threading
+from typing import Any, Dict, Iterable, Optional
+
+from .cache import TTLCache
+
+AGENT_RESPONSE_CACHE_TTL_SECONDS = float(os.getenv("AGENT_RESPONSE_CACHE_TTL_SECONDS", "300"))
+AGENT_RESPONSE_CACHE_SIZE = int(os.getenv("AGENT_RESPONSE_CACHE_SIZE", "256"))
+# Tools that only read state; a turn that calls any other tool is never cached.
+READ_ONLY_TOOLS = frozenset({"list_sheet_names", "get_case_details", "find_similar_cases"})
+
+_response_cache = TTLCache(AGENT_RESPONSE_CACHE_TTL_SECONDS, max_entries=AGENT_RESPONSE_CACHE_SIZE)
+_stats_lock = threading.Lock()
+_latency_saved_seconds = 0.0
+_stored = 0
+
+
+def normalize_message(message: str) -> str:
+    return re.sub(r"\s+", " ", message.strip().lower()).rstrip(" .!?")
+
+
+def response_cache_key(
+    message: str,
+    tool_names: Iterable[str],
+    state_view: Any,
+    history: Iterable[Any],
+) -> str:
+    """Key over the normalized message, available tools, the state the LLM sees and earlier turns."""
+    digest = hashlib.blake2b(digest_size=16)
+    for part in (normalize_message(message), sorted(tool_names), state_view, list(history)):
+        digest.update(json.dumps(part, sort_keys=True, default=str).encode("utf-8"))
+        digest.update(b"\x1f")
+    return digest.hexdigest()
+
+
+def get_cached_response(key: str) -> Optional[Dict[str, Any]]:
+    global _latency_saved_seconds
+    entry = _response_cache.get(key)
+    if entry is not None:
+        with _stats_lock:
+            _latency_saved_seconds += entry["latencySeconds"]
+    return entry
+
+
+def store_response(key: str, reply: str, latency_seconds: float) -> None:
+    global _stored
+    _response_cache.set(key, {"reply": reply, "latencySeconds": latency_seconds})
+    with _stats_lock:
+        _stored += 1
+
+
+def clear_response_cache() -> None:
+    _response_cache.invalidate()
+
+
+def get_response_cache_stats() -> Dict[str, Any]:
+    stats = _response_cache.stats()
+    with _stats_lock:
+        stats["stored"] = _stored
+        stats["latencySavedSeconds"] = round(_latency_saved_seconds, 3)
+    stats["maxEntries"] = AGENT_RESPONSE_CACHE_SIZE
+    return stats
@@ -0,0 +1,103 @@
+"""JSON responses with fast encoding, compression and ETag revalidation."""
+
+from __future__ import annotations
+
+import gzip
+import hashlib
+import json
+import os
+from typing import Any, Dict, Optional, Tuple
+
+import orjson
+from fastapi import Request, Response
+
+try:
+    import brotli  # type: ignore
+except Exception:  # pragma: no cover - installed with the "brotli" extra
+    brotli = None
+
+# Bodies smaller than this are sent uncompressed.
+RESPONSE_COMPRESSION_MIN_BYTES = int(os.getenv("RESPONSE_COMPRESSION_MIN_BYTES", "1024"))
+GZIP_LEVEL = 5
+BROTLI_QUALITY = 4
+
+
+def encode_json(content: Any) -> bytes:
+    """Serialize with orjson, allowing non-string dict keys."""
+    return orjson.dumps(content, option=orjson.OPT_NON_STR_KEYS)
+
+
+def content_etag(*parts: Any) -> str:
+    """A weak ETag over the values that determine a response's content."""
+    digest = hashlib.blake2b(digest_size=16)
+    for part in parts:
+        digest.update(json.dumps(part, sort_keys=True, default=str).encode("utf-8"))
+        digest.update(b"\x1f")
+    return f'W/"{digest.hexdigest()}"'
+
+
+def etag_matches(request: Request, etag: str) -> bool:
+    """Weak comparison of ``etag`` against the request's If-None-Match header."""
+    header = request.headers.get("if-none-match")
+    if not header:
+        return False
+    if header.strip() == "*":
+        return True
+    wanted = etag[2:] if etag.startswith("W/") else etag
+    for candidate in header.split(","):
+        candidate = candidate.strip()
+        if candidate.startswith("W/"):
+            candidate = candidate[2:]
+        if candidate == wanted:
+            return True
+    return False
+
+
+def not_modified(etag: str) -> Response:
+    return Response(status_code=304, headers={"ETag": etag, "Vary": "Accept-Encoding"})
+
+
+def _accepted_encodings(request: Request) -> Dict[str, float]:
+    accepted: Dict[str, float] = {}
+    for item in request.headers.get("accept-encoding", "").split(","):
+        name, _, params = item.strip().partition(";")
+        if not name:
+            continue
+        quality = 1.0
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                quality = float(params[2:])
+            except ValueError:
+                quality = 0.0
+        accepted[name.strip().lower()] = quality
+    return accepted
+
+
+def compress_body(request: Request, body: bytes) -> Tuple[bytes, Optional[str]]:
+    """Compress ``body`` with brotli or gzip if the client accepts it and it is large enough."""
+    if len(body) < RESPONSE_COMPRESSION_MIN_BYTES:
+        return body, None
+    accepted = _accepted_encodings(request)
+    if brotli is not None and accepted.get("br", 0) > 0:
+        return brotli.compress(body, quality=BROTLI_QUALITY), "br"
+    if accepted.get("gzip", 0) > 0:
+        return gzip.compress(body, compresslevel=GZIP_LEVEL), "gzip"
+    return body, None
+
+
+def json_response(
+    request: Request,
+    content: Any,
+    *,
+    etag: Optional[str] = None,
+    status_code: int = 200,
+) -> Response:
+    """Encode, compress and tag a JSON payload."""
+    body, encoding = compress_body(request, encode_json(content))
+    headers = {"Vary": "Accept-Encoding"}
+    if encoding:
+        headers["Content-Encoding"] = encoding
+    if etag:
+        headers["ETag"] = etag
+    return Response(content=body, status_code=status_code, media_type="application/json", headers=headers)
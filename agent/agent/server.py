@@ -1,11 +1,17 @@
 from __future__ import annotations
 
+import asyncio
+import functools
+import json
+import os
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import asynccontextmanager
 from pathlib import Path
-from typing import Optional
+from typing import Any, AsyncIterator, Callable, Dict, Iterator, List, Optional, Tuple
 
-from fastapi import FastAPI, HTTPException
-from fastapi.responses import JSONResponse
-from pydantic import BaseModel, Field
+from fastapi import FastAPI, HTTPException, Query, Request
+from fastapi.responses import JSONResponse, StreamingResponse
+from pydantic import BaseModel, Field, ValidationError
 
 # Load environment variables from .env/.env.local (repo root or agent dir) if present
 try:
@@ -31,17 +37,219 @@ def _load_env_files() -> None:
 
 _load_env_files()
 
-from .agent import agentic_chat_router
-from .profile import get_profile, update_triage_preferences
-from .sheets_integration import get_sheet_names, import_cases_from_sheet
+from .case_sources import CaseSourceError, CaseSourceNotFoundError, resolve_case_source
+from .feed_filter import (
+    DEFAULT_FEED_FILTER,
+    RANKED_RESULTS_LIMIT,
+    InvalidCursorError,
+    _trimmed_unique,
+    query_cases,
+    search_cases,
+)
+from .live_feed import LiveFeedHub, sse_message
+from .profile import (
+    delete_profile,
+    get_profile,
+    list_profiles,
+    profiles_version,
+    update_triage_preferences,
+    upsert_profile,
+)
+from .response_cache import clear_response_cache, get_response_cache_stats
+from .responses import content_etag, encode_json, etag_matches, json_response, not_modified
+from .sheets_integration import (
+    SHEETS_PAGE_SIZE,
+    build_sheet_import,
+    filtered_metrics,
+    get_cached_sheet_cases,
+    get_sheet_cache_stats,
+    get_sheet_names,
+    get_spreadsheet_info_cache_stats,
+    load_sheet_cases,
+    open_sheet_pages,
+    sheet_change_signature,
+    stream_sheet_import,
+)
+from .similarity import SIMILARITY_LIMIT_MAX, find_similar_cases, get_similarity_index
+from .startup import AgentLoader, startup_profile
+from .state_projection import get_prompt_token_stats
+from .sync_scheduler import SyncScheduler
 from .voice_calls import (
     VoiceCallConfigurationError,
+    VoiceCallOutcomeUnknownError,
+    VoiceCallQueue,
     VoiceCallRequestError,
+    VoiceCallUpstreamError,
+    close_http_client,
     start_voice_call,
 )
 
-app = FastAPI()
-app.include_router(agentic_chat_router)
+# Sheet ingestion makes blocking Composio calls and parses rows on the CPU, so
+# it runs on a bounded pool instead of the event loop serving the chat router.
+SHEETS_SYNC_WORKERS = int(os.getenv("SHEETS_SYNC_WORKERS", "4"))
+_sheet_sync_executor = ThreadPoolExecutor(
+    max_workers=SHEETS_SYNC_WORKERS, thread_name_prefix="sheet-sync"
+)
+
+# (sheet_id, sheet_name) -> in-flight fetch+parse shared by concurrent syncs.
+_inflight_sheet_loads: Dict[Tuple[str, str], "asyncio.Future[Any]"] = {}
+
+
+async def _run_blocking(fn: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_sheet_sync_executor, functools.partial(fn, *args, **kwargs))
+
+
+def _sheet_load_task(sheet_id: str, sheet_name: Optional[str]) -> "asyncio.Future[Any]":
+    """Start a fetch+parse of a tab unless one is already running, and return it."""
+    key = (sheet_id, sheet_name or "")
+    task = _inflight_sheet_loads.get(key)
+    if task is None:
+        task = asyncio.ensure_future(_run_blocking(load_sheet_cases, sheet_id, sheet_name))
+        _inflight_sheet_loads[key] = task
+
+        def _forget(done: "asyncio.Future[Any]") -> None:
+            if _inflight_sheet_loads.get(key) is done:
+                del _inflight_sheet_loads[key]
+
+        task.add_done_callback(_forget)
+        task.add_done_callback(functools.partial(_refresh_similarity_index, key))
+    return task
+
+
+def _refresh_similarity_index(key: Tuple[str, str], done: "asyncio.Future[Any]") -> None:
+    """Fold a finished sync into the tab's similarity index, if one has been built."""
+    if done.cancelled() or done.exception() is not None or not done.result():
+        return
+    index = get_similarity_index(key, create=False)
+    if index is not None:
+        snapshot = done.result()
+        asyncio.ensure_future(_run_blocking(index.update, snapshot["cases"], snapshot["version"]))
+
+
+async def _load_sheet_cases_single_flight(sheet_id: str, sheet_name: Optional[str]) -> Any:
+    """Fetch and parse a tab once for every concurrent request asking for it."""
+    # A disconnecting client must not cancel the load other requests share.
+    return await asyncio.shield(_sheet_load_task(sheet_id, sheet_name))
+
+
+def _revalidate_in_background(sheet_id: str, sheet_name: Optional[str]) -> None:
+    """Refresh a tab served from the sheet cache; the next sync sees the result."""
+
+    def _report(done: "asyncio.Future[Any]") -> None:
+        if done.cancelled():
+            return
+        exc = done.exception()
+        if exc is not None:
+            print(f"Background sheet revalidation failed: {exc}")
+        elif not done.result():
+            print(f"Background sheet revalidation could not load {sheet_id}")
+
+    _sheet_load_task(sheet_id, sheet_name).add_done_callback(_report)
+
+
+async def _iterate_in_executor(events: Iterator[Any]) -> AsyncIterator[Any]:
+    """Drive a blocking iterator from the worker pool, one item at a time."""
+    done = object()
+    while True:
+        item = await _run_blocking(next, events, done)
+        if item is done:
+            return
+        yield item
+
+
+# Live feed channels shared by every connected dashboard tab.
+_live_feed_hub = LiveFeedHub()
+
+
+def _case_source_http_error(exc: CaseSourceError) -> HTTPException:
+    """404 for a ``file:`` id naming a missing file, 400 for any other unusable one."""
+    return HTTPException(status_code=404 if isinstance(exc, CaseSourceNotFoundError) else 400, detail=str(exc))
+
+
+async def _check_sheet_signature(sheet_id: str, sheet_name: Optional[str]) -> Optional[str]:
+    return await _run_blocking(sheet_change_signature, sheet_id, sheet_name)
+
+
+# Re-imports registered sheets in the background; shares the single-flight loads.
+_sync_scheduler = SyncScheduler(_check_sheet_signature, _load_sheet_cases_single_flight)
+
+# Bulk outbound calls placed by /voice/calls.
+_voice_call_queue = VoiceCallQueue()
+VOICE_CALL_BATCH_MAX = 100
+
+# The chat agent (LlamaIndex, OpenAI, Composio tools) loads after the server is accepting requests.
+_agent_loader = AgentLoader()
+
+
+@asynccontextmanager
+async def lifespan(_app: FastAPI):
+    startup_profile.mark("serving")
+    _agent_loader.start()
+    _sync_scheduler.start()
+    _voice_call_queue.start()
+    yield
+    await _sync_scheduler.stop()
+    await _voice_call_queue.stop()
+    await close_http_client()
+    await _live_feed_hub.close()
+    _sheet_sync_executor.shutdown(wait=False)
+
+
+app = FastAPI(lifespan=lifespan)
+startup_profile.mark("server-import")
+
+
+@app.get("/healthz")
+async def healthz():
+    """Liveness: the process is up and serving requests."""
+    return {"status": "ok"}
+
+
+@app.get("/readyz")
+async def readyz():
+    """Readiness: 503 until the chat agent and its tools have loaded."""
+    content = {
+        "ready": _agent_loader.is_ready,
+        "agent": _agent_loader.status(),
+        "startup": startup_profile.report(),
+    }
+    return JSONResponse(status_code=200 if _agent_loader.is_ready else 503, content=content)
+
+
+@app.get("/agent/prompt-tokens")
+async def prompt_token_stats():
+    """Prompt sizes of recent LLM calls, and how much of each was dashboard state."""
+    return JSONResponse(content=get_prompt_token_stats())
+
+
+@app.get("/agent/response-cache")
+async def response_cache_stats():
+    """Hit rate and latency saved by the agent response cache."""
+    return JSONResponse(content=get_response_cache_stats())
+
+
+@app.delete("/agent/response-cache")
+async def clear_response_cache_endpoint():
+    clear_response_cache()
+    return JSONResponse(content={"success": True})
+
+
+@app.post("/run")
+async def run_agent(request: Request):
+    """AG-UI chat endpoint; the first requests wait for the agent to finish loading."""
+    try:
+        run = await _agent_loader.ready()
+    except Exception as exc:
+        raise HTTPException(status_code=503, detail=f"Agent is unavailable: {exc}")
+
+    from ag_ui.core import RunAgentInput
+
+    try:
+        input_data = RunAgentInput.model_validate(await request.json())
+    except (ValidationError, ValueError) as exc:
+        raise HTTPException(status_code=422, detail=str(exc))
+    return await run(input_data)
 
 
 class TriagePreferencesModel(BaseModel):
@@ -58,6 +266,20 @@ class SheetSyncRequest(BaseModel):
     triage_preferences: Optional[TriagePreferencesModel] = Field(
         default=None, alias="triage_preferences"
     )
+    since_version: Optional[str] = Field(default=None, alias="since_version")
+    profile_id: str = Field(default="default", alias="profile_id")
+    stream: bool = Field(default=False, alias="stream")
+    page_size: int = Field(default=SHEETS_PAGE_SIZE, alias="page_size", ge=1)
+    refresh: bool = Field(default=False, alias="refresh")
+    include_queued: bool = Field(default=True, alias="include_queued")
+
+    class Config:
+        populate_by_name = True
+
+
+class SheetWatchRequest(BaseModel):
+    sheet_id: str = Field(alias="sheet_id")
+    sheet_name: Optional[str] = Field(default=None, alias="sheet_name")
 
     class Config:
         populate_by_name = True
@@ -71,6 +293,12 @@ class TriageUpdateRequest(BaseModel):
         populate_by_name = True
 
 
+class ProfileUpsertRequest(BaseModel):
+    displayName: Optional[str] = None
+    email: Optional[str] = None
+    triagePreferences: Optional[TriagePreferencesModel] = None
+
+
 class VoiceCallRequestModel(BaseModel):
     incident_id: str = Field(alias="incidentId")
     full_name: str = Field(alias="fullName")
@@ -81,9 +309,17 @@ class VoiceCallRequestModel(BaseModel):
         populate_by_name = True
 
 
+class VoiceCallBatchRequest(BaseModel):
+    calls: List[VoiceCallRequestModel] = Field(min_length=1)
+
+
 @app.post("/sheets/sync")
-async def sync_sheets(request: SheetSyncRequest):
-    """Import cases from Google Sheets and structure them for the dashboard."""
+async def sync_sheets(request: SheetSyncRequest, http_request: Request):
+    """Import cases from Google Sheets and structure them for the dashboard.
+
+    The response carries an ETag derived from the sheet revision and the
+    request options; a matching If-None-Match gets a 304 without rebuilding it.
+    """
     try:
         print(
             "Syncing sheet:",
@@ -93,31 +329,96 @@ async def sync_sheets(request: SheetSyncRequest):
         )
 
         prefs = request.triage_preferences.dict() if request.triage_preferences else None
-        result = import_cases_from_sheet(
-            request.sheet_id,
-            request.sheet_name,
+        if request.stream:
+            return await _stream_sheet_sync(request, prefs)
+
+        # Serve the last parsed snapshot (from memory or the on-disk cache)
+        # right away and refresh it in the background, unless asked not to.
+        snapshot = None
+        if not request.refresh:
+            snapshot = await _run_blocking(get_cached_sheet_cases, request.sheet_id, request.sheet_name)
+        served_from_cache = snapshot is not None
+        if served_from_cache:
+            _revalidate_in_background(request.sheet_id, request.sheet_name)
+        else:
+            snapshot = await _load_sheet_cases_single_flight(request.sheet_id, request.sheet_name)
+        if not snapshot:
+            raise HTTPException(
+                status_code=400,
+                detail="Failed to load Google Sheet. Ensure the sheet ID and permissions are correct.",
+            )
+
+        etag = content_etag(
+            snapshot["version"],
+            request.visible_case_limit,
+            prefs,
+            request.since_version,
+            request.profile_id,
+            request.include_queued,
+            profiles_version(),
+        )
+        if etag_matches(http_request, etag):
+            return not_modified(etag)
+
+        result = await _run_blocking(
+            build_sheet_import,
+            snapshot,
             visible_case_limit=request.visible_case_limit,
             triage_preferences=prefs,
+            since_version=request.since_version,
+            profile_id=request.profile_id,
+            include_queued=request.include_queued,
         )
+        result["cache"] = {
+            "hit": served_from_cache,
+            "cachedAt": snapshot.get("cachedAt"),
+            "revalidating": served_from_cache,
+        }
 
-        if not result.get("success"):
-            raise HTTPException(status_code=400, detail=result.get("error", "Import failed"))
-
-        return JSONResponse(content=result)
+        return await _run_blocking(json_response, http_request, result, etag=etag)
 
     except HTTPException:
         raise
+    except CaseSourceError as exc:
+        raise _case_source_http_error(exc)
     except Exception as exc:  # pragma: no cover - defensive logging
         print(f"Error in sheets sync: {exc}")
         raise HTTPException(status_code=500, detail=f"Internal server error: {exc}")
 
 
+async def _stream_sheet_sync(
+    request: SheetSyncRequest, prefs: Optional[Dict[str, Any]]
+) -> StreamingResponse:
+    """Stream the import as NDJSON, one line per fetched row window."""
+    opened = await _run_blocking(
+        open_sheet_pages, request.sheet_id, request.sheet_name, page_size=request.page_size
+    )
+    if not opened:
+        raise HTTPException(
+            status_code=400,
+            detail="Failed to load Google Sheet. Ensure the sheet ID and permissions are correct.",
+        )
+
+    events = stream_sheet_import(
+        opened,
+        visible_case_limit=request.visible_case_limit,
+        triage_preferences=prefs,
+        profile_id=request.profile_id,
+    )
+
+    async def ndjson_lines() -> AsyncIterator[bytes]:
+        async for event in _iterate_in_executor(events):
+            yield (json.dumps(event) + "\n").encode("utf-8")
+
+    return StreamingResponse(ndjson_lines(), media_type="application/x-ndjson")
+
+
 @app.post("/sheets/list")
 async def list_sheet_names_endpoint(request: SheetSyncRequest):
     """List available sheet names in a Google Spreadsheet."""
     try:
         print(f"Listing sheets in: {request.sheet_id}")
-        sheet_names = get_sheet_names(request.sheet_id)
+        sheet_names = await _run_blocking(get_sheet_names, request.sheet_id)
         if not sheet_names:
             raise HTTPException(
                 status_code=400,
@@ -133,6 +434,8 @@ async def list_sheet_names_endpoint(request: SheetSyncRequest):
         )
     except HTTPException:
         raise
+    except CaseSourceError as exc:
+        raise _case_source_http_error(exc)
     except Exception as exc:  # pragma: no cover - defensive logging
         print(f"Error in sheet listing: {exc}")
         raise HTTPException(
@@ -141,11 +444,286 @@ async def list_sheet_names_endpoint(request: SheetSyncRequest):
         )
 
 
+@app.post("/sheets/watch")
+async def watch_sheet(request: SheetWatchRequest):
+    """Register a tab for background re-sync."""
+    try:
+        resolve_case_source(request.sheet_id)
+    except CaseSourceError as exc:
+        raise _case_source_http_error(exc)
+    entry = _sync_scheduler.watch(request.sheet_id, request.sheet_name)
+    return JSONResponse(content={"success": True, "sheet": entry})
+
+
+@app.delete("/sheets/watch")
+async def unwatch_sheet(sheet_id: str, sheet_name: Optional[str] = None):
+    """Stop re-syncing a tab in the background."""
+    if not _sync_scheduler.unwatch(sheet_id, sheet_name):
+        raise HTTPException(status_code=404, detail=f"Sheet '{sheet_id}' is not being watched.")
+    return JSONResponse(content={"success": True, "sheetId": sheet_id, "sheetName": sheet_name})
+
+
+@app.get("/sheets/watch")
+async def watched_sheets():
+    """List watched tabs with their polling interval and last sync status."""
+    sheets = _sync_scheduler.status()
+    return JSONResponse(content={"success": True, "sheets": sheets, "count": len(sheets)})
+
+
+@app.get("/sheets/cache")
+async def sheet_cache_stats():
+    """Report how often spreadsheet metadata and parsed sheets were served from cache."""
+    return JSONResponse(
+        content={
+            "success": True,
+            "spreadsheetInfo": get_spreadsheet_info_cache_stats(),
+            "parsedSheets": get_sheet_cache_stats(),
+        }
+    )
+
+
+# Largest page GET /cases will return.
+CASES_PAGE_LIMIT_MAX = 500
+
+
+async def _sheet_snapshot(sheet_id: str, sheet_name: Optional[str]) -> Any:
+    """The last parsed snapshot of a tab, loading it if it was never synced."""
+    snapshot = await _run_blocking(get_cached_sheet_cases, sheet_id, sheet_name)
+    if snapshot is None:
+        try:
+            snapshot = await _load_sheet_cases_single_flight(sheet_id, sheet_name)
+        except CaseSourceError as exc:
+            raise _case_source_http_error(exc)
+    return snapshot
+
+
+def _split_csv(value: Optional[str]) -> List[str]:
+    return [item.strip() for item in (value or "").split(",") if item.strip()]
+
+
+@app.get("/cases")
+async def list_cases(
+    http_request: Request,
+    sheet_id: str,
+    sheet_name: Optional[str] = None,
+    cursor: Optional[str] = None,
+    limit: int = Query(default=50, ge=1, le=CASES_PAGE_LIMIT_MAX),
+    sort: Optional[str] = None,
+    order: str = "asc",
+    fields: Optional[str] = None,
+    searchText: str = "",
+    categories: List[str] = Query(default=[]),
+    jurisdictions: List[str] = Query(default=[]),
+    injury: Optional[bool] = None,
+    propertyDamage: Optional[bool] = None,
+    incidentIds: List[str] = Query(default=[]),
+    includeMetrics: bool = False,
+):
+    """Page through a synced tab's cases using the live feed filter semantics.
+
+    ``sort`` is a comma-separated list of incidentDate/incidentTime, ``order``
+    is asc or desc and ``fields`` a comma-separated projection. Pass the
+    returned ``nextCursor`` back as ``cursor`` for the following page.
+    ``includeMetrics`` adds the metrics of every matching case, not just the page.
+    """
+    if order not in ("asc", "desc"):
+        raise HTTPException(status_code=400, detail="order must be 'asc' or 'desc'.")
+
+    snapshot = await _sheet_snapshot(sheet_id, sheet_name)
+    if not snapshot:
+        raise HTTPException(
+            status_code=400,
+            detail="Failed to load Google Sheet. Ensure the sheet ID and permissions are correct.",
+        )
+
+    feed_filter = {
+        **DEFAULT_FEED_FILTER,
+        "searchText": searchText.strip(),
+        "categories": _trimmed_unique(categories),
+        "jurisdictions": _trimmed_unique(jurisdictions),
+        "injury": injury,
+        "propertyDamage": propertyDamage,
+        "incidentIds": _trimmed_unique(incidentIds),
+    }
+    sort_fields = _split_csv(sort)
+    projection = _split_csv(fields) or None
+
+    etag = content_etag(
+        snapshot["version"], feed_filter, sort_fields, order, projection, cursor, limit, includeMetrics
+    )
+    if etag_matches(http_request, etag):
+        return not_modified(etag)
+
+    try:
+        page = await _run_blocking(
+            query_cases,
+            snapshot["cases"],
+            feed_filter,
+            version=f"snapshot:{snapshot['version']}",
+            sort_fields=sort_fields,
+            descending=order == "desc",
+            fields=projection,
+            cursor=cursor,
+            limit=limit,
+        )
+    except InvalidCursorError as exc:
+        raise HTTPException(status_code=400, detail=str(exc))
+    except ValueError as exc:
+        raise HTTPException(status_code=400, detail=str(exc))
+
+    content = {"success": True, "syncVersion": snapshot["version"], "feedFilter": feed_filter, **page}
+    if includeMetrics:
+        content["metrics"] = await _run_blocking(filtered_metrics, snapshot, feed_filter)
+    return await _run_blocking(json_response, http_request, content, etag=etag)
+
+
+@app.get("/cases/search")
+async def search_sheet_cases(
+    http_request: Request,
+    sheet_id: str,
+    q: str,
+    sheet_name: Optional[str] = None,
+    limit: int = Query(default=20, ge=1, le=RANKED_RESULTS_LIMIT),
+    categories: List[str] = Query(default=[]),
+    jurisdictions: List[str] = Query(default=[]),
+    injury: Optional[bool] = None,
+    propertyDamage: Optional[bool] = None,
+):
+    """The ``limit`` cases best matching ``q``, ranked by BM25 over the searchable fields.
+
+    Matching follows the live feed filter (every term of ``q`` must occur);
+    the remaining parameters narrow the matches as they do for ``/cases``.
+    """
+    if not q.strip():
+        raise HTTPException(status_code=400, detail="q must not be empty.")
+
+    snapshot = await _sheet_snapshot(sheet_id, sheet_name)
+    if not snapshot:
+        raise HTTPException(
+            status_code=400,
+            detail="Failed to load Google Sheet. Ensure the sheet ID and permissions are correct.",
+        )
+
+    feed_filter = {
+        **DEFAULT_FEED_FILTER,
+        "searchText": q.strip(),
+        "categories": _trimmed_unique(categories),
+        "jurisdictions": _trimmed_unique(jurisdictions),
+        "injury": injury,
+        "propertyDamage": propertyDamage,
+        "sort": "relevance",
+    }
+
+    etag = content_etag(snapshot["version"], feed_filter, limit)
+    if etag_matches(http_request, etag):
+        return not_modified(etag)
+
+    results = await _run_blocking(
+        search_cases,
+        snapshot["cases"],
+        feed_filter,
+        version=f"snapshot:{snapshot['version']}",
+        limit=limit,
+    )
+    content = {"success": True, "syncVersion": snapshot["version"], "feedFilter": feed_filter, **results}
+    return await _run_blocking(json_response, http_request, content, etag=etag)
+
+
+@app.get("/cases/similar")
+async def similar_cases(
+    sheet_id: str,
+    sheet_name: Optional[str] = None,
+    text: Optional[str] = None,
+    incidentId: Optional[str] = None,
+    limit: int = Query(default=5, ge=1, le=SIMILARITY_LIMIT_MAX),
+):
+    """Cases whose incident descriptions are most similar to ``text`` or to case ``incidentId``.
+
+    Uses a local hashed TF-IDF index that is updated with each sync of the tab;
+    no external service is involved.
+    """
+    if not (text and text.strip()) and not incidentId:
+        raise HTTPException(status_code=400, detail="Provide text or incidentId.")
+
+    snapshot = await _sheet_snapshot(sheet_id, sheet_name)
+    if not snapshot:
+        raise HTTPException(
+            status_code=400,
+            detail="Failed to load Google Sheet. Ensure the sheet ID and permissions are correct.",
+        )
+
+    try:
+        matches = await _run_blocking(
+            find_similar_cases,
+            snapshot["cases"],
+            key=(sheet_id, sheet_name or ""),
+            version=snapshot["version"],
+            text=text,
+            incident_id=incidentId,
+            limit=limit,
+        )
+    except ValueError as exc:
+        raise HTTPException(status_code=404 if incidentId else 400, detail=str(exc))
+
+    return JSONResponse(content={"success": True, "syncVersion": snapshot["version"], "matches": matches})
+
+
+@app.get("/live-feed/stream")
+async def live_feed_stream(
+    http_request: Request,
+    sheet_id: str,
+    sheet_name: Optional[str] = None,
+    profile_id: str = "default",
+    visible_case_limit: int = Query(default=97, ge=0),
+    cursor: Optional[str] = None,
+):
+    """Server-sent events releasing a synced tab's queued cases as they become due.
+
+    Clients viewing the same tab, profile and visible limit share one release
+    schedule. Each event carries an id; reconnecting with Last-Event-ID (or
+    ``cursor``) resumes after it, while a new client first gets a ``released``
+    event with the cases the schedule has already released. Pair with /sheets/sync ``include_queued=false``
+    so the initial payload holds only the visible cases.
+    """
+    snapshot = await _sheet_snapshot(sheet_id, sheet_name)
+    if not snapshot:
+        raise HTTPException(
+            status_code=400,
+            detail="Failed to load Google Sheet. Ensure the sheet ID and permissions are correct.",
+        )
+
+    channel = _live_feed_hub.channel(
+        (sheet_id, sheet_name or "", profile_id, visible_case_limit),
+        functools.partial(_sheet_snapshot, sheet_id, sheet_name),
+    )
+    resume_from = http_request.headers.get("last-event-id") or cursor
+
+    async def events() -> AsyncIterator[bytes]:
+        yield b"retry: 3000\n\n"
+        async for event_id, event in channel.subscribe(resume_from):
+            if event["type"] == "heartbeat":
+                yield b": keep-alive\n\n"
+                continue
+            yield sse_message(event, encode_json(event), event_id)
+
+    return StreamingResponse(
+        events(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+@app.get("/live-feed/status")
+async def live_feed_status():
+    """Report the live feed channels and how many clients each one serves."""
+    return JSONResponse(content={"success": True, **_live_feed_hub.stats()})
+
+
 @app.get("/profile")
-async def profile_endpoint():
-    """Return the current lawyer profile."""
+async def profile_endpoint(profile_id: str = "default"):
+    """Return a lawyer profile (the default profile unless profile_id is given)."""
     try:
-        profile = get_profile()
+        profile = get_profile(profile_id)
         return JSONResponse(content={"success": True, "profile": profile})
     except Exception as exc:  # pragma: no cover - defensive logging
         raise HTTPException(status_code=500, detail=f"Failed to load profile: {exc}")
@@ -155,7 +733,9 @@ async def profile_endpoint():
 async def update_triage(request: TriageUpdateRequest):
     """Update triage preferences stored on the backend."""
     try:
-        updated_profile = update_triage_preferences(request.preferences.dict())
+        updated_profile = update_triage_preferences(
+            request.preferences.dict(), profile_id=request.profile_id
+        )
         return JSONResponse(
             content={
                 "success": True,
@@ -167,6 +747,38 @@ async def update_triage(request: TriageUpdateRequest):
         raise HTTPException(status_code=500, detail=f"Failed to update triage preferences: {exc}")
 
 
+@app.get("/profiles")
+async def list_profiles_endpoint():
+    """Return every lawyer profile known to the backend."""
+    profiles = list_profiles()
+    return JSONResponse(content={"success": True, "profiles": profiles, "count": len(profiles)})
+
+
+@app.put("/profiles/{profile_id}")
+async def upsert_profile_endpoint(profile_id: str, request: ProfileUpsertRequest):
+    """Create a lawyer profile or update its name, email or triage preferences."""
+    try:
+        profile = upsert_profile(
+            profile_id,
+            display_name=request.displayName,
+            email=request.email,
+            triage_preferences=(
+                request.triagePreferences.dict() if request.triagePreferences else None
+            ),
+        )
+        return JSONResponse(content={"success": True, "profile": profile})
+    except Exception as exc:  # pragma: no cover - defensive logging
+        raise HTTPException(status_code=500, detail=f"Failed to save profile: {exc}")
+
+
+@app.delete("/profiles/{profile_id}")
+async def delete_profile_endpoint(profile_id: str):
+    """Remove a lawyer profile. The default profile cannot be removed."""
+    if not delete_profile(profile_id):
+        raise HTTPException(status_code=404, detail=f"Profile '{profile_id}' cannot be removed.")
+    return JSONResponse(content={"success": True, "profileId": profile_id})
+
+
 @app.post("/voice/call")
 async def initiate_voice_call(request: VoiceCallRequestModel):
     """Kick off a Vapi outbound call for the selected case."""
@@ -179,6 +791,10 @@ async def initiate_voice_call(request: VoiceCallRequestModel):
             incident_summary=request.incident_summary,
         )
         return JSONResponse(content=result)
+    except VoiceCallUpstreamError as exc:
+        raise HTTPException(status_code=502, detail=str(exc))
+    except VoiceCallOutcomeUnknownError as exc:
+        raise HTTPException(status_code=504, detail=str(exc))
     except VoiceCallRequestError as exc:
         raise HTTPException(status_code=400, detail=str(exc))
     except VoiceCallConfigurationError as exc:
@@ -186,3 +802,46 @@ async def initiate_voice_call(request: VoiceCallRequestModel):
     except Exception as exc:  # pragma: no cover - defensive logging
         print(f"Voice call error: {exc}")
         raise HTTPException(status_code=500, detail="Failed to initiate voice call.")
+
+
+@app.post("/voice/calls", status_code=202)
+async def queue_voice_calls(request: VoiceCallBatchRequest):
+    """Queue outbound calls for several cases; poll /voice/calls/{jobId} for progress.
+
+    Calls are placed in the background with bounded concurrency and a rate
+    limit, and retried with backoff when Vapi cannot be reached or answers 429
+    or 503. A call whose request went out unanswered ends as ``unknown``.
+    """
+    if len(request.calls) > VOICE_CALL_BATCH_MAX:
+        raise HTTPException(
+            status_code=400,
+            detail=f"At most {VOICE_CALL_BATCH_MAX} calls can be queued at once.",
+        )
+    try:
+        batch = _voice_call_queue.submit([call.model_dump() for call in request.calls])
+    except VoiceCallRequestError as exc:
+        raise HTTPException(status_code=400, detail=str(exc))
+    except VoiceCallConfigurationError as exc:
+        raise HTTPException(status_code=500, detail=str(exc))
+    return JSONResponse(status_code=202, content=batch)
+
+
+@app.get("/voice/calls")
+async def voice_call_batch_status(batch_id: str = Query(alias="batchId")):
+    """Status of every job in a queued batch."""
+    jobs = _voice_call_queue.batch(batch_id)
+    if not jobs:
+        raise HTTPException(status_code=404, detail=f"Unknown batch '{batch_id}'.")
+    counts: Dict[str, int] = {}
+    for job in jobs:
+        counts[job["status"]] = counts.get(job["status"], 0) + 1
+    return JSONResponse(content={"batchId": batch_id, "counts": counts, "jobs": jobs})
+
+
+@app.get("/voice/calls/{job_id}")
+async def voice_call_job_status(job_id: str):
+    """Status of one queued call."""
+    job = _voice_call_queue.job(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail=f"Unknown voice call job '{job_id}'.")
+    return JSONResponse(content=job)
@@ -0,0 +1,147 @@
+"""SQLite-backed copy of parsed sheet snapshots, so restarts start warm."""
+
+from __future__ import annotations
+
+import json
+import os
+import sqlite3
+import threading
+import time
+import zlib
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+from .case_store import CaseStore
+
+# Where parsed snapshots are persisted. Set SHEETS_CACHE_PATH="" to disable.
+SHEETS_CACHE_PATH = os.getenv(
+    "SHEETS_CACHE_PATH", str(Path(__file__).resolve().parents[1] / ".cache" / "sheets.sqlite3")
+)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS sheet_snapshots (
+    spreadsheet_id TEXT NOT NULL,
+    sheet_name TEXT NOT NULL,
+    revision TEXT NOT NULL,
+    saved_at REAL NOT NULL,
+    payload BLOB NOT NULL,
+    PRIMARY KEY (spreadsheet_id, sheet_name)
+)
+"""
+
+# Snapshot keys written to disk; everything else is derived on load.
+_PERSISTED_KEYS = ("sheetData", "rowPositions", "fingerprints", "headerHash", "version")
+
+
+def _encode_snapshot(snapshot: Dict[str, Any]) -> bytes:
+    payload = {key: snapshot.get(key) for key in _PERSISTED_KEYS}
+    payload["cases"] = snapshot["cases"].to_columns()
+    return zlib.compress(json.dumps(payload, separators=(",", ":")).encode("utf-8"), 3)
+
+
+def _decode_snapshot(blob: bytes) -> Dict[str, Any]:
+    payload = json.loads(zlib.decompress(blob).decode("utf-8"))
+    payload["cases"] = CaseStore.from_columns(payload["cases"])
+    payload["parsedRows"] = 0
+    payload["parsedPositions"] = []
+    return payload
+
+
+class SheetSnapshotCache:
+    """Latest parsed snapshot per (spreadsheet_id, sheet_name), with its revision.
+
+    The revision is the snapshot's ``version`` (a hash over the header and
+    every row), so a stored entry can be checked against a fresh fetch without
+    re-parsing it. Each call opens its own connection, which keeps the cache
+    usable from the sync worker threads.
+    """
+
+    def __init__(self, path: Optional[str]) -> None:
+        self.path = path or None
+        self._lock = threading.Lock()
+        self._ready = False
+        self.hits = 0
+        self.misses = 0
+        self.writes = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self.path is not None
+
+    def _connect(self) -> sqlite3.Connection:
+        connection = sqlite3.connect(self.path, timeout=10)
+        if not self._ready:
+            with self._lock:
+                connection.execute(_SCHEMA)
+                connection.commit()
+                self._ready = True
+        return connection
+
+    def load(
+        self, spreadsheet_id: str, sheet_name: str, revision: Optional[str] = None
+    ) -> Optional[Dict[str, Any]]:
+        """Return the stored snapshot, optionally only if it has ``revision``."""
+        if not self.enabled:
+            return None
+        try:
+            connection = self._connect()
+            try:
+                row = connection.execute(
+                    "SELECT revision, saved_at, payload FROM sheet_snapshots "
+                    "WHERE spreadsheet_id = ? AND sheet_name = ?",
+                    (spreadsheet_id, sheet_name),
+                ).fetchone()
+            finally:
+                connection.close()
+            if row is None or (revision is not None and row[0] != revision):
+                self.misses += 1
+                return None
+            snapshot = _decode_snapshot(row[2])
+        except Exception as exc:  # pragma: no cover - defensive logging
+            print(f"Error reading sheet cache: {exc}")
+            self.misses += 1
+            return None
+        snapshot["cachedAt"] = row[1]
+        self.hits += 1
+        return snapshot
+
+    def save(self, spreadsheet_id: str, sheet_name: str, snapshot: Dict[str, Any]) -> None:
+        if not self.enabled:
+            return
+        try:
+            blob = _encode_snapshot(snapshot)
+            Path(self.path).parent.mkdir(parents=True, exist_ok=True)
+            connection = self._connect()
+            try:
+                with connection:
+                    connection.execute(
+                        "INSERT OR REPLACE INTO sheet_snapshots "
+                        "(spreadsheet_id, sheet_name, revision, saved_at, payload) VALUES (?, ?, ?, ?, ?)",
+                        (spreadsheet_id, sheet_name, snapshot["version"], time.time(), blob),
+                    )
+            finally:
+                connection.close()
+            self.writes += 1
+        except Exception as exc:  # pragma: no cover - defensive logging
+            print(f"Error writing sheet cache: {exc}")
+
+    def clear(self) -> None:
+        if not self.enabled or not Path(self.path).exists():
+            return
+        connection = self._connect()
+        try:
+            with connection:
+                connection.execute("DELETE FROM sheet_snapshots")
+        finally:
+            connection.close()
+
+    def stats(self) -> Dict[str, Any]:
+        lookups = self.hits + self.misses
+        return {
+            "enabled": self.enabled,
+            "path": self.path,
+            "hits": self.hits,
+            "misses": self.misses,
+            "writes": self.writes,
+            "hitRate": (self.hits / lookups) if lookups else 0.0,
+        }
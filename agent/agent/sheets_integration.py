@@ -2,13 +2,27 @@
 
 from __future__ import annotations
 
+from collections import OrderedDict
 from datetime import datetime
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple, Union
+import csv
+import hashlib
+import json
 import os
+import re
+import threading
+import time
 
 from dotenv import load_dotenv
 
+from .cache import TTLCache
+from .case_sources import CaseSourceError, LocalFileSource, canonical_headers, resolve_case_source
+from .case_store import CaseRecord, CaseStore, case_column
+from .feed_filter import get_case_index
+from .metrics import CaseMetrics
 from .profile import get_profile
+from .sheet_cache import SHEETS_CACHE_PATH, SheetSnapshotCache
+from .triage import compile_triage_preferences, get_subscription_index
 
 load_dotenv()
 
@@ -32,21 +46,55 @@ EXPECTED_COLUMNS: Tuple[str, ...] = (
 
 BOOLEAN_TRUE_VALUES = {"yes", "true", "y", "1", "t"}
 
+# An ``injury_severity`` column stands in for injury_reported when the sheet has
+# no injury_reported column; every severity except these counts as an injury.
+NO_INJURY_SEVERITY_VALUES = {"", "none", "no", "n/a", "na"}
+
+# A ``driver_at_fault`` column stands in for fault_determination when the sheet
+# has none; its yes/no answers are spelled out, other values are kept as is.
+DRIVER_AT_FAULT_VALUES = {
+    "yes": "Driver at fault",
+    "no": "Driver not at fault",
+}
+
+
+SPREADSHEET_INFO_TTL_SECONDS = float(os.getenv("SHEETS_INFO_CACHE_TTL_SECONDS", "60"))
+
+_composio_client: Any = None
+_composio_user_id: Optional[str] = None
+_composio_lock = threading.Lock()
+
+# Spreadsheet metadata (tab titles, grid properties) keyed by spreadsheet_id.
+_spreadsheet_info_cache = TTLCache(SPREADSHEET_INFO_TTL_SECONDS)
+
 
 def get_composio_client():
-    """Initialize Composio client for direct API calls."""
-    try:
-        from composio import Composio  # type: ignore
+    """Return the process-wide Composio client, creating it on first use."""
+    global _composio_client, _composio_user_id
 
-        user_id = os.getenv("COMPOSIO_USER_ID", "default")
-        return Composio(), user_id
-    except Exception as exc:  # pragma: no cover - defensive logging
-        print(f"Failed to initialize Composio client: {exc}")
-        return None, None
+    if _composio_client is not None:
+        return _composio_client, _composio_user_id
 
+    with _composio_lock:
+        if _composio_client is None:
+            try:
+                from composio import Composio  # type: ignore
+
+                _composio_client = Composio()
+                _composio_user_id = os.getenv("COMPOSIO_USER_ID", "default")
+            except Exception as exc:  # pragma: no cover - defensive logging
+                print(f"Failed to initialize Composio client: {exc}")
+                return None, None
+    return _composio_client, _composio_user_id
+
+
+def get_spreadsheet_info(sheet_id: str, *, refresh: bool = False) -> Optional[Dict[str, Any]]:
+    """Return spreadsheet metadata, served from the TTL cache when possible."""
+    if not refresh:
+        cached = _spreadsheet_info_cache.get(sheet_id)
+        if cached is not None:
+            return cached
 
-def get_sheet_names(sheet_id: str) -> Optional[List[str]]:
-    """Return the list of sheet tab names for the given spreadsheet."""
     composio, user_id = get_composio_client()
     if not composio or not user_id:
         return None
@@ -57,98 +105,211 @@ def get_sheet_names(sheet_id: str) -> Optional[List[str]]:
             slug="GOOGLESHEETS_GET_SPREADSHEET_INFO",
             arguments={"spreadsheet_id": sheet_id},
         )
-
         if not result or not result.get("successful"):
+            print(f"Failed to get spreadsheet info: {result}")
             return None
 
         sheet_info = result.get("data", {}).get("response_data", {})
-        sheets = sheet_info.get("sheets", [])
-        return [s.get("properties", {}).get("title", "Untitled") for s in sheets]
+        _spreadsheet_info_cache.set(sheet_id, sheet_info)
+        return sheet_info
 
     except Exception as exc:  # pragma: no cover - defensive logging
-        print(f"Error getting sheet names: {exc}")
+        print(f"Error getting spreadsheet info: {exc}")
         return None
 
 
-def get_sheet_data(sheet_id: str, sheet_name: Optional[str] = None) -> Optional[Dict[str, Any]]:
-    """Fetch spreadsheet metadata and rows for the requested tab."""
-    composio, user_id = get_composio_client()
-    if not composio or not user_id:
+def invalidate_spreadsheet_info(sheet_id: Optional[str] = None) -> None:
+    """Forget cached metadata for one spreadsheet, or for all of them."""
+    _spreadsheet_info_cache.invalidate(sheet_id)
+
+
+def get_spreadsheet_info_cache_stats() -> Dict[str, Any]:
+    """Hit/miss counters for the spreadsheet metadata cache."""
+    return _spreadsheet_info_cache.stats()
+
+
+def _sheet_titles(sheet_info: Dict[str, Any]) -> List[str]:
+    return [s.get("properties", {}).get("title", "Untitled") for s in sheet_info.get("sheets", [])]
+
+
+def get_sheet_names(sheet_id: str) -> Optional[List[str]]:
+    """Return the list of sheet tab names for the given spreadsheet."""
+    source = resolve_case_source(sheet_id)
+    if source is not None:
+        return source.sheet_names()
+
+    sheet_info = get_spreadsheet_info(sheet_id)
+    if sheet_info is None:
         return None
+    return _sheet_titles(sheet_info)
 
-    try:
-        info_result = composio.tools.execute(
-            user_id=user_id,
-            slug="GOOGLESHEETS_GET_SPREADSHEET_INFO",
-            arguments={"spreadsheet_id": sheet_id},
+
+def _select_sheet(
+    sheet_id: str, sheet_name: Optional[str]
+) -> Optional[Tuple[Dict[str, Any], Dict[str, Any], str]]:
+    """Resolve the requested tab to (spreadsheet info, sheet entry, tab title)."""
+    sheet_info = get_spreadsheet_info(sheet_id)
+    if sheet_info is None:
+        return None
+
+    sheets = sheet_info.get("sheets", [])
+    if not sheets:
+        return None
+
+    if not sheet_name:
+        selected_sheet = sheets[0]
+        return sheet_info, selected_sheet, selected_sheet.get("properties", {}).get("title", "Sheet1")
+
+    selected_sheet = next(
+        (s for s in sheets if s.get("properties", {}).get("title") == sheet_name),
+        None,
+    )
+    if selected_sheet is None:
+        # The tab may have been added since the metadata was cached.
+        sheet_info = get_spreadsheet_info(sheet_id, refresh=True) or sheet_info
+        selected_sheet = next(
+            (s for s in sheet_info.get("sheets", []) if s.get("properties", {}).get("title") == sheet_name),
+            None,
         )
-        if not info_result or not info_result.get("successful"):
-            print(f"Failed to get spreadsheet info: {info_result}")
-            return None
+    if selected_sheet is None:
+        available = _sheet_titles(sheet_info)
+        print(f"Sheet '{sheet_name}' not found in spreadsheet. Available: {available}")
+        return None
+    return sheet_info, selected_sheet, sheet_name
+
 
-        sheet_info = info_result.get("data", {}).get("response_data", {})
-        sheets = sheet_info.get("sheets", [])
-        if not sheets:
+def sheet_change_signature(sheet_id: str, sheet_name: Optional[str] = None) -> Optional[str]:
+    """A cheap fingerprint of a tab that changes when the tab is likely to have changed.
+
+    For Google Sheets this is a hash of freshly fetched spreadsheet metadata
+    (spreadsheet properties plus the tab's properties and grid size), one
+    GOOGLESHEETS_GET_SPREADSHEET_INFO call instead of a full BATCH_GET. Edits
+    that leave the grid size alone do not change it, so callers should still
+    fetch periodically. Local file sources use the file's size and mtime.
+    """
+    source = resolve_case_source(sheet_id)
+    if source is not None:
+        try:
+            stat = source.path.stat()
+        except OSError as exc:
+            print(f"Error checking case source {source.path}: {exc}")
             return None
+        return f"file:{stat.st_size}:{stat.st_mtime_ns}"
 
-        if sheet_name:
-            selected_sheet = next(
-                (s for s in sheets if s.get("properties", {}).get("title") == sheet_name),
-                None,
-            )
-            if selected_sheet is None:
-                available = [s.get("properties", {}).get("title", "Untitled") for s in sheets]
-                print(f"Sheet '{sheet_name}' not found in spreadsheet. Available: {available}")
-                return None
-            target_sheet_name = sheet_name
-        else:
-            selected_sheet = sheets[0]
-            target_sheet_name = selected_sheet.get("properties", {}).get("title", "Sheet1")
+    sheet_info = get_spreadsheet_info(sheet_id, refresh=True)
+    if sheet_info is None:
+        return None
+    selection = _select_sheet(sheet_id, sheet_name)
+    if selection is None:
+        return None
+    _, selected_sheet, _ = selection
+    signature = json.dumps(
+        {
+            "spreadsheet": sheet_info.get("properties", {}),
+            "sheet": selected_sheet,
+            "tabs": _sheet_titles(sheet_info),
+        },
+        sort_keys=True,
+        default=str,
+    )
+    return hashlib.blake2b(signature.encode("utf-8"), digest_size=12).hexdigest()
 
-        values_result = composio.tools.execute(
-            user_id=user_id,
-            slug="GOOGLESHEETS_BATCH_GET",
-            arguments={
-                "spreadsheet_id": sheet_id,
-                "ranges": [f"{target_sheet_name}!A:Z"],
-            },
-        )
-        if not values_result or not values_result.get("successful"):
-            print(f"Failed to get sheet values: {values_result}")
+
+def _sheet_metadata(sheet_id: str, sheet_info: Dict[str, Any], sheet_name: str) -> Dict[str, Any]:
+    return {
+        "spreadsheet_info": sheet_info,
+        "spreadsheet_id": sheet_id,
+        "sheet_name": sheet_name,
+        "title": sheet_info.get("properties", {}).get("title", "Untitled"),
+        "available_sheets": _sheet_titles(sheet_info),
+    }
+
+
+def _batch_get_values(composio: Any, user_id: str, sheet_id: str, a1_range: str) -> Optional[List[List[str]]]:
+    values_result = composio.tools.execute(
+        user_id=user_id,
+        slug="GOOGLESHEETS_BATCH_GET",
+        arguments={
+            "spreadsheet_id": sheet_id,
+            "ranges": [a1_range],
+        },
+    )
+    if not values_result or not values_result.get("successful"):
+        print(f"Failed to get sheet values: {values_result}")
+        return None
+
+    sheet_ranges = values_result.get("data", {}).get("valueRanges", [])
+    if not sheet_ranges:
+        return None
+    return sheet_ranges[0].get("values", [])
+
+
+def get_sheet_data(sheet_id: str, sheet_name: Optional[str] = None) -> Optional[Dict[str, Any]]:
+    """Fetch spreadsheet metadata and rows for the requested tab.
+
+    ``file:`` sheet ids are read from a local CSV/NDJSON file instead; one that
+    names no readable file raises CaseSourceError.
+    """
+    source = resolve_case_source(sheet_id)
+    if source is not None:
+        return _read_local_source(source, sheet_name)
+
+    composio, user_id = get_composio_client()
+    if not composio or not user_id:
+        return None
+
+    try:
+        selection = _select_sheet(sheet_id, sheet_name)
+        if selection is None:
             return None
+        sheet_info, _, target_sheet_name = selection
 
-        values_data = values_result.get("data", {})
-        sheet_ranges = values_data.get("valueRanges", [])
-        if not sheet_ranges:
+        rows = _batch_get_values(composio, user_id, sheet_id, f"{target_sheet_name}!A:Z")
+        if rows is None:
             return None
 
-        return {
-            "spreadsheet_info": sheet_info,
-            "spreadsheet_id": sheet_id,
-            "sheet_name": target_sheet_name,
-            "rows": sheet_ranges[0].get("values", []),
-            "title": sheet_info.get("properties", {}).get("title", "Untitled"),
-            "available_sheets": [s.get("properties", {}).get("title", "Untitled") for s in sheets],
-        }
+        return {**_sheet_metadata(sheet_id, sheet_info, target_sheet_name), "rows": rows}
     except Exception as exc:  # pragma: no cover - defensive logging
         print(f"Error fetching sheet data: {exc}")
         return None
 
 
-def normalize_header(value: str) -> str:
-    return value.strip().lower().replace(" ", "_")
-
-
 def parse_boolean(value: Optional[str]) -> bool:
     if value is None:
         return False
     return value.strip().lower() in BOOLEAN_TRUE_VALUES
 
 
+def parse_injury_severity(value: Optional[str]) -> bool:
+    if value is None:
+        return False
+    return value.strip().lower() not in NO_INJURY_SEVERITY_VALUES
+
+
+def driver_at_fault_to_determination(value: str) -> str:
+    if not value:
+        return ""
+    return DRIVER_AT_FAULT_VALUES.get(value.strip().lower(), value)
+
+
+DATE_FORMATS: Tuple[str, ...] = ("%Y-%m-%d", "%m/%d/%Y", "%m-%d-%Y", "%d/%m/%Y", "%d-%m-%Y")
+TIME_FORMATS: Tuple[str, ...] = ("%H:%M", "%H:%M:%S", "%I:%M %p", "%I:%M%p", "%I%p")
+
+
+def _read_local_source(source: LocalFileSource, sheet_name: Optional[str]) -> Optional[Dict[str, Any]]:
+    if not source.accepts(sheet_name):
+        return None
+    try:
+        return source.read()
+    except Exception as exc:  # pragma: no cover - defensive logging
+        print(f"Error reading case source {source.path}: {exc}")
+        return None
+
+
 def normalize_date(value: str) -> str:
     if not value:
         return ""
-    for fmt in ("%Y-%m-%d", "%m/%d/%Y", "%m-%d-%Y", "%d/%m/%Y", "%d-%m-%Y"):
+    for fmt in DATE_FORMATS:
         try:
             return datetime.strptime(value, fmt).strftime("%Y-%m-%d")
         except ValueError:
@@ -160,8 +321,7 @@ def normalize_time(value: str) -> str:
     if not value:
         return ""
     value = value.strip()
-    time_formats = ("%H:%M", "%H:%M:%S", "%I:%M %p", "%I:%M%p", "%I%p")
-    for fmt in time_formats:
+    for fmt in TIME_FORMATS:
         try:
             return datetime.strptime(value, fmt).strftime("%H:%M")
         except ValueError:
@@ -169,6 +329,171 @@ def normalize_time(value: str) -> str:
     return value
 
 
+# ---------------------------------------------------------------------------- #
+# Per-column format inference
+# ---------------------------------------------------------------------------- #
+
+# Rows sampled per column to pick its date/time format.
+FORMAT_SAMPLE_SIZE = 64
+
+# Regex equivalents of the strptime directives used in DATE_FORMATS/TIME_FORMATS.
+_DIRECTIVE_PATTERNS = {
+    "%Y": r"(?P<Y>\d\d\d\d)",
+    "%m": r"(?P<m>1[0-2]|0[1-9]|[1-9])",
+    "%d": r"(?P<d>3[01]|[12]\d|0[1-9]|[1-9]| [1-9])",
+    "%H": r"(?P<H>2[0-3]|[0-1]\d|\d)",
+    "%I": r"(?P<I>1[0-2]|0[1-9]|[1-9])",
+    "%M": r"(?P<M>[0-5]\d|\d)",
+    "%S": r"(?P<S>[0-5]\d|\d)",
+    "%p": r"(?P<p>am|pm)",
+}
+_DAYS_IN_MONTH = (31, 29, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31)
+
+
+def _compile_format(fmt: str) -> "re.Pattern[str]":
+    pattern = re.sub(r"\s+", r"\\s+", fmt)
+    for directive, regex in _DIRECTIVE_PATTERNS.items():
+        pattern = pattern.replace(directive, regex)
+    return re.compile(pattern, re.IGNORECASE)
+
+
+def _date_parser(fmt: str) -> Callable[[str], Optional[str]]:
+    """Regex-based equivalent of ``strptime(value, fmt)`` that returns None on a miss."""
+    matcher = _compile_format(fmt).fullmatch
+
+    def parse(value: str) -> Optional[str]:
+        match = matcher(value)
+        if match is None:
+            return None
+        year, month, day = int(match["Y"]), int(match["m"]), int(match["d"])
+        if year < 1000:
+            # strptime rejects year 0 and strftime pads earlier years per platform;
+            # leave those to the normalize_date fallback.
+            return None
+        if day > _DAYS_IN_MONTH[month - 1] or (
+            month == 2 and day == 29 and not (year % 4 == 0 and (year % 100 != 0 or year % 400 == 0))
+        ):
+            return None
+        return f"{year:04d}-{month:02d}-{day:02d}"
+
+    return parse
+
+
+def _time_parser(fmt: str) -> Callable[[str], Optional[str]]:
+    """Regex-based equivalent of ``strptime(value, fmt)`` that returns None on a miss."""
+    matcher = _compile_format(fmt).fullmatch
+
+    def parse(value: str) -> Optional[str]:
+        match = matcher(value.strip())
+        if match is None:
+            return None
+        groups = match.groupdict()
+        if groups.get("H") is not None:
+            hour = int(groups["H"])
+        else:
+            hour = int(groups["I"]) % 12 + (12 if groups["p"].lower() == "pm" else 0)
+        minute = int(groups["M"]) if groups.get("M") is not None else 0
+        return f"{hour:02d}:{minute:02d}"
+
+    return parse
+
+
+_DATE_PARSERS = {fmt: _date_parser(fmt) for fmt in DATE_FORMATS}
+_TIME_PARSERS = {fmt: _time_parser(fmt) for fmt in TIME_FORMATS}
+
+
+def _infer_format(
+    samples: List[str], parsers: Dict[str, Callable[[str], Optional[str]]]
+) -> Optional[str]:
+    """Pick the first format (in priority order) that parses the most samples."""
+    best_format: Optional[str] = None
+    best_hits = 0
+    for fmt, parse in parsers.items():
+        hits = sum(1 for sample in samples if parse(sample) is not None)
+        if hits > best_hits:
+            best_format, best_hits = fmt, hits
+        if hits == len(samples):
+            break
+    return best_format
+
+
+def _column_parser(
+    fmt: Optional[str],
+    parsers: Dict[str, Callable[[str], Optional[str]]],
+    fallback: Callable[[str], str],
+) -> Callable[[str], str]:
+    if fmt is None:
+        return fallback
+    parse = parsers[fmt]
+
+    def parse_column_value(value: str) -> str:
+        if not value:
+            return ""
+        parsed = parse(value)
+        # Values that do not fit the column's format go through the full chain.
+        return parsed if parsed is not None else fallback(value)
+
+    return parse_column_value
+
+
+def _boolean_column_parser(
+    parse: Callable[[Optional[str]], bool] = parse_boolean,
+) -> Callable[[Optional[str]], bool]:
+    """``parse`` memoized on the raw cell, since columns reuse a few spellings."""
+    seen: Dict[Optional[str], bool] = {}
+
+    def parse_column_value(value: Optional[str]) -> bool:
+        parsed = seen.get(value)
+        if parsed is None:
+            parsed = parse(value)
+            if len(seen) < 256:
+                seen[value] = parsed
+        return parsed
+
+    return parse_column_value
+
+
+class ColumnParsers:
+    """Date, time and boolean parsers chosen once for a sheet's columns."""
+
+    def __init__(self, date_format: Optional[str] = None, time_format: Optional[str] = None) -> None:
+        self.date_format = date_format
+        self.time_format = time_format
+        self.incident_date = _column_parser(date_format, _DATE_PARSERS, normalize_date)
+        self.incident_time = _column_parser(time_format, _TIME_PARSERS, normalize_time)
+        self.injury_reported = _boolean_column_parser()
+        self.injury_severity = _boolean_column_parser(parse_injury_severity)
+        self.property_damage = _boolean_column_parser()
+
+
+def infer_column_parsers(
+    rows: Iterable[List[str]], headers: List[str], sample_size: int = FORMAT_SAMPLE_SIZE
+) -> ColumnParsers:
+    """Sample the date and time columns and pick one format for each."""
+    positions = {header: idx for idx, header in enumerate(headers)}
+    date_idx = positions.get("incident_date")
+    time_idx = positions.get("incident_time")
+
+    date_samples: List[str] = []
+    time_samples: List[str] = []
+    for row in rows:
+        if date_idx is not None and date_idx < len(row):
+            value = str(row[date_idx]).strip()
+            if value and len(date_samples) < sample_size:
+                date_samples.append(value)
+        if time_idx is not None and time_idx < len(row):
+            value = str(row[time_idx]).strip()
+            if value and len(time_samples) < sample_size:
+                time_samples.append(value)
+        if len(date_samples) >= sample_size and len(time_samples) >= sample_size:
+            break
+
+    return ColumnParsers(
+        _infer_format(date_samples, _DATE_PARSERS) if date_samples else None,
+        _infer_format(time_samples, _TIME_PARSERS) if time_samples else None,
+    )
+
+
 def derive_jurisdiction(incident_id: str, location: str) -> str:
     if incident_id and "-" in incident_id:
         return incident_id.split("-", 1)[0].upper()
@@ -183,7 +508,11 @@ def standardize_category(value: str) -> str:
     return value.strip().title()
 
 
-def row_to_case(row_values: List[str], headers: List[str]) -> Optional[Dict[str, Any]]:
+def row_to_case(
+    row_values: List[str],
+    headers: List[str],
+    parsers: Optional[ColumnParsers] = None,
+) -> Optional[Dict[str, Any]]:
     # Skip empty rows
     if not row_values or not any(cell.strip() for cell in row_values if isinstance(cell, str)):
         return None
@@ -202,23 +531,51 @@ def row_to_case(row_values: List[str], headers: List[str]) -> Optional[Dict[str,
     location = row_map.get("location", "")
     incident_category = standardize_category(row_map.get("incident_category", ""))
 
-    return {
-        "incidentId": incident_id,
-        "fullName": row_map.get("full_name", ""),
-        "sex": row_map.get("sex", ""),
-        "homeAddress": row_map.get("home_address", ""),
-        "phoneNumber": row_map.get("phone_number", ""),
-        "incidentDate": normalize_date(row_map.get("incident_date", "")),
-        "incidentTime": normalize_time(row_map.get("incident_time", "")),
-        "location": location,
-        "incidentCategory": incident_category,
-        "resolution": row_map.get("resolution", ""),
-        "injuryReported": parse_boolean(row_map.get("injury_reported")),
-        "propertyDamage": parse_boolean(row_map.get("property_damage")),
-        "faultDetermination": row_map.get("fault_determination", ""),
-        "incidentDescription": row_map.get("incident_description", ""),
-        "jurisdiction": derive_jurisdiction(incident_id, location),
-    }
+    if parsers is None:
+        parse_date, parse_time = normalize_date, normalize_time
+        parse_injury = parse_property_damage = parse_boolean
+        parse_severity = parse_injury_severity
+    else:
+        parse_date, parse_time = parsers.incident_date, parsers.incident_time
+        parse_injury, parse_property_damage = parsers.injury_reported, parsers.property_damage
+        parse_severity = parsers.injury_severity
+
+    if "injury_reported" not in row_map and "injury_severity" in row_map:
+        injury_reported = parse_severity(row_map["injury_severity"])
+    else:
+        injury_reported = parse_injury(row_map.get("injury_reported"))
+    if "fault_determination" not in row_map and "driver_at_fault" in row_map:
+        fault_determination = driver_at_fault_to_determination(row_map["driver_at_fault"])
+    else:
+        fault_determination = row_map.get("fault_determination", "")
+
+    return CaseRecord(
+        incidentId=incident_id,
+        fullName=row_map.get("full_name", ""),
+        sex=row_map.get("sex", ""),
+        homeAddress=row_map.get("home_address", ""),
+        phoneNumber=row_map.get("phone_number", ""),
+        incidentDate=parse_date(row_map.get("incident_date", "")),
+        incidentTime=parse_time(row_map.get("incident_time", "")),
+        location=location,
+        incidentCategory=incident_category,
+        resolution=row_map.get("resolution", ""),
+        injuryReported=injury_reported,
+        propertyDamage=parse_property_damage(row_map.get("property_damage")),
+        faultDetermination=fault_determination,
+        incidentDescription=row_map.get("incident_description", ""),
+        jurisdiction=derive_jurisdiction(incident_id, location),
+    )
+
+
+def _split_header(rows: List[List[str]]) -> Tuple[List[str], List[List[str]]]:
+    headers = canonical_headers(rows[0]) if rows else []
+    # Map by name whenever the header row names the incident id column (directly
+    # or through HEADER_ALIASES); expected columns it lacks are left empty.
+    if "incident_id" in headers:
+        return headers, rows[1:]
+    # Without a recognizable header row, map expected columns in order.
+    return list(EXPECTED_COLUMNS), rows
 
 
 def parse_cases_from_sheet(sheet_data: Dict[str, Any]) -> List[Dict[str, Any]]:
@@ -226,89 +583,541 @@ def parse_cases_from_sheet(sheet_data: Dict[str, Any]) -> List[Dict[str, Any]]:
     if not rows:
         return []
 
-    headers = [normalize_header(cell) for cell in rows[0]] if rows else []
-    if headers and set(headers) >= set(EXPECTED_COLUMNS):
-        data_rows = rows[1:]
-    else:
-        # If headers are missing or partial, try to map expected columns in order.
-        headers = list(EXPECTED_COLUMNS)
-        data_rows = rows
+    headers, data_rows = _split_header(rows)
 
-    cases: List[Dict[str, Any]] = []
-    for row in data_rows:
-        case = row_to_case(row, headers)
-        if case:
-            cases.append(case)
-    return cases
+    return list(iter_cases(data_rows, headers, infer_column_parsers(data_rows, headers)))
 
 
-def summarize_cases(cases: List[Dict[str, Any]]) -> Dict[str, Any]:
-    total_injuries = sum(1 for case in cases if case.get("injuryReported"))
-    with_property_damage = sum(1 for case in cases if case.get("propertyDamage"))
-    by_category: Dict[str, int] = {}
-    for case in cases:
-        category = case.get("incidentCategory") or "Uncategorized"
-        by_category[category] = by_category.get(category, 0) + 1
+def summarize_cases(cases: Union[CaseStore, List[Dict[str, Any]]]) -> Dict[str, Any]:
+    return CaseMetrics.from_cases(cases).summary()
+
+
+def parse_case_store(sheet_data: Dict[str, Any]) -> CaseStore:
+    """Like ``parse_cases_from_sheet`` but returns the cases as a CaseStore."""
+    rows = sheet_data.get("rows", [])
+    if not rows:
+        return CaseStore()
+
+    headers, data_rows = _split_header(rows)
+    return CaseStore.from_cases(iter_cases(data_rows, headers, infer_column_parsers(data_rows, headers)))
+
+
+def evaluate_triage(
+    cases: Union[CaseStore, List[Dict[str, Any]]], preferences: Dict[str, Any]
+) -> List[Dict[str, Any]]:
+    return compile_triage_preferences(preferences).evaluate(cases)
+
+
+# ---------------------------------------------------------------------------- #
+# Paged ingestion
+# ---------------------------------------------------------------------------- #
+
+SHEETS_PAGE_SIZE = int(os.getenv("SHEETS_PAGE_SIZE", "5000"))
+
+
+class SheetFetchError(RuntimeError):
+    """Raised when a row window cannot be fetched part-way through a paged read."""
+
+
+def open_sheet_pages(
+    sheet_id: str,
+    sheet_name: Optional[str] = None,
+    *,
+    page_size: int = SHEETS_PAGE_SIZE,
+) -> Optional[Dict[str, Any]]:
+    """Resolve a tab and read its header row; data rows are fetched lazily.
+
+    Returns the tab metadata, the headers used for mapping and ``pages``, a
+    generator that requests one ``A{n}:Z{n + page_size - 1}`` window at a time,
+    so only a single window of raw rows is held in memory. ``file:`` sheet ids
+    stream ``page_size`` rows at a time from the local file.
+    """
+    source = resolve_case_source(sheet_id)
+    if source is not None:
+        return _open_local_source_pages(source, sheet_name, page_size)
+
+    composio, user_id = get_composio_client()
+    if not composio or not user_id:
+        return None
+
+    try:
+        selection = _select_sheet(sheet_id, sheet_name)
+        if selection is None:
+            return None
+        sheet_info, selected_sheet, target_sheet_name = selection
+
+        header_rows = _batch_get_values(composio, user_id, sheet_id, f"{target_sheet_name}!A1:Z1")
+        if header_rows is None:
+            return None
+    except Exception as exc:  # pragma: no cover - defensive logging
+        print(f"Error opening sheet: {exc}")
+        return None
+
+    headers, leading_rows = _split_header(header_rows[:1])
+    row_count = selected_sheet.get("properties", {}).get("gridProperties", {}).get("rowCount")
+    page_size = max(1, page_size)
+
+    def pages() -> Iterator[List[List[str]]]:
+        if leading_rows:
+            # No header row: the first row is already data.
+            yield leading_rows
+        start = 2
+        while row_count is None or start <= row_count:
+            end = start + page_size - 1
+            try:
+                rows = _batch_get_values(composio, user_id, sheet_id, f"{target_sheet_name}!A{start}:Z{end}")
+            except Exception as exc:  # pragma: no cover - defensive logging
+                raise SheetFetchError(f"Error fetching rows {start}-{end}: {exc}") from exc
+            if rows is None:
+                raise SheetFetchError(f"Failed to fetch rows {start}-{end} of '{target_sheet_name}'")
+            if rows:
+                yield rows
+            # Without grid properties a short window is the only end-of-data signal.
+            if row_count is None and len(rows) < page_size:
+                return
+            start = end + 1
+
     return {
-        "totalCases": len(cases),
-        "injuryCount": total_injuries,
-        "propertyDamageCount": with_property_damage,
-        "casesByCategory": by_category,
+        "sheetData": _sheet_metadata(sheet_id, sheet_info, target_sheet_name),
+        "headers": headers,
+        "pages": pages(),
     }
 
 
-def evaluate_triage(cases: List[Dict[str, Any]], preferences: Dict[str, Any]) -> List[Dict[str, Any]]:
-    if not preferences:
-        preferences = {}
+def _open_local_source_pages(
+    source: LocalFileSource, sheet_name: Optional[str], page_size: int
+) -> Optional[Dict[str, Any]]:
+    if not source.accepts(sheet_name):
+        return None
+    try:
+        header, data_pages = source.open_pages(page_size)
+    except Exception as exc:  # pragma: no cover - defensive logging
+        print(f"Error opening case source {source.path}: {exc}")
+        return None
+
+    headers, leading_rows = _split_header([header] if header else [])
+
+    def pages() -> Iterator[List[List[str]]]:
+        if leading_rows:
+            yield leading_rows
+        try:
+            yield from data_pages
+        except (OSError, ValueError, csv.Error) as exc:
+            raise SheetFetchError(f"Error reading {source.path.name}: {exc}") from exc
+
+    return {"sheetData": source.metadata(), "headers": headers, "pages": pages()}
 
-    categories = {
-        value.strip().lower()
-        for value in preferences.get("categoriesOfInterest", [])
-        if isinstance(value, str) and value.strip()
-    }
-    cities = {
-        value.strip().lower()
-        for value in preferences.get("citiesOfInterest", [])
-        if isinstance(value, str) and value.strip()
+
+def iter_cases(
+    rows: Iterable[List[str]],
+    headers: List[str],
+    parsers: Optional[ColumnParsers] = None,
+) -> Iterator[Dict[str, Any]]:
+    """Lazily convert raw rows into cases, skipping rows without an incident id."""
+    for row in rows:
+        case = row_to_case(row, headers, parsers)
+        if case:
+            yield case
+
+
+def iter_case_pages(opened: Dict[str, Any]) -> Iterator[List[Dict[str, Any]]]:
+    """Yield the parsed cases of each fetched window as soon as it arrives."""
+    headers = opened["headers"]
+    parsers: Optional[ColumnParsers] = None
+    for rows in opened["pages"]:
+        if parsers is None:
+            # Formats are inferred from the first window and reused for the rest.
+            parsers = infer_column_parsers(rows, headers)
+        yield list(iter_cases(rows, headers, parsers))
+
+
+def _sheet_binding(sheet_data: Dict[str, Any], version: Optional[str] = None) -> Dict[str, Any]:
+    binding = {
+        "sheetId": sheet_data.get("spreadsheet_id"),
+        "sheetName": sheet_data.get("sheet_name"),
+        "lastSyncedAt": datetime.utcnow().isoformat(),
+        "title": sheet_data.get("title"),
+        "availableSheets": sheet_data.get("available_sheets", []),
     }
-    require_injury = bool(preferences.get("requireInjury", False))
-    include_property_damage = bool(preferences.get("includePropertyDamage", True))
+    if version:
+        binding["syncVersion"] = version
+    return binding
 
-    matches: List[Dict[str, Any]] = []
-    timestamp = datetime.utcnow().isoformat()
 
-    for case in cases:
-        category = (case.get("incidentCategory") or "").lower()
-        jurisdiction = (case.get("jurisdiction") or "").lower()
-        city_in_location = (case.get("location") or "").lower()
+def stream_sheet_import(
+    opened: Dict[str, Any],
+    *,
+    visible_case_limit: int = 97,
+    triage_preferences: Optional[Dict[str, Any]] = None,
+    profile_id: str = "default",
+) -> Iterator[Dict[str, Any]]:
+    """Yield /sheets/sync results one fetched window at a time.
+
+    Emits a ``sheet`` event first, then one ``cases`` event per window (the
+    first ``visible_case_limit`` cases overall go to ``cases``, the rest to
+    ``queuedCases``) and finally a ``complete`` event with the aggregated
+    metrics. A fetch failure part-way through yields an ``error`` event.
+    Streamed imports do not update the delta-sync fingerprints; each window's
+    ``profileAlerts`` covers only the cases the last full sync of the tab did
+    not already hold.
+    """
+    sheet_data = opened["sheetData"]
+    with _snapshot_lock:
+        previous = _sheet_snapshots.get(_snapshot_key(sheet_data, sheet_data.get("spreadsheet_id")))
+    profile = get_profile(profile_id)
+    preferences = triage_preferences or profile.get("triagePreferences", {})
+    yield {"type": "sheet", "sheet": _sheet_binding(opened["sheetData"]), "profile": profile}
+
+    metrics = CaseMetrics()
+    emitted = 0
+    try:
+        for cases in iter_case_pages(opened):
+            visible_slots = max(0, visible_case_limit - emitted)
+            yield {
+                "type": "cases",
+                "cases": cases[:visible_slots],
+                "queuedCases": cases[visible_slots:],
+                "notifications": evaluate_triage(cases, preferences),
+                "profileAlerts": _profile_alerts(_unseen_cases(cases, previous)),
+            }
+            emitted += len(cases)
+            metrics.upsert(cases)
+    except SheetFetchError as exc:
+        print(f"Streaming sheet import stopped: {exc}")
+        yield {"type": "error", "error": str(exc), "totalCases": emitted}
+        return
+
+    yield {"type": "complete", "metrics": metrics.summary(), "totalCases": emitted}
+
+
+# ---------------------------------------------------------------------------- #
+# Delta sync
+# ---------------------------------------------------------------------------- #
+
+# How many past sync versions per sheet a client may send back as since_version.
+SYNC_HISTORY_LIMIT = 8
+
+# (sheet_id, sheet_name) -> latest parsed snapshot of that tab.
+_sheet_snapshots: Dict[Tuple[str, str], Dict[str, Any]] = {}
+# (sheet_id, sheet_name) -> {sync version: {incident_id: row hash}}, oldest first.
+_sheet_version_history: Dict[Tuple[str, str], "OrderedDict[str, Optional[Dict[str, str]]]"] = {}
+# (requested sheet_id, requested sheet_name or "") -> key of its snapshot above.
+_snapshot_aliases: Dict[Tuple[str, str], Tuple[str, str]] = {}
+_snapshot_lock = threading.Lock()
+
+# Parsed snapshots persisted across restarts, keyed like _snapshot_aliases.
+_sheet_cache = SheetSnapshotCache(SHEETS_CACHE_PATH)
 
-        if categories and category not in categories:
-            continue
 
-        if cities:
-            if jurisdiction not in cities and not any(city in city_in_location for city in cities):
+def _row_fingerprint(row: List[Any]) -> str:
+    joined = "\x1f".join(str(cell) for cell in row)
+    return hashlib.blake2b(joined.encode("utf-8"), digest_size=10).hexdigest()
+
+
+def parse_cases_incrementally(
+    rows: List[List[str]],
+    previous: Optional[Dict[str, Any]] = None,
+) -> Dict[str, Any]:
+    """Parse sheet rows, reusing cases from ``previous`` for unchanged rows.
+
+    Each data row is fingerprinted by a hash of its raw cells (plus the header
+    row), so only new or edited rows go through ``row_to_case``; unchanged
+    rows are copied column-wise from the previous CaseStore. Returns the
+    parsed cases as a CaseStore, the row-hash -> position index used for the
+    next sync, the incident_id -> row hash fingerprints and a version token
+    for the whole tab. ``parsedPositions`` lists the positions of the cases
+    that were added or edited since ``previous``.
+    """
+    headers, data_rows = _split_header(rows) if rows else (list(EXPECTED_COLUMNS), [])
+    header_hash = _row_fingerprint(headers)
+
+    previous_store: Optional[CaseStore] = None
+    reusable: Dict[str, int] = {}
+    if previous and previous.get("headerHash") == header_hash:
+        previous_store = previous["cases"]
+        reusable = previous.get("rowPositions", {})
+
+    parsers = infer_column_parsers(data_rows, headers)
+    cases = CaseStore(previous_store.dictionaries if previous_store is not None else None)
+    row_positions: Dict[str, int] = {}
+    fingerprints: Dict[str, str] = {}
+    version_hash = hashlib.blake2b(header_hash.encode("utf-8"), digest_size=10)
+    parsed_rows = 0
+    parsed_positions: List[int] = []
+
+    for row in data_rows:
+        row_hash = _row_fingerprint(row)
+        previous_position = reusable.get(row_hash)
+        if previous_position is not None:
+            incident_id = previous_store.value("incidentId", previous_position)
+            cases.append_from(previous_store, previous_position)
+        else:
+            case = row_to_case(row, headers, parsers)
+            parsed_rows += 1
+            if case is None:
                 continue
+            incident_id = case["incidentId"]
+            cases.append(case)
+            parsed_positions.append(len(cases) - 1)
+        row_positions[row_hash] = len(cases) - 1
+        fingerprints[incident_id] = row_hash
+        version_hash.update(row_hash.encode("utf-8"))
 
-        if require_injury and not case.get("injuryReported"):
-            continue
+    return {
+        "cases": cases,
+        "rowPositions": row_positions,
+        "fingerprints": fingerprints,
+        "headerHash": header_hash,
+        "version": version_hash.hexdigest(),
+        "parsedRows": parsed_rows,
+        "parsedPositions": parsed_positions,
+    }
 
-        if not include_property_damage and case.get("propertyDamage") and not case.get("injuryReported"):
-            continue
 
-        matches.append(
+def _carry_metrics_forward(previous: Optional[Dict[str, Any]], snapshot: Dict[str, Any]) -> CaseMetrics:
+    """Move the previous snapshot's metrics to ``snapshot`` by applying only the rows that changed."""
+    metrics = previous.get("metrics") if previous else None
+    if isinstance(metrics, CaseMetrics):
+        if metrics.version == snapshot["version"]:
+            return metrics
+        if not (_has_unique_ids(previous) and _has_unique_ids(snapshot)):
+            return CaseMetrics.from_cases(snapshot["cases"], snapshot["version"])
+        delta = diff_case_fingerprints(snapshot["cases"], snapshot["fingerprints"], previous["fingerprints"])
+        if metrics.apply_delta(
+            delta["added"] + delta["changed"],
+            delta["removed"],
+            base_version=previous["version"],
+            version=snapshot["version"],
+        ):
+            return metrics
+    return CaseMetrics.from_cases(snapshot["cases"], snapshot["version"])
+
+
+def snapshot_metrics(snapshot: Dict[str, Any]) -> CaseMetrics:
+    """The metrics of a snapshot, built once for snapshots restored from the sheet cache."""
+    metrics = snapshot.get("metrics")
+    if not isinstance(metrics, CaseMetrics) or metrics.version != snapshot["version"]:
+        metrics = CaseMetrics.from_cases(snapshot["cases"], snapshot["version"])
+        snapshot["metrics"] = metrics
+    return metrics
+
+
+def filtered_metrics(snapshot: Dict[str, Any], feed_filter: Dict[str, Any]) -> Dict[str, Any]:
+    """Metrics of the snapshot cases matching ``feed_filter``, summed from the snapshot's metrics."""
+    index = get_case_index(snapshot["cases"], version=f"snapshot:{snapshot['version']}")
+    return snapshot_metrics(snapshot).summarize(
+        index.value("incidentId", position) for position in index.matching_positions(feed_filter)
+    )
+
+
+def _remember_snapshot(
+    request_key: Tuple[str, str], key: Tuple[str, str], snapshot: Dict[str, Any], *, replace: bool = True
+) -> Dict[str, Any]:
+    """Record a snapshot and its fingerprints; returns the snapshot now held for ``key``."""
+    with _snapshot_lock:
+        _snapshot_aliases[request_key] = key
+        if not replace and key in _sheet_snapshots:
+            return _sheet_snapshots[key]
+        _sheet_snapshots[key] = snapshot
+        history = _sheet_version_history.setdefault(key, OrderedDict())
+        # Versions whose tab repeats an incident id cannot be diffed against.
+        history[snapshot["version"]] = snapshot["fingerprints"] if _has_unique_ids(snapshot) else None
+        history.move_to_end(snapshot["version"])
+        while len(history) > SYNC_HISTORY_LIMIT:
+            history.popitem(last=False)
+    return snapshot
+
+
+def _snapshot_key(sheet_data: Dict[str, Any], sheet_id: str) -> Tuple[str, str]:
+    return (sheet_data.get("spreadsheet_id", sheet_id), sheet_data.get("sheet_name") or "")
+
+
+def _restore_snapshot(request_key: Tuple[str, str]) -> Optional[Dict[str, Any]]:
+    """Load a snapshot persisted by an earlier process, if there is one."""
+    snapshot = _sheet_cache.load(*request_key)
+    if snapshot is None:
+        return None
+    key = _snapshot_key(snapshot["sheetData"], request_key[0])
+    return _remember_snapshot(request_key, key, snapshot, replace=False)
+
+
+def load_sheet_cases(sheet_id: str, sheet_name: Optional[str] = None) -> Optional[Dict[str, Any]]:
+    """Fetch and parse a tab, recording its fingerprints for later delta syncs.
+
+    New revisions are also written to the on-disk sheet cache.
+    """
+    sheet_data = get_sheet_data(sheet_id, sheet_name)
+    if not sheet_data:
+        return None
+
+    request_key = (sheet_id, sheet_name or "")
+    key = _snapshot_key(sheet_data, sheet_id)
+    with _snapshot_lock:
+        previous = _sheet_snapshots.get(key)
+    if previous is None:
+        # After a restart, reuse the persisted parse so only changed rows are parsed.
+        previous = _restore_snapshot(request_key)
+
+    snapshot = parse_cases_incrementally(sheet_data.get("rows", []), previous)
+    snapshot["sheetData"] = {k: v for k, v in sheet_data.items() if k != "rows"}
+    snapshot["metrics"] = _carry_metrics_forward(previous, snapshot)
+    snapshot["cachedAt"] = time.time()
+    _remember_snapshot(request_key, key, snapshot)
+
+    if previous is None or previous.get("version") != snapshot["version"]:
+        _sheet_cache.save(*request_key, snapshot)
+    return snapshot
+
+
+def get_cached_sheet_cases(sheet_id: str, sheet_name: Optional[str] = None) -> Optional[Dict[str, Any]]:
+    """Return the last parsed snapshot for a tab without fetching it.
+
+    Looks in memory first and then in the on-disk sheet cache; returns None
+    when the tab has never been synced.
+    """
+    request_key = (sheet_id, sheet_name or "")
+    with _snapshot_lock:
+        key = _snapshot_aliases.get(request_key)
+        snapshot = _sheet_snapshots.get(key) if key is not None else None
+    if snapshot is not None:
+        return snapshot
+    return _restore_snapshot(request_key)
+
+
+def get_sheet_cache_stats() -> Dict[str, Any]:
+    return _sheet_cache.stats()
+
+
+def _has_unique_ids(snapshot: Dict[str, Any]) -> bool:
+    return len(snapshot["fingerprints"]) == len(snapshot["cases"])
+
+
+def _fingerprints_for_version(sheet_key: Tuple[str, str], version: str) -> Optional[Dict[str, str]]:
+    with _snapshot_lock:
+        return _sheet_version_history.get(sheet_key, {}).get(version)
+
+
+def diff_case_fingerprints(
+    cases: Union[CaseStore, List[Dict[str, Any]]],
+    fingerprints: Dict[str, str],
+    base_fingerprints: Dict[str, str],
+) -> Dict[str, Any]:
+    """Split ``cases`` into added/changed lists and the removed incident ids.
+
+    Only the added and changed cases are materialized. Fingerprints are keyed
+    by incident id, so a tab that repeats an id cannot be diffed and raises
+    ValueError; ``base_fingerprints`` must come from such a tab too.
+    """
+    if len(fingerprints) != len(cases):
+        raise ValueError("Cannot diff cases with duplicate incident ids")
+    added: List[Dict[str, Any]] = []
+    changed: List[Dict[str, Any]] = []
+    for position, incident_id in enumerate(case_column(cases, "incidentId")):
+        row_hash = fingerprints.get(incident_id)
+        base_hash = base_fingerprints.get(incident_id)
+        if base_hash is None:
+            added.append(cases[position])
+        elif base_hash != row_hash:
+            changed.append(cases[position])
+    removed = [incident_id for incident_id in base_fingerprints if incident_id not in fingerprints]
+    return {"added": added, "changed": changed, "removed": removed}
+
+
+def _profile_alerts(cases: Union[CaseStore, List[Dict[str, Any]]]) -> Dict[str, List[str]]:
+    """Incident ids routed to each subscribed profile; the others are left out."""
+    index = get_subscription_index()
+    routed = index.route_cases(cases)
+    return {
+        profile_id: [notification["incidentId"] for notification in notifications]
+        for profile_id, notifications in routed.items()
+        if profile_id in index.subscribed
+    }
+
+
+def _unseen_cases(cases: List[Dict[str, Any]], previous: Optional[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """The cases ``previous`` (a snapshot of the same tab) lacks or holds with other values."""
+    if not previous:
+        return cases
+    store = previous["cases"]
+    unseen = []
+    for case in cases:
+        position = previous["rowPositions"].get(previous["fingerprints"].get(case.get("incidentId")))
+        if position is None or store.get(position) != case:
+            unseen.append(case)
+    return unseen
+
+
+def build_sheet_import(
+    snapshot: Dict[str, Any],
+    *,
+    visible_case_limit: int = 97,
+    triage_preferences: Optional[Dict[str, Any]] = None,
+    since_version: Optional[str] = None,
+    profile_id: str = "default",
+    include_queued: bool = True,
+) -> Dict[str, Any]:
+    """Shape a parsed snapshot into the /sheets/sync payload.
+
+    When ``since_version`` names a version this process still remembers, only
+    the added, changed and removed cases are returned (``syncMode: "delta"``);
+    otherwise, or when the tab repeats an incident id, the full visible/queued
+    split is returned. ``notifications`` are
+    evaluated for ``profile_id``; ``profileAlerts`` lists, for every profile
+    with subscriptions, the ids of the added or changed cases routed to it
+    through the subscription index.
+    With ``include_queued=False`` the queued cases are left to the live feed
+    stream and only their count is returned.
+    """
+    sheet_data = snapshot["sheetData"]
+    cases = snapshot["cases"]
+    sheet_id = sheet_data.get("spreadsheet_id")
+    sheet_key = (sheet_id, sheet_data.get("sheet_name") or "")
+
+    profile = get_profile(profile_id)
+    preferences = triage_preferences or profile.get("triagePreferences", {})
+
+    result: Dict[str, Any] = {
+        "success": True,
+        "syncVersion": snapshot["version"],
+        "sheet": _sheet_binding(sheet_data, snapshot["version"]),
+        "profile": profile,
+        "metrics": snapshot_metrics(snapshot).summary(),
+        "totalCases": len(cases),
+    }
+
+    base_fingerprints = None
+    if since_version and _has_unique_ids(snapshot):
+        base_fingerprints = _fingerprints_for_version(sheet_key, since_version)
+    if base_fingerprints is not None:
+        delta = diff_case_fingerprints(cases, snapshot["fingerprints"], base_fingerprints)
+        touched = delta["added"] + delta["changed"]
+        result.update(
             {
-                "id": f"triage-{case['incidentId']}",
-                "incidentId": case["incidentId"],
-                "createdAt": timestamp,
-                "message": (
-                    f"{case.get('incidentCategory', 'Incident')} at {case.get('location', 'unknown location')} "
-                    f"on {case.get('incidentDate', 'unknown date')} involving {case.get('fullName', 'unknown party')}"
-                ),
-                "acknowledged": False,
+                "syncMode": "delta",
+                "baseVersion": since_version,
+                **delta,
+                "notifications": evaluate_triage(touched, preferences),
+                "profileAlerts": _profile_alerts(touched),
             }
         )
-
-    return matches
+        return result
+
+    result.update(
+        {
+            "syncMode": "full",
+            "cases": cases[:visible_case_limit],
+            "queuedCases": cases[visible_case_limit:] if include_queued else [],
+            "queuedCount": max(0, len(cases) - visible_case_limit),
+            "notifications": evaluate_triage(cases, preferences),
+            "profileAlerts": _profile_alerts([cases[position] for position in snapshot.get("parsedPositions", ())]),
+        }
+    )
+    # The dashboard hands these cases back as agent state; index them now so
+    # the first feed filter call reuses the index instead of building it.
+    get_case_index(result["cases"], result["sheet"])
+    if include_queued:
+        get_case_index(result["queuedCases"], result["sheet"], scope="queued")
+    return result
 
 
 def import_cases_from_sheet(
@@ -317,35 +1126,23 @@ def import_cases_from_sheet(
     *,
     visible_case_limit: int = 97,
     triage_preferences: Optional[Dict[str, Any]] = None,
+    since_version: Optional[str] = None,
+    profile_id: str = "default",
 ) -> Dict[str, Any]:
-    sheet_data = get_sheet_data(sheet_id, sheet_name)
-    if not sheet_data:
+    try:
+        snapshot = load_sheet_cases(sheet_id, sheet_name)
+    except CaseSourceError as exc:
+        return {"success": False, "error": str(exc)}
+    if not snapshot:
         return {
             "success": False,
             "error": "Failed to load Google Sheet. Ensure the sheet ID and permissions are correct.",
         }
 
-    cases = parse_cases_from_sheet(sheet_data)
-    visible = cases[:visible_case_limit]
-    queued = cases[visible_case_limit:]
-
-    profile = get_profile()
-    preferences = triage_preferences or profile.get("triagePreferences", {})
-    triage_matches = evaluate_triage(cases, preferences)
-
-    return {
-        "success": True,
-        "cases": visible,
-        "queuedCases": queued,
-        "sheet": {
-            "sheetId": sheet_data.get("spreadsheet_id", sheet_id),
-            "sheetName": sheet_data.get("sheet_name"),
-            "lastSyncedAt": datetime.utcnow().isoformat(),
-            "title": sheet_data.get("title"),
-            "availableSheets": sheet_data.get("available_sheets", []),
-        },
-        "profile": profile,
-        "notifications": triage_matches,
-        "metrics": summarize_cases(cases),
-        "totalCases": len(cases),
-    }
+    return build_sheet_import(
+        snapshot,
+        visible_case_limit=visible_case_limit,
+        triage_preferences=triage_preferences,
+        since_version=since_version,
+        profile_id=profile_id,
+    )
@@ -0,0 +1,219 @@
+"""Offline similarity search over incident descriptions with hashed TF-IDF vectors."""
+
+from __future__ import annotations
+
+import re
+import threading
+import zlib
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, List, Optional, Tuple, Union
+
+import numpy as np
+
+from .case_store import CaseStore, case_column
+
+# Features are hashed into this many buckets; vectors are stored sparse.
+SIMILARITY_DIMENSIONS = 1 << 18
+# Number of tabs whose similarity indexes are kept around.
+SIMILARITY_INDEX_CACHE_SIZE = 8
+SIMILARITY_LIMIT_MAX = 50
+
+_TOKEN_PATTERN = re.compile(r"[a-z0-9]+")
+_STOP_WORDS = frozenset(
+    "a an and are as at be by for from had has have he her his in into is it its of on or "
+    "our she that the their them they this to was were which while who with".split()
+)
+
+
+def _features(text: str) -> Tuple[np.ndarray, np.ndarray]:
+    """Hashed unigram and bigram buckets of ``text`` with log-scaled term frequencies."""
+    tokens = [token for token in _TOKEN_PATTERN.findall(text.lower()) if token not in _STOP_WORDS]
+    counts: Dict[int, int] = {}
+    for feature in tokens + [f"{first} {second}" for first, second in zip(tokens, tokens[1:])]:
+        bucket = zlib.crc32(feature.encode("utf-8")) % SIMILARITY_DIMENSIONS
+        counts[bucket] = counts.get(bucket, 0) + 1
+    if not counts:
+        return np.empty(0, dtype=np.int64), np.empty(0, dtype=np.float32)
+    buckets = np.fromiter(counts.keys(), dtype=np.int64, count=len(counts))
+    weights = 1.0 + np.log(np.fromiter(counts.values(), dtype=np.float32, count=len(counts)))
+    order = np.argsort(buckets)
+    return buckets[order], weights[order].astype(np.float32)
+
+
+class _Matrix:
+    """CSR rows of TF-IDF weights for every non-empty description, with row norms."""
+
+    def __init__(self, ids: List[str], rows: List[Tuple[np.ndarray, np.ndarray]], idf: np.ndarray) -> None:
+        self.ids = ids
+        self.idf = idf
+        lengths = np.fromiter((len(buckets) for buckets, _ in rows), dtype=np.int64, count=len(rows))
+        self.starts = np.concatenate(([0], np.cumsum(lengths)[:-1])) if len(rows) else np.empty(0, dtype=np.int64)
+        self.indices = np.concatenate([buckets for buckets, _ in rows]) if rows else np.empty(0, dtype=np.int64)
+        tf = np.concatenate([weights for _, weights in rows]) if rows else np.empty(0, dtype=np.float32)
+        self.data = tf * idf[self.indices]
+        self.norms = np.sqrt(np.add.reduceat(self.data * self.data, self.starts)) if rows else np.empty(0)
+        self.positions = {incident_id: row for row, incident_id in enumerate(ids)}
+
+    def row(self, position: int) -> Tuple[np.ndarray, np.ndarray]:
+        start = self.starts[position]
+        end = self.starts[position + 1] if position + 1 < len(self.starts) else len(self.indices)
+        return self.indices[start:end], self.data[start:end]
+
+    def scores(self, buckets: np.ndarray, weights: np.ndarray) -> np.ndarray:
+        """Cosine similarity of every row with a query already weighted by idf."""
+        query = np.zeros(SIMILARITY_DIMENSIONS, dtype=np.float32)
+        query[buckets] = weights
+        query_norm = float(np.sqrt(np.dot(weights, weights)))
+        if not self.ids or not query_norm:
+            return np.zeros(len(self.ids), dtype=np.float32)
+        dots = np.add.reduceat(self.data * query[self.indices], self.starts)
+        return dots / (self.norms * query_norm)
+
+
+class SimilarityIndex:
+    """Hashed TF-IDF vectors of a tab's ``incidentDescription`` values.
+
+    ``update`` re-tokenizes only the cases whose description changed since
+    the previous sync and adjusts document frequencies for added, edited and
+    removed cases; the CSR matrix used for scoring is reassembled from the
+    stored rows the next time it is queried.
+    """
+
+    def __init__(self) -> None:
+        self.version: Optional[str] = None
+        self._docs: "OrderedDict[str, Tuple[int, np.ndarray, np.ndarray]]" = OrderedDict()
+        self._df = np.zeros(SIMILARITY_DIMENSIONS, dtype=np.int32)
+        self._matrix: Optional[_Matrix] = None
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._docs)
+
+    def update(self, cases: Union[CaseStore, List[Dict[str, Any]]], version: Optional[str] = None) -> Dict[str, int]:
+        """Bring the index in line with ``cases``; a no-op when ``version`` is unchanged."""
+        counts = {"added": 0, "updated": 0, "removed": 0, "unchanged": 0}
+        with self._lock:
+            if version is not None and version == self.version:
+                counts["unchanged"] = len(self._docs)
+                return counts
+
+            seen = set()
+            for incident_id, description in zip(
+                case_column(cases, "incidentId"), case_column(cases, "incidentDescription")
+            ):
+                if not incident_id or incident_id in seen:
+                    continue
+                seen.add(incident_id)
+                text = description if isinstance(description, str) else ""
+                digest = zlib.crc32(text.encode("utf-8"))
+                existing = self._docs.get(incident_id)
+                if existing is not None:
+                    if existing[0] == digest:
+                        counts["unchanged"] += 1
+                        continue
+                    self._df[existing[1]] -= 1
+                    counts["updated"] += 1
+                else:
+                    counts["added"] += 1
+                buckets, weights = _features(text)
+                self._df[buckets] += 1
+                self._docs[incident_id] = (digest, buckets, weights)
+
+            for incident_id in [incident_id for incident_id in self._docs if incident_id not in seen]:
+                self._df[self._docs.pop(incident_id)[1]] -= 1
+                counts["removed"] += 1
+
+            if counts["added"] or counts["updated"] or counts["removed"]:
+                self._matrix = None
+            self.version = version
+        return counts
+
+    def _compiled(self) -> _Matrix:
+        with self._lock:
+            if self._matrix is None:
+                total = len(self._docs)
+                idf = (np.log((1.0 + total) / (1.0 + self._df)) + 1.0).astype(np.float32)
+                ids = [incident_id for incident_id, doc in self._docs.items() if len(doc[1])]
+                rows = [(self._docs[incident_id][1], self._docs[incident_id][2]) for incident_id in ids]
+                self._matrix = _Matrix(ids, rows, idf)
+            return self._matrix
+
+    def most_similar(
+        self,
+        *,
+        text: Optional[str] = None,
+        incident_id: Optional[str] = None,
+        limit: int = 5,
+    ) -> List[Tuple[str, float]]:
+        """Top ``limit`` (incidentId, cosine score) pairs for free text or an indexed case."""
+        matrix = self._compiled()
+        if incident_id:
+            position = matrix.positions.get(incident_id)
+            if position is None:
+                if incident_id in self._docs:
+                    return []  # the case has no description to compare
+                raise KeyError(incident_id)
+            buckets, weights = matrix.row(position)
+        elif text and text.strip():
+            buckets, tf = _features(text)
+            weights = tf * matrix.idf[buckets]
+        else:
+            raise ValueError("Provide text or an incident id to compare against.")
+
+        scores = matrix.scores(buckets, weights)
+        if incident_id:
+            scores[matrix.positions[incident_id]] = -1.0
+        limit = max(0, min(limit, len(scores)))
+        if not limit:
+            return []
+        top = np.argpartition(-scores, limit - 1)[:limit]
+        top = top[np.argsort(-scores[top], kind="stable")]
+        return [(matrix.ids[row], round(float(scores[row]), 4)) for row in top if scores[row] > 0]
+
+
+_similarity_indexes: "OrderedDict[Hashable, SimilarityIndex]" = OrderedDict()
+_similarity_indexes_lock = threading.Lock()
+
+
+def get_similarity_index(key: Hashable, *, create: bool = True) -> Optional[SimilarityIndex]:
+    """The index kept for ``key`` (typically a sheet id and tab), created on first use."""
+    with _similarity_indexes_lock:
+        index = _similarity_indexes.get(key)
+        if index is not None:
+            _similarity_indexes.move_to_end(key)
+            return index
+        if not create:
+            return None
+        index = SimilarityIndex()
+        _similarity_indexes[key] = index
+        while len(_similarity_indexes) > SIMILARITY_INDEX_CACHE_SIZE:
+            _similarity_indexes.popitem(last=False)
+        return index
+
+
+def find_similar_cases(
+    cases: Union[CaseStore, List[Dict[str, Any]]],
+    *,
+    key: Hashable,
+    version: Optional[str] = None,
+    text: Optional[str] = None,
+    incident_id: Optional[str] = None,
+    limit: int = 5,
+) -> List[Dict[str, Any]]:
+    """Cases whose descriptions are most similar to ``text`` or to case ``incident_id``.
+
+    Raises ValueError when neither is given or the incident id is unknown.
+    """
+    index = get_similarity_index(key)
+    index.update(cases, version)
+    try:
+        matches = index.most_similar(text=text, incident_id=incident_id, limit=min(limit, SIMILARITY_LIMIT_MAX))
+    except KeyError:
+        raise ValueError(f"Unknown incident id '{incident_id}'.")
+
+    positions = {case_id: position for position, case_id in enumerate(case_column(cases, "incidentId"))}
+    return [
+        {"incidentId": case_id, "score": score, "case": cases[positions[case_id]]}
+        for case_id, score in matches
+        if case_id in positions
+    ]
@@ -0,0 +1,106 @@
+"""Deferred loading of the chat agent, with startup timings for /readyz."""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterator, List, Optional
+
+# Taken when the server package starts importing; phases are measured from here.
+STARTED_AT = time.perf_counter()
+
+
+class StartupProfile:
+    """Named startup phases with their offset from process start and duration."""
+
+    def __init__(self) -> None:
+        self.phases: List[Dict[str, Any]] = []
+
+    def mark(self, name: str, started: Optional[float] = None) -> None:
+        now = time.perf_counter()
+        entry: Dict[str, Any] = {"phase": name, "atSeconds": round(now - STARTED_AT, 4)}
+        if started is not None:
+            entry["durationSeconds"] = round(now - started, 4)
+        self.phases.append(entry)
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.mark(name, started)
+
+    def report(self) -> List[Dict[str, Any]]:
+        return list(self.phases)
+
+    def summary(self) -> str:
+        parts = []
+        for entry in self.phases:
+            if "durationSeconds" in entry:
+                parts.append(f"{entry['phase']} {entry['durationSeconds']:.2f}s")
+            else:
+                parts.append(f"{entry['phase']} at {entry['atSeconds']:.2f}s")
+        return ", ".join(parts)
+
+
+startup_profile = StartupProfile()
+
+ChatEndpoint = Callable[[Any], Any]
+
+
+class AgentLoader:
+    """Imports the chat agent and its Composio tools off the event loop.
+
+    ``agent.agent`` pulls in LlamaIndex and the OpenAI client and the
+    Composio tools need network calls, which together take seconds. The
+    server starts without them; ``start()`` kicks the load off on a worker
+    thread when the app starts and ``ready()`` waits for it, so only the
+    chat endpoint ever waits on the agent.
+    """
+
+    def __init__(self) -> None:
+        self.state = "pending"
+        self.error: Optional[str] = None
+        self.backend_tools = 0
+        self._future: Optional["asyncio.Future[ChatEndpoint]"] = None
+
+    def start(self) -> None:
+        if self._future is None:
+            self.state = "loading"
+            self._future = asyncio.get_running_loop().run_in_executor(None, self._load)
+            self._future.add_done_callback(self._finished)
+
+    def _load(self) -> ChatEndpoint:
+        with startup_profile.phase("agent-import"):
+            from . import agent
+
+        with startup_profile.phase("composio-tools"):
+            self.backend_tools = agent.load_backend_tools()
+
+        return next(route.endpoint for route in agent.agentic_chat_router.routes if route.path == "/run")
+
+    def _finished(self, future: "asyncio.Future[ChatEndpoint]") -> None:
+        if future.cancelled():
+            return
+        error = future.exception()
+        if error is not None:
+            self.state = "failed"
+            self.error = str(error)
+            print(f"Agent failed to load: {error}")
+        else:
+            self.state = "ready"
+            startup_profile.mark("agent-ready")
+        print(f"Startup profile: {startup_profile.summary()}")
+
+    async def ready(self) -> ChatEndpoint:
+        self.start()
+        return await asyncio.shield(self._future)
+
+    @property
+    def is_ready(self) -> bool:
+        return self.state == "ready"
+
+    def status(self) -> Dict[str, Any]:
+        return {"state": self.state, "error": self.error, "backendTools": self.backend_tools}
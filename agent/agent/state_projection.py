@@ -0,0 +1,233 @@
+"""The slice of dashboard state shown to the LLM, fitted to a token budget."""
+
+from __future__ import annotations
+
+import heapq
+import math
+import os
+import re
+import threading
+import time
+from collections import deque
+from itertools import chain, islice
+from typing import Any, Callable, Deque, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+from .case_store import positions_from_bits
+from .feed_filter import RANKED_RESULTS_LIMIT, CaseSearchIndex, _apply_feed_filter_to_cases, get_case_index
+
+# Tokens the projected state may take in the prompt, and the most cases it lists.
+LLM_STATE_TOKEN_BUDGET = int(os.getenv("LLM_STATE_TOKEN_BUDGET", "4000"))
+LLM_STATE_TOP_K = int(os.getenv("LLM_STATE_TOP_K", "20"))
+# Fields kept for each listed case; get_case_details returns the rest.
+CASE_SUMMARY_FIELDS = (
+    "incidentId",
+    "incidentCategory",
+    "jurisdiction",
+    "incidentDate",
+    "incidentTime",
+    "location",
+    "injuryReported",
+    "propertyDamage",
+    "faultDetermination",
+)
+CASE_DESCRIPTION_CHARS = 160
+RECENT_NOTIFICATIONS = 5
+PROMPT_TOKEN_HISTORY = 200
+
+_TERM_PATTERN = re.compile(r"[a-z0-9]+")
+# Words of a message that could be an incident id, e.g. "2025-f-563452".
+_ID_PATTERN = re.compile(r"[\w-]+")
+_STOP_WORDS = {
+    "the", "and", "for", "with", "that", "this", "are", "was", "were", "from", "have", "has",
+    "any", "all", "show", "me", "what", "which", "who", "how", "many", "case", "cases",
+    "incident", "incidents", "about", "there", "their", "them", "into", "can", "you", "please",
+}
+
+_tokenizer: Optional[Callable[[str], List[int]]] = None
+
+
+def count_tokens(text: str) -> int:
+    """Token count under the tokenizer LlamaIndex ships, or an estimate if it is unavailable."""
+    global _tokenizer
+    if _tokenizer is None:
+        try:
+            from llama_index.core.utils import get_tokenizer
+
+            _tokenizer = get_tokenizer()
+        except Exception:  # pragma: no cover - tokenizer data unavailable
+            _tokenizer = lambda value: [0] * math.ceil(len(value) / 4)  # noqa: E731
+    return len(_tokenizer(text))
+
+
+def _prompt_text(value: Any) -> str:
+    # AGUIChatWorkflow embeds the state in the prompt with str().
+    return str(value)
+
+
+def _terms(text: str) -> List[str]:
+    return [term for term in _TERM_PATTERN.findall(text.lower()) if len(term) > 2 and term not in _STOP_WORDS]
+
+
+def _case_list(state: Dict[str, Any], key: str) -> List[Dict[str, Any]]:
+    cases = state.get(key)
+    if not isinstance(cases, list):
+        return []
+    return [case for case in cases if isinstance(case, dict)]
+
+
+def case_summary(case: Dict[str, Any]) -> Dict[str, Any]:
+    summary = {field: case.get(field) for field in CASE_SUMMARY_FIELDS if case.get(field) not in (None, "")}
+    description = case.get("incidentDescription")
+    if isinstance(description, str) and description:
+        if len(description) > CASE_DESCRIPTION_CHARS:
+            description = description[:CASE_DESCRIPTION_CHARS].rstrip() + "..."
+        summary["incidentDescription"] = description
+    return summary
+
+
+def rank_cases(
+    case_lists: Sequence[Tuple[str, List[Dict[str, Any]]]],
+    message: str,
+    preferred: Iterable[str] = (),
+    limit: int = RANKED_RESULTS_LIMIT,
+    *,
+    sheet: Optional[Dict[str, Any]] = None,
+) -> Iterator[Dict[str, Any]]:
+    """Yield the cases of ``(scope, cases)`` lists in order of relevance to ``message``.
+
+    Incident ids named in the message come first, then up to ``limit`` cases
+    sharing any term with the message, ranked by BM25 through each list's
+    cached index, then ``preferred`` ids (the current feed view) and the rest,
+    each group in list order. Callers that stop early never walk the lists.
+    """
+    lists = [(cases, get_case_index(cases, sheet, scope=scope)) for scope, cases in case_lists if cases]
+    words = _ID_PATTERN.findall(message.lower())
+    terms = " ".join(_terms(message))
+
+    def scored(number: int, index: CaseSearchIndex) -> Iterator[Tuple[float, int, int]]:
+        _, matches = index.ranked_matches({"searchText": terms}, limit, any_token=True)
+        return ((-score, number, position) for position, score in matches)
+
+    named: List[Tuple[int, int]] = []
+    for number, (_, index) in enumerate(lists):
+        bits = 0
+        for word in words:
+            bits |= index.incident_id_bits.get(word, 0)
+        named.extend((number, position) for position in positions_from_bits(bits))
+    ranked = heapq.merge(*(scored(number, index) for number, (_, index) in enumerate(lists))) if terms else iter(())
+    best = ((number, position) for _, number, position in islice(ranked, limit))
+
+    emitted = set()
+    for number, position in chain(named, best):
+        if (number, position) not in emitted:
+            emitted.add((number, position))
+            yield lists[number][0][position]
+
+    preferred_ids = set(preferred)
+    for wanted in (True, False):
+        for number, (cases, _) in enumerate(lists):
+            for position, case in enumerate(cases):
+                if (case.get("incidentId") in preferred_ids) is wanted and (number, position) not in emitted:
+                    yield case
+
+
+def project_state(
+    state: Dict[str, Any],
+    message: str,
+    *,
+    token_budget: int = LLM_STATE_TOKEN_BUDGET,
+    top_k: int = LLM_STATE_TOP_K,
+) -> Dict[str, Any]:
+    """Metrics, filter, active case and the cases most relevant to ``message``, within ``token_budget``."""
+    cases = _case_list(state, "cases")
+    queued = _case_list(state, "queuedCases")
+    active_id = state.get("activeCaseId")
+    active_case = next((case for case in chain(cases, queued) if case.get("incidentId") == active_id), None)
+    feed_filter = state.get("feedFilter") if isinstance(state.get("feedFilter"), dict) else {}
+    sheet = state.get("sheet") if isinstance(state.get("sheet"), dict) else None
+    notifications = state.get("notifications") if isinstance(state.get("notifications"), list) else []
+
+    visible = _apply_feed_filter_to_cases(cases, feed_filter, sheet) if feed_filter else cases
+    projection: Dict[str, Any] = {
+        "caseCounts": {"cases": len(cases), "queuedCases": len(queued), "matchingFeedFilter": len(visible)},
+        "metrics": state.get("metrics"),
+        "feedFilter": feed_filter,
+        "activeCaseId": active_id,
+        "activeCase": active_case,
+        "profile": state.get("profile"),
+        "sheet": sheet,
+        "liveFeed": state.get("liveFeed"),
+        "lastAction": state.get("lastAction"),
+        "recentNotifications": notifications[-RECENT_NOTIFICATIONS:],
+        "relevantCases": [],
+    }
+
+    remaining = token_budget - count_tokens(_prompt_text(projection))
+    relevant: List[Dict[str, Any]] = []
+    seen = set()
+    ranked = rank_cases(
+        [("cases", cases), ("queued", queued)],
+        message,
+        (case.get("incidentId") for case in visible),
+        top_k,
+        sheet=sheet,
+    )
+    for case in ranked:
+        if len(relevant) >= top_k:
+            break
+        if case.get("incidentId") in seen:
+            continue
+        seen.add(case.get("incidentId"))
+        summary = case_summary(case)
+        cost = count_tokens(_prompt_text(summary)) + 1
+        if cost > remaining:
+            break
+        relevant.append(summary)
+        remaining -= cost
+    projection["relevantCases"] = relevant
+    return projection
+
+
+# ---------------------------------------------------------------------------- #
+# Prompt token accounting
+# ---------------------------------------------------------------------------- #
+
+_prompt_token_lock = threading.Lock()
+_prompt_turns: Deque[Dict[str, Any]] = deque(maxlen=PROMPT_TOKEN_HISTORY)
+_prompt_totals = {"calls": 0, "estimatedCalls": 0, "promptTokens": 0, "stateTokens": 0}
+
+
+def record_prompt_tokens(
+    run_id: Optional[str], prompt_tokens: int, state_tokens: int, *, estimated: bool = False
+) -> Dict[str, Any]:
+    """Record one LLM call; ``estimated`` marks a local count made without the provider's usage.
+
+    ``stateTokens`` is always counted locally.
+    """
+    entry = {
+        "runId": run_id,
+        "at": time.time(),
+        "promptTokens": prompt_tokens,
+        "estimated": estimated,
+        "stateTokens": state_tokens,
+    }
+    with _prompt_token_lock:
+        _prompt_turns.append(entry)
+        _prompt_totals["calls"] += 1
+        _prompt_totals["estimatedCalls"] += estimated
+        _prompt_totals["promptTokens"] += prompt_tokens
+        _prompt_totals["stateTokens"] += state_tokens
+    source = "estimated" if estimated else "reported"
+    print(f"LLM prompt for run {run_id}: {prompt_tokens} tokens, {source} ({state_tokens} of them state)")
+    return entry
+
+
+def get_prompt_token_stats() -> Dict[str, Any]:
+    with _prompt_token_lock:
+        calls = _prompt_totals["calls"]
+        return {
+            **_prompt_totals,
+            "averagePromptTokens": round(_prompt_totals["promptTokens"] / calls, 1) if calls else 0,
+            "stateTokenBudget": LLM_STATE_TOKEN_BUDGET,
+            "recent": list(_prompt_turns),
+        }
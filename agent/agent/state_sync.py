@@ -0,0 +1,381 @@
+"""Shared-state updates sent to the dashboard as JSON Patch deltas."""
+
+import json
+import time
+import uuid
+from contextvars import ContextVar
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+import jsonpatch
+
+from llama_index.core.llms import ChatMessage
+from llama_index.core.tools import FunctionTool, ToolOutput
+from llama_index.core.workflow import Context, StopEvent, step
+from llama_index.protocols.ag_ui.agent import (
+    AGUIChatWorkflow,
+    InputEvent,
+    LoopEvent,
+    ToolCallEvent,
+    ToolCallResultEvent,
+)
+from llama_index.protocols.ag_ui.events import (
+    StateDeltaWorkflowEvent,
+    StateSnapshotWorkflowEvent,
+    TextMessageChunkWorkflowEvent,
+)
+from llama_index.protocols.ag_ui.utils import ag_ui_message_to_llama_index_message, timestamp
+
+from .intents import parse_command
+from .response_cache import READ_ONLY_TOOLS, get_cached_response, response_cache_key, store_response
+from .state_projection import count_tokens, project_state, record_prompt_tokens
+
+# RFC 6902 operations recorded by the tool call running in the current task.
+_pending_operations: ContextVar[Optional[List[Dict[str, Any]]]] = ContextVar(
+    "pending_state_operations", default=None
+)
+
+# Prompt tokens the provider reported for the LLM call made by the current task.
+_reported_prompt_tokens: ContextVar[Optional[int]] = ContextVar("reported_prompt_tokens", default=None)
+
+
+def _pointer(key: str) -> str:
+    return "/" + str(key).replace("~", "~0").replace("/", "~1")
+
+
+def state_operations(state: Dict[str, Any], changes: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """Patch operations that set top-level ``changes`` on ``state``; unchanged keys are skipped."""
+    operations = []
+    for key, value in changes.items():
+        if key in state:
+            if state[key] == value:
+                continue
+            operations.append({"op": "replace", "path": _pointer(key), "value": value})
+        else:
+            operations.append({"op": "add", "path": _pointer(key), "value": value})
+    return operations
+
+
+async def patch_state(ctx: Context, changes: Dict[str, Any]) -> Dict[str, Any]:
+    """Set top-level state fields and queue the matching delta for the client.
+
+    Backend tools change shared state through this helper instead of writing
+    a copy of the whole state back, so the AG-UI stream carries only the
+    fields the tool touched. Returns the updated state.
+    """
+    state = await ctx.store.get("state", default={})
+    if not isinstance(state, dict):
+        state = {}
+    operations = state_operations(state, changes)
+    if not operations:
+        return state
+
+    state = jsonpatch.apply_patch(state, operations, in_place=True)
+    await ctx.store.set("state", state)
+
+    pending = _pending_operations.get()
+    if pending is not None:
+        pending.extend(operations)
+    return state
+
+
+class _StateEchoFilter:
+    """Context proxy that drops STATE_SNAPSHOT events and forwards everything else."""
+
+    def __init__(self, ctx: Context) -> None:
+        self._ctx = ctx
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._ctx, name)
+
+    def write_event_to_stream(self, ev: Any) -> None:
+        if isinstance(ev, StateSnapshotWorkflowEvent):
+            return
+        self._ctx.write_event_to_stream(ev)
+
+
+class _FullStateStore:
+    """Store proxy that keeps the client's full state when the workflow stores a projection."""
+
+    def __init__(self, store: Any, state: Dict[str, Any]) -> None:
+        self._store = store
+        self._state = state
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._store, name)
+
+    async def set(self, key: str, value: Any, *args: Any, **kwargs: Any) -> None:
+        if key == "state":
+            value = self._state
+        await self._store.set(key, value, *args, **kwargs)
+
+
+def _usage_prompt_tokens(response: Any) -> Optional[int]:
+    """``prompt_tokens`` from a response's raw usage, if the provider sent one."""
+    raw = getattr(response, "raw", None)
+    usage = raw.get("usage") if isinstance(raw, dict) else getattr(raw, "usage", None)
+    prompt_tokens = usage.get("prompt_tokens") if isinstance(usage, dict) else getattr(usage, "prompt_tokens", None)
+    return prompt_tokens if isinstance(prompt_tokens, int) else None
+
+
+class _UsageRecordingLLM:
+    """LLM proxy that notes the prompt tokens reported with each streamed chat reply.
+
+    OpenAI sends usage on the last chunk of a stream when the LLM is created
+    with ``stream_options={"include_usage": True}``.
+    """
+
+    def __init__(self, llm: Any) -> None:
+        self._llm = llm
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._llm, name)
+
+    async def astream_chat_with_tools(self, *args: Any, **kwargs: Any) -> Any:
+        responses = await self._llm.astream_chat_with_tools(*args, **kwargs)
+
+        async def gen() -> Any:
+            async for response in responses:
+                prompt_tokens = _usage_prompt_tokens(response)
+                if prompt_tokens is not None:
+                    _reported_prompt_tokens.set(prompt_tokens)
+                yield response
+
+        return gen()
+
+
+class _ProjectedStateContext(_StateEchoFilter):
+    """Context for a run whose prompt sees a projection; tools still read the full state."""
+
+    def __init__(self, ctx: Context, state: Dict[str, Any]) -> None:
+        super().__init__(ctx)
+        self.store = _FullStateStore(ctx.store, state)
+
+
+def _last_user_text(ev: InputEvent) -> str:
+    for message in reversed(ev.input_data.messages):
+        if message.role == "user":
+            return message.content if isinstance(message.content, str) else ""
+    return ""
+
+
+def _message_tokens(message: ChatMessage) -> int:
+    text = message.content or ""
+    tool_calls = message.additional_kwargs.get("tool_calls")
+    if tool_calls:
+        text += str(tool_calls)
+    # Roughly what the chat format adds per message.
+    return count_tokens(text) + 4
+
+
+class DashboardChatWorkflow(AGUIChatWorkflow):
+    """AG-UI chat workflow that streams state changes as JSON Patch deltas.
+
+    The stock workflow echoes the client's state back at the start of every
+    run and sends the whole state again after every tool call, so each turn
+    costs as much as the dataset held in ``cases``/``queuedCases``. Here the
+    opening snapshot is only sent when the client did not provide a state,
+    and each tool call emits one STATE_DELTA with the operations recorded via
+    ``patch_state`` (nothing when the tool left the state alone).
+
+    Plain filter, clear and list-sheets commands are recognized by
+    ``parse_command`` and run against the backend tool directly, without an
+    LLM round trip; anything it does not fully understand goes to the LLM.
+
+    The prompt does not carry the client's whole state: ``project_state``
+    reduces it to metrics, the filter, the active case and the cases most
+    relevant to the message, within LLM_STATE_TOKEN_BUDGET. Tools keep
+    working on the full state, and ``get_case_details`` fetches any other
+    case. Prompt sizes are recorded per LLM call, from the provider's usage
+    when it reports one and otherwise estimated with the local tokenizer.
+
+    Finished replies are cached on the message, the tool set, the projected
+    state and the earlier turns; a turn that calls any tool outside
+    READ_ONLY_TOOLS is never cached.
+    """
+
+    _tool_tokens: Optional[int] = None
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self.llm = _UsageRecordingLLM(self.llm)
+
+    @step
+    async def chat(
+        self, ctx: Context, ev: Union[InputEvent, LoopEvent]
+    ) -> Optional[Union[StopEvent, ToolCallEvent]]:
+        _reported_prompt_tokens.set(None)
+        if not isinstance(ev, InputEvent):
+            result = await AGUIChatWorkflow.chat(self, ctx, ev)
+            await self._record_prompt_tokens(ctx)
+            await self._cache_reply(ctx, result)
+            return result
+
+        handled = await self._run_local_command(ctx, ev)
+        if handled is not None:
+            return handled
+
+        await ctx.store.set("run_id", ev.input_data.run_id)
+        state = ev.input_data.state
+        if isinstance(state, str):
+            state = json.loads(state)
+        projection = None
+        if isinstance(state, dict) and state:
+            state.pop("messages", None)
+            projection = project_state(state, _last_user_text(ev))
+
+        handled = await self._reply_from_cache(ctx, ev, state, projection)
+        if handled is not None:
+            return handled
+
+        if projection is None:
+            await ctx.store.set("state_tokens", 0)
+            result = await AGUIChatWorkflow.chat(self, ctx, ev)
+        else:
+            await ctx.store.set("state_tokens", count_tokens(str(projection)))
+            projected = ev.model_copy(
+                update={"input_data": ev.input_data.model_copy(update={"state": projection})}
+            )
+            result = await AGUIChatWorkflow.chat(self, _ProjectedStateContext(ctx, state), projected)
+        await self._record_prompt_tokens(ctx)
+        await self._cache_reply(ctx, result)
+        return result
+
+    async def _reply_from_cache(
+        self, ctx: Context, ev: InputEvent, state: Any, projection: Optional[Dict[str, Any]]
+    ) -> Optional[StopEvent]:
+        """Replay a cached reply, or note the key so the finished reply can be stored."""
+        messages = ev.input_data.messages
+        message = _last_user_text(ev)
+        if not messages or messages[-1].role != "user" or not message.strip():
+            return None
+
+        tool_names = [*self.frontend_tools, *self.backend_tools, *(tool.name for tool in ev.input_data.tools or [])]
+        history = [(m.role, m.content if isinstance(m.content, str) else str(m.content)) for m in messages[:-1]]
+        key = response_cache_key(message, tool_names, projection, history)
+        cached = get_cached_response(key)
+        if cached is None:
+            await ctx.store.set("response_cache", {"key": key, "startedAt": time.perf_counter(), "eligible": True})
+            return None
+
+        await ctx.store.set("state", state if isinstance(state, dict) else {})
+        self._reply_without_llm(ctx, messages, cached["reply"])
+        print(f"Answered from the response cache (saved ~{cached['latencySeconds']:.1f}s)")
+        return StopEvent()
+
+    async def _cache_reply(self, ctx: Context, result: Any) -> None:
+        if not isinstance(result, StopEvent):
+            return
+        pending = await ctx.store.get("response_cache", default=None)
+        chat_history = await ctx.store.get("chat_history", default=None)
+        if not pending or not pending["eligible"] or not chat_history:
+            return
+        reply = chat_history[-1].content
+        if chat_history[-1].role.value == "assistant" and reply:
+            store_response(pending["key"], reply, time.perf_counter() - pending["startedAt"])
+
+    def _reply_without_llm(self, ctx: Context, messages: List[Any], reply: str) -> None:
+        """Stream ``reply`` as the assistant's answer and snapshot the conversation."""
+        message_id = str(uuid.uuid4())
+        ctx.write_event_to_stream(
+            TextMessageChunkWorkflowEvent(
+                role="assistant",
+                delta=reply,
+                timestamp=timestamp(),
+                message_id=message_id,
+            )
+        )
+        chat_history = [ag_ui_message_to_llama_index_message(m) for m in messages]
+        chat_history.append(ChatMessage(role="assistant", content=reply, additional_kwargs={"id": message_id}))
+        self._snapshot_messages(ctx, chat_history)
+
+    async def _record_prompt_tokens(self, ctx: Context) -> None:
+        chat_history = await ctx.store.get("chat_history", default=None)
+        if not chat_history:
+            return
+        prompt_tokens = _reported_prompt_tokens.get()
+        estimated = prompt_tokens is None
+        if estimated:
+            if self._tool_tokens is None:
+                self._tool_tokens = sum(
+                    count_tokens(json.dumps(tool.metadata.to_openai_tool()))
+                    for tool in [*self.frontend_tools.values(), *self.backend_tools.values()]
+                )
+            # The last message is the response the LLM just produced.
+            prompt_tokens = self._tool_tokens + sum(_message_tokens(message) for message in chat_history[:-1])
+        record_prompt_tokens(
+            await ctx.store.get("run_id", default=None),
+            prompt_tokens,
+            await ctx.store.get("state_tokens", default=0),
+            estimated=estimated,
+        )
+
+    async def _run_local_command(self, ctx: Context, ev: InputEvent) -> Optional[StopEvent]:
+        messages = ev.input_data.messages
+        state = ev.input_data.state
+        if isinstance(state, str):
+            try:
+                state = json.loads(state)
+            except ValueError:
+                return None
+        if not messages or messages[-1].role != "user" or not isinstance(state, dict):
+            return None
+
+        command = parse_command(messages[-1].content, state, self.backend_tools)
+        if command is None:
+            return None
+        tool_name, tool_kwargs = command
+
+        started = time.perf_counter()
+        state.pop("messages", None)
+        await ctx.store.set("state", state)
+        tool_output, operations = await self._call_tool(ctx, tool_name, tool_kwargs)
+        if operations:
+            ctx.write_event_to_stream(StateDeltaWorkflowEvent(delta=operations))
+
+        self._reply_without_llm(ctx, messages, tool_output.content)
+        print(f"Handled '{tool_name}' command without the LLM in {(time.perf_counter() - started) * 1000:.1f} ms")
+        return StopEvent()
+
+    async def _call_tool(
+        self, ctx: Context, tool_name: str, tool_kwargs: Dict[str, Any]
+    ) -> Tuple[ToolOutput, List[Dict[str, Any]]]:
+        """Run a tool and return its output with the state operations it recorded."""
+        operations: List[Dict[str, Any]] = []
+        token = _pending_operations.set(operations)
+        try:
+            all_tools = {**self.frontend_tools, **self.backend_tools}
+            tool = all_tools[tool_name]
+
+            kwargs = {**tool_kwargs}
+            if isinstance(tool, FunctionTool) and tool.ctx_param_name:
+                kwargs[tool.ctx_param_name] = ctx
+
+            tool_output = await tool.acall(**kwargs)
+        except Exception as e:
+            tool_output = ToolOutput(
+                tool_name=tool_name,
+                content=str(e),
+                raw_input=tool_kwargs,
+                raw_output=str(e),
+                is_error=True,
+            )
+        finally:
+            _pending_operations.reset(token)
+        return tool_output, operations
+
+    @step
+    async def handle_tool_call(self, ctx: Context, ev: ToolCallEvent) -> ToolCallResultEvent:
+        if ev.tool_name not in READ_ONLY_TOOLS:
+            pending = await ctx.store.get("response_cache", default=None)
+            if pending:
+                await ctx.store.set("response_cache", {**pending, "eligible": False})
+        tool_output, operations = await self._call_tool(ctx, ev.tool_name, ev.tool_kwargs)
+        if operations:
+            ctx.write_event_to_stream(StateDeltaWorkflowEvent(delta=operations))
+
+        return ToolCallResultEvent(
+            tool_call_id=ev.tool_call_id,
+            tool_name=ev.tool_name,
+            tool_kwargs=ev.tool_kwargs,
+            tool_output=tool_output,
+        )
@@ -0,0 +1,182 @@
+"""Background re-sync of registered sheets, gated by a cheap change check."""
+
+from __future__ import annotations
+
+import asyncio
+import os
+import random
+import time
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+
+# Starting poll interval for a newly registered sheet, and the adaptive bounds.
+SHEETS_WATCH_INTERVAL_SECONDS = float(os.getenv("SHEETS_WATCH_INTERVAL_SECONDS", "60"))
+SHEETS_WATCH_MIN_INTERVAL_SECONDS = float(os.getenv("SHEETS_WATCH_MIN_INTERVAL_SECONDS", "15"))
+SHEETS_WATCH_MAX_INTERVAL_SECONDS = float(os.getenv("SHEETS_WATCH_MAX_INTERVAL_SECONDS", "900"))
+# Cell edits do not change sheet metadata, so a full fetch still runs at least this often.
+SHEETS_WATCH_FULL_SYNC_SECONDS = float(os.getenv("SHEETS_WATCH_FULL_SYNC_SECONDS", "600"))
+# Each interval is randomized by +/- this fraction so sheets do not poll in lockstep.
+SHEETS_WATCH_JITTER = 0.2
+
+SignatureCheck = Callable[[str, Optional[str]], Awaitable[Optional[str]]]
+SheetLoader = Callable[[str, Optional[str]], Awaitable[Optional[Dict[str, Any]]]]
+
+
+class WatchedSheet:
+    """Polling state and last-sync status of one registered tab."""
+
+    def __init__(self, sheet_id: str, sheet_name: Optional[str], now: float) -> None:
+        self.sheet_id = sheet_id
+        self.sheet_name = sheet_name
+        self.interval_seconds = SHEETS_WATCH_INTERVAL_SECONDS
+        self.registered_at = now
+        self.next_check_at = now
+        self.last_checked_at: Optional[float] = None
+        self.last_synced_at: Optional[float] = None
+        self.last_change_at: Optional[float] = None
+        self.last_error: Optional[str] = None
+        self.signature: Optional[str] = None
+        self.version: Optional[str] = None
+        self.total_cases: Optional[int] = None
+        self.checks = 0
+        self.full_fetches = 0
+        self.skipped_fetches = 0
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "sheetId": self.sheet_id,
+            "sheetName": self.sheet_name,
+            "intervalSeconds": round(self.interval_seconds, 1),
+            "registeredAt": self.registered_at,
+            "nextCheckAt": self.next_check_at,
+            "lastCheckedAt": self.last_checked_at,
+            "lastSyncedAt": self.last_synced_at,
+            "lastChangeAt": self.last_change_at,
+            "lastError": self.last_error,
+            "syncVersion": self.version,
+            "totalCases": self.total_cases,
+            "checks": self.checks,
+            "fullFetches": self.full_fetches,
+            "skippedFetches": self.skipped_fetches,
+        }
+
+
+class SyncScheduler:
+    """Polls registered sheets and re-imports them only when they look changed.
+
+    Every check first computes the sheet's change signature (one metadata
+    call); the full fetch and parse only runs when the signature moved or the
+    last full sync is older than SHEETS_WATCH_FULL_SYNC_SECONDS. Intervals
+    halve after a detected change and grow by half after a quiet check,
+    within the configured bounds, and back off after errors.
+    """
+
+    def __init__(
+        self,
+        check_signature: SignatureCheck,
+        load_sheet: SheetLoader,
+        *,
+        clock: Callable[[], float] = time.time,
+        jitter: Callable[[], float] = random.random,
+    ) -> None:
+        self._check_signature = check_signature
+        self._load_sheet = load_sheet
+        self._clock = clock
+        self._jitter = jitter
+        self._sheets: Dict[Tuple[str, str], WatchedSheet] = {}
+        self._wakeup: Optional[asyncio.Event] = None
+        self._task: Optional["asyncio.Task[None]"] = None
+
+    def watch(self, sheet_id: str, sheet_name: Optional[str] = None) -> Dict[str, Any]:
+        key = (sheet_id, sheet_name or "")
+        entry = self._sheets.get(key)
+        if entry is None:
+            entry = WatchedSheet(sheet_id, sheet_name, self._clock())
+            self._sheets[key] = entry
+            self._wake()
+        return entry.to_dict()
+
+    def unwatch(self, sheet_id: str, sheet_name: Optional[str] = None) -> bool:
+        return self._sheets.pop((sheet_id, sheet_name or ""), None) is not None
+
+    def status(self) -> List[Dict[str, Any]]:
+        return [entry.to_dict() for entry in self._sheets.values()]
+
+    def _wake(self) -> None:
+        if self._wakeup is not None:
+            self._wakeup.set()
+
+    def _next_interval(self, entry: WatchedSheet, changed: bool) -> float:
+        if changed:
+            interval = entry.interval_seconds / 2
+        else:
+            interval = entry.interval_seconds * 1.5
+        return min(SHEETS_WATCH_MAX_INTERVAL_SECONDS, max(SHEETS_WATCH_MIN_INTERVAL_SECONDS, interval))
+
+    async def check(self, entry: WatchedSheet) -> None:
+        now = self._clock()
+        entry.checks += 1
+        entry.last_checked_at = now
+        try:
+            signature = await self._check_signature(entry.sheet_id, entry.sheet_name)
+            if signature is None:
+                raise RuntimeError("Sheet metadata is unavailable.")
+
+            due_for_full_sync = (
+                entry.last_synced_at is None
+                or now - entry.last_synced_at >= SHEETS_WATCH_FULL_SYNC_SECONDS
+            )
+            changed = False
+            if signature == entry.signature and not due_for_full_sync:
+                entry.skipped_fetches += 1
+            else:
+                snapshot = await self._load_sheet(entry.sheet_id, entry.sheet_name)
+                if not snapshot:
+                    raise RuntimeError("Sheet could not be loaded.")
+                entry.full_fetches += 1
+                entry.last_synced_at = now
+                entry.signature = signature
+                entry.total_cases = len(snapshot["cases"])
+                changed = entry.version is not None and snapshot["version"] != entry.version
+                if changed or entry.version is None:
+                    entry.last_change_at = now
+                entry.version = snapshot["version"]
+
+            entry.last_error = None
+            entry.interval_seconds = self._next_interval(entry, changed)
+        except Exception as exc:
+            print(f"Scheduled sync of {entry.sheet_id} failed: {exc}")
+            entry.last_error = str(exc)
+            entry.interval_seconds = min(SHEETS_WATCH_MAX_INTERVAL_SECONDS, entry.interval_seconds * 2)
+
+        spread = 1 + SHEETS_WATCH_JITTER * (2 * self._jitter() - 1)
+        entry.next_check_at = self._clock() + entry.interval_seconds * spread
+
+    async def run(self) -> None:
+        self._wakeup = asyncio.Event()
+        while True:
+            now = self._clock()
+            due = [entry for entry in self._sheets.values() if entry.next_check_at <= now]
+            if due:
+                await asyncio.gather(*(self.check(entry) for entry in due))
+
+            self._wakeup.clear()
+            upcoming = [entry.next_check_at for entry in self._sheets.values()]
+            timeout = max(0.0, min(upcoming) - self._clock()) if upcoming else None
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout)
+            except asyncio.TimeoutError:
+                pass
+
+    def start(self) -> None:
+        if self._task is None or self._task.done():
+            self._task = asyncio.ensure_future(self.run())
+
+    async def stop(self) -> None:
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except (asyncio.CancelledError, Exception):
+            pass
+        self._task = None
@@ -0,0 +1,398 @@
+"""Compiled triage rules used to raise alerts for newly imported cases."""
+
+from __future__ import annotations
+
+from collections import deque
+from datetime import datetime
+from functools import lru_cache
+from typing import Any, Dict, FrozenSet, Hashable, Iterable, Iterator, List, Optional, Set, Tuple
+
+from .case_store import CaseStore, bits_from_positions, positions_from_bits
+from .profile import list_profiles, profiles_version
+
+
+class PatternAutomaton:
+    """Aho-Corasick automaton over a fixed set of lowercase patterns.
+
+    Scanning a text costs one pass over its characters no matter how many
+    patterns were compiled in, instead of one substring search per pattern.
+    Each pattern carries a payload (by default the pattern itself) so callers
+    can learn which patterns matched.
+    """
+
+    def __init__(self, patterns: Iterable[Tuple[str, Hashable]] = ()) -> None:
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+
+        pending: List[Set[Hashable]] = [set()]
+        for pattern, payload in patterns:
+            if not pattern:
+                continue
+            state = 0
+            for char in pattern:
+                next_state = self._goto[state].get(char)
+                if next_state is None:
+                    next_state = len(self._goto)
+                    self._goto[state][char] = next_state
+                    self._goto.append({})
+                    self._fail.append(0)
+                    pending.append(set())
+                state = next_state
+            pending[state].add(payload)
+
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for char, next_state in self._goto[state].items():
+                queue.append(next_state)
+                fallback = self._fail[state]
+                while fallback and char not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                self._fail[next_state] = self._goto[fallback].get(char, 0)
+                pending[next_state] |= pending[self._fail[next_state]]
+
+        self._outputs: List[FrozenSet[Hashable]] = [frozenset(payloads) for payloads in pending]
+        self.empty = len(self._goto) == 1
+
+    @classmethod
+    def from_patterns(cls, patterns: Iterable[str]) -> "PatternAutomaton":
+        return cls((pattern, pattern) for pattern in patterns)
+
+    def _step(self, state: int, char: str) -> int:
+        goto, fail = self._goto, self._fail
+        while state and char not in goto[state]:
+            state = fail[state]
+        return goto[state].get(char, 0)
+
+    def contains_any(self, text: str) -> bool:
+        if self.empty:
+            return False
+        outputs = self._outputs
+        state = 0
+        for char in text:
+            state = self._step(state, char)
+            if outputs[state]:
+                return True
+        return False
+
+    def find_payloads(self, text: str) -> Set[Hashable]:
+        found: Set[Hashable] = set()
+        if self.empty:
+            return found
+        outputs = self._outputs
+        state = 0
+        for char in text:
+            state = self._step(state, char)
+            if outputs[state]:
+                found |= outputs[state]
+        return found
+
+
+def triage_fields(case: Dict[str, Any]) -> Tuple[str, str, str]:
+    """Lowercased (category, jurisdiction, location) of a case.
+
+    Case records built by ``row_to_case`` keep the result on the record so
+    each case is normalized once, even across syncs that reuse it; plain
+    dicts are normalized on every call.
+    """
+    cached = getattr(case, "triage_fields", None)
+    if cached is not None:
+        return cached
+    fields = (
+        (case.get("incidentCategory") or "").lower(),
+        (case.get("jurisdiction") or "").lower(),
+        (case.get("location") or "").lower(),
+    )
+    try:
+        case.triage_fields = fields  # type: ignore[attr-defined]
+    except AttributeError:
+        pass
+    return fields
+
+
+# (case, category, jurisdiction, location, injury reported, property damage)
+TriageRow = Tuple[Any, str, str, str, bool, bool]
+
+
+def _triage_rows(cases: Iterable[Dict[str, Any]]) -> Iterator[TriageRow]:
+    """Normalized triage inputs for a list of cases (CaseStores are scanned column-wise)."""
+    for case in cases:
+        category, jurisdiction, location = triage_fields(case)
+        yield case, category, jurisdiction, location, bool(case.get("injuryReported")), bool(case.get("propertyDamage"))
+
+
+# Fields read by triage_notification.
+_NOTIFICATION_FIELDS = ("incidentId", "incidentCategory", "location", "incidentDate", "fullName")
+
+
+def _notification_case(store: CaseStore, position: int) -> Dict[str, Any]:
+    """The fields a notification needs from a stored case, without materializing the record."""
+    return {field: store.value(field, position) for field in _NOTIFICATION_FIELDS}
+
+
+def _normalized_values(values: Any) -> FrozenSet[str]:
+    return frozenset(
+        value.strip().lower()
+        for value in values or []
+        if isinstance(value, str) and value.strip()
+    )
+
+
+def triage_notification(case: Dict[str, Any], timestamp: str) -> Dict[str, Any]:
+    return {
+        "id": f"triage-{case['incidentId']}",
+        "incidentId": case["incidentId"],
+        "createdAt": timestamp,
+        "message": (
+            f"{case.get('incidentCategory', 'Incident')} at {case.get('location', 'unknown location')} "
+            f"on {case.get('incidentDate', 'unknown date')} involving {case.get('fullName', 'unknown party')}"
+        ),
+        "acknowledged": False,
+    }
+
+
+class TriageMatcher:
+    """A set of triage preferences compiled for repeated evaluation."""
+
+    def __init__(
+        self,
+        categories: FrozenSet[str],
+        cities: FrozenSet[str],
+        require_injury: bool,
+        include_property_damage: bool,
+    ) -> None:
+        self.categories = categories
+        self.cities = cities
+        self.require_injury = require_injury
+        self.include_property_damage = include_property_damage
+        self.city_automaton = PatternAutomaton.from_patterns(cities)
+
+    def matches(self, case: Dict[str, Any]) -> bool:
+        category, jurisdiction, location = triage_fields(case)
+        return self._matches_fields(
+            category, jurisdiction, location, bool(case.get("injuryReported")), bool(case.get("propertyDamage"))
+        )
+
+    def _matches_fields(
+        self, category: str, jurisdiction: str, location: str, injured: bool, damaged: bool
+    ) -> bool:
+        if self.categories and category not in self.categories:
+            return False
+
+        if self.cities:
+            if jurisdiction not in self.cities and not self.city_automaton.contains_any(location):
+                return False
+
+        if self.require_injury and not injured:
+            return False
+
+        if not self.include_property_damage and damaged and not injured:
+            return False
+
+        return True
+
+    def _store_matches(self, store: CaseStore) -> Iterator[int]:
+        """Positions of matching cases, decided on dictionary codes and flag bitsets.
+
+        Category and jurisdiction are tested once per distinct value; only the
+        cases whose jurisdiction misses are scanned for a city in their
+        location, and each distinct location is scanned once.
+        """
+        bits = (1 << len(store)) - 1
+        if self.categories:
+            bits &= store.code_mask("incidentCategory", lambda value: (value or "").lower() in self.categories)
+
+        if self.cities and bits:
+            in_city = store.code_mask("jurisdiction", lambda value: (value or "").lower() in self.cities)
+            locations = store.lowered_column("location")
+            scanned: Dict[str, bool] = {}
+            for position in positions_from_bits(bits & ~in_city):
+                location = locations[position]
+                if location not in scanned:
+                    scanned[location] = self.city_automaton.contains_any(location)
+            by_location = bits_from_positions(
+                (position for position, location in enumerate(locations) if scanned.get(location)),
+                len(store),
+            )
+            bits &= in_city | by_location
+
+        injured = store.mask("injuryReported")
+        if self.require_injury:
+            bits &= injured
+        if not self.include_property_damage:
+            bits &= ~(store.mask("propertyDamage") & ~injured)
+        return positions_from_bits(bits)
+
+    def evaluate(self, cases: Iterable[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Notifications for every matching case; accepts a list or a CaseStore."""
+        timestamp = datetime.utcnow().isoformat()
+        if isinstance(cases, CaseStore):
+            return [
+                triage_notification(_notification_case(cases, position), timestamp)
+                for position in self._store_matches(cases)
+            ]
+        return [
+            triage_notification(case, timestamp)
+            for case, *fields in _triage_rows(cases)
+            if self._matches_fields(*fields)
+        ]
+
+
+@lru_cache(maxsize=64)
+def _compile(
+    categories: FrozenSet[str],
+    cities: FrozenSet[str],
+    require_injury: bool,
+    include_property_damage: bool,
+) -> TriageMatcher:
+    return TriageMatcher(categories, cities, require_injury, include_property_damage)
+
+
+def compile_triage_preferences(preferences: Optional[Dict[str, Any]]) -> TriageMatcher:
+    """Compile ``triagePreferences`` once; identical preferences share a matcher."""
+    preferences = preferences or {}
+    return _compile(
+        _normalized_values(preferences.get("categoriesOfInterest")),
+        _normalized_values(preferences.get("citiesOfInterest")),
+        bool(preferences.get("requireInjury", False)),
+        bool(preferences.get("includePropertyDamage", True)),
+    )
+
+
+class SubscriptionIndex:
+    """Inverted index from category and city values to the profiles watching them.
+
+    Routing a case costs one category lookup, one jurisdiction lookup and one
+    automaton pass over its location, however many profiles are subscribed,
+    instead of evaluating every profile's preferences in turn.
+    """
+
+    def __init__(self, profiles: Iterable[Dict[str, Any]], version: int = 0) -> None:
+        self.version = version
+        self.by_category: Dict[str, Set[str]] = {}
+        self.by_city: Dict[str, Set[str]] = {}
+        self.any_category: Set[str] = set()
+        self.any_city: Set[str] = set()
+        self.require_injury: Set[str] = set()
+        self.exclude_property_only: Set[str] = set()
+        # Profiles that name at least one category or city of interest.
+        self.subscribed: Set[str] = set()
+
+        for profile in profiles:
+            profile_id = str(profile.get("id"))
+            preferences = profile.get("triagePreferences") or {}
+            categories = _normalized_values(preferences.get("categoriesOfInterest"))
+            cities = _normalized_values(preferences.get("citiesOfInterest"))
+            if categories or cities:
+                self.subscribed.add(profile_id)
+
+            if categories:
+                for category in categories:
+                    self.by_category.setdefault(category, set()).add(profile_id)
+            else:
+                self.any_category.add(profile_id)
+
+            if cities:
+                for city in cities:
+                    self.by_city.setdefault(city, set()).add(profile_id)
+            else:
+                self.any_city.add(profile_id)
+
+            if preferences.get("requireInjury", False):
+                self.require_injury.add(profile_id)
+            if not preferences.get("includePropertyDamage", True):
+                self.exclude_property_only.add(profile_id)
+
+        self.city_automaton = PatternAutomaton.from_patterns(self.by_city)
+
+    def route(self, case: Dict[str, Any]) -> Set[str]:
+        """Return the ids of every profile whose preferences match ``case``."""
+        category, jurisdiction, location = triage_fields(case)
+        return self._route_fields(
+            category, jurisdiction, location, bool(case.get("injuryReported")), bool(case.get("propertyDamage"))
+        )
+
+    def _route_fields(
+        self, category: str, jurisdiction: str, location: str, injured: bool, damaged: bool
+    ) -> Set[str]:
+        interested = self.by_category.get(category, set()) | self.any_category
+        if not interested:
+            return interested
+
+        by_city = self.any_city | self.by_city.get(jurisdiction, set())
+        for city in self.city_automaton.find_payloads(location):
+            by_city |= self.by_city[city]
+        interested &= by_city
+
+        if not injured:
+            interested -= self.require_injury
+            if damaged:
+                interested -= self.exclude_property_only
+        return interested
+
+    def _route_store(self, store: CaseStore) -> Iterator[Tuple[int, Set[str]]]:
+        """``(position, profile ids)`` for a CaseStore, resolving each distinct value once."""
+        categories = [(value or "").lower() for value in store.dictionaries["incidentCategory"].values]
+        by_category = [self.by_category.get(category, set()) | self.any_category for category in categories]
+        jurisdictions = [(value or "").lower() for value in store.dictionaries["jurisdiction"].values]
+        by_jurisdiction = [self.any_city | self.by_city.get(jurisdiction, set()) for jurisdiction in jurisdictions]
+        locations = store.lowered_column("location")
+        by_location: Dict[str, Set[str]] = {}
+
+        for position, category_code, jurisdiction_code, injured, damaged in zip(
+            range(len(store)),
+            store.codes("incidentCategory"),
+            store.codes("jurisdiction"),
+            store.flags("injuryReported"),
+            store.flags("propertyDamage"),
+        ):
+            interested = by_category[category_code]
+            if not interested:
+                continue
+            location = locations[position]
+            in_location = by_location.get(location)
+            if in_location is None:
+                in_location = set()
+                for city in self.city_automaton.find_payloads(location):
+                    in_location |= self.by_city[city]
+                by_location[location] = in_location
+            interested = interested & (by_jurisdiction[jurisdiction_code] | in_location)
+            if not injured:
+                interested -= self.require_injury
+                if damaged:
+                    interested -= self.exclude_property_only
+            if interested:
+                yield position, interested
+
+    def route_cases(self, cases: Iterable[Dict[str, Any]]) -> Dict[str, List[Dict[str, Any]]]:
+        """Group triage notifications for ``cases`` by interested profile id."""
+        timestamp = datetime.utcnow().isoformat()
+        routed: Dict[str, List[Dict[str, Any]]] = {}
+        if isinstance(cases, CaseStore):
+            for position, profile_ids in self._route_store(cases):
+                notification = triage_notification(_notification_case(cases, position), timestamp)
+                for profile_id in profile_ids:
+                    routed.setdefault(profile_id, []).append(notification)
+            return routed
+        for case, *fields in _triage_rows(cases):
+            profile_ids = self._route_fields(*fields)
+            if not profile_ids:
+                continue
+            notification = triage_notification(case, timestamp)
+            for profile_id in profile_ids:
+                routed.setdefault(profile_id, []).append(notification)
+        return routed
+
+
+_subscription_index: Optional[SubscriptionIndex] = None
+
+
+def get_subscription_index() -> SubscriptionIndex:
+    """Return the subscription index for the current profile store."""
+    global _subscription_index
+    version = profiles_version()
+    index = _subscription_index
+    if index is None or index.version != version:
+        index = SubscriptionIndex(list_profiles(), version)
+        _subscription_index = index
+    return index
@@ -1,11 +1,26 @@
 from __future__ import annotations
 
+import asyncio
 import os
+import random
 import re
-from typing import Any, Dict, Optional
+import time
+import uuid
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Tuple
 
 import httpx
 
+# Outbound calls placed at once by the batch queue, and the overall call rate.
+VAPI_CALL_CONCURRENCY = int(os.getenv("VAPI_CALL_CONCURRENCY", "2"))
+VAPI_CALLS_PER_MINUTE = float(os.getenv("VAPI_CALLS_PER_MINUTE", "30"))
+# Attempts per queued call; retries back off exponentially from the base delay.
+VAPI_CALL_MAX_ATTEMPTS = int(os.getenv("VAPI_CALL_MAX_ATTEMPTS", "4"))
+VAPI_RETRY_BASE_SECONDS = float(os.getenv("VAPI_RETRY_BASE_SECONDS", "1"))
+VAPI_RETRY_MAX_SECONDS = 30.0
+# Finished jobs kept for status polling.
+VAPI_JOB_HISTORY = 1000
+
 
 class VoiceCallConfigurationError(RuntimeError):
     """Raised when voice call configuration is incomplete."""
@@ -15,6 +30,48 @@ class VoiceCallRequestError(ValueError):
     """Raised when a voice call request payload is invalid."""
 
 
+class VoiceCallUpstreamError(VoiceCallRequestError):
+    """Raised when Vapi is unreachable or answers 429/503; the call may succeed if retried."""
+
+    def __init__(self, message: str, retry_after: Optional[float] = None) -> None:
+        super().__init__(message)
+        self.retry_after = retry_after
+
+
+class VoiceCallOutcomeUnknownError(VoiceCallRequestError):
+    """Raised when the request reached Vapi but no answer came back; the call may have been placed."""
+
+
+# ---------------------------------------------------------------------------- #
+# Shared HTTP client
+# ---------------------------------------------------------------------------- #
+
+_http_client: Optional[httpx.AsyncClient] = None
+
+
+def _vapi_base_url() -> str:
+    return os.getenv("VAPI_API_BASE_URL", "https://api.vapi.ai").rstrip("/")
+
+
+def get_http_client() -> httpx.AsyncClient:
+    """Return the process-wide pooled client for Vapi, creating it on first use."""
+    global _http_client
+    if _http_client is None or _http_client.is_closed:
+        _http_client = httpx.AsyncClient(
+            base_url=_vapi_base_url(),
+            timeout=15.0,
+            limits=httpx.Limits(max_connections=max(4, VAPI_CALL_CONCURRENCY * 2), max_keepalive_connections=8),
+        )
+    return _http_client
+
+
+async def close_http_client() -> None:
+    global _http_client
+    if _http_client is not None:
+        await _http_client.aclose()
+        _http_client = None
+
+
 def _normalize_phone_number(raw_number: str) -> str:
     """Convert a phone number into E.164 format (US fallback) for Vapi."""
 
@@ -37,20 +94,19 @@ def _normalize_phone_number(raw_number: str) -> str:
     raise VoiceCallRequestError("Unable to normalize phone number to E.164 format.")
 
 
-async def start_voice_call(
+def _build_call_request(
     *,
     incident_id: str,
     full_name: str,
     phone_number: str,
     incident_summary: Optional[str] = None,
-) -> Dict[str, Any]:
-    """Initiate an outbound phone call via Vapi."""
+) -> Tuple[Dict[str, Any], Dict[str, str], str]:
+    """Validate configuration and return the Vapi payload, headers and dialed number."""
 
     api_key = os.getenv("VAPI_API_KEY")
     assistant_id = os.getenv("VAPI_ASSISTANT_ID")
     phone_number_id = os.getenv("VAPI_PHONE_NUMBER_ID")
     phone_number_override = os.getenv("VAPI_PHONE_NUMBER")
-    base_url = os.getenv("VAPI_API_BASE_URL", "https://api.vapi.ai").rstrip("/")
 
     if not api_key:
         raise VoiceCallConfigurationError("VAPI_API_KEY is not configured.")
@@ -92,10 +148,46 @@ async def start_voice_call(
         "Authorization": f"Bearer {api_key}",
         "Content-Type": "application/json",
     }
+    return payload, headers, customer_number
+
 
-    async with httpx.AsyncClient(base_url=base_url, timeout=15.0) as client:
-        response = await client.post("/call", json=payload, headers=headers)
+def _retry_after_seconds(response: httpx.Response) -> Optional[float]:
+    value = response.headers.get("retry-after")
+    try:
+        return max(0.0, float(value)) if value else None
+    except ValueError:
+        return None
+
+
+async def start_voice_call(
+    *,
+    incident_id: str,
+    full_name: str,
+    phone_number: str,
+    incident_summary: Optional[str] = None,
+) -> Dict[str, Any]:
+    """Initiate an outbound phone call via Vapi."""
 
+    payload, headers, customer_number = _build_call_request(
+        incident_id=incident_id,
+        full_name=full_name,
+        phone_number=phone_number,
+        incident_summary=incident_summary,
+    )
+
+    try:
+        response = await get_http_client().post("/call", json=payload, headers=headers)
+    except (httpx.ConnectError, httpx.ConnectTimeout) as exc:
+        # Nothing was sent, so placing the call again cannot duplicate it.
+        raise VoiceCallUpstreamError(f"Vapi request failed: {exc}") from exc
+    except httpx.TransportError as exc:
+        raise VoiceCallOutcomeUnknownError(f"Vapi request sent but not answered: {exc}") from exc
+
+    if response.status_code in (429, 503):
+        raise VoiceCallUpstreamError(
+            f"Vapi call failed with status {response.status_code}: {response.text}",
+            retry_after=_retry_after_seconds(response),
+        )
     if response.status_code >= 400:
         detail = response.text
         raise VoiceCallRequestError(
@@ -111,3 +203,184 @@ async def start_voice_call(
         "payload": data,
         "message": f"Initiated voice call to {customer_number}",
     }
+
+
+# ---------------------------------------------------------------------------- #
+# Batch call queue
+# ---------------------------------------------------------------------------- #
+
+
+class _RateLimiter:
+    """Spaces acquisitions evenly so at most ``per_minute`` happen each minute."""
+
+    def __init__(self, per_minute: float) -> None:
+        self.spacing = 60.0 / per_minute if per_minute > 0 else 0.0
+        self._next_slot = 0.0
+        self._lock = asyncio.Lock()
+
+    async def acquire(self) -> None:
+        if not self.spacing:
+            return
+        async with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next_slot)
+            self._next_slot = slot + self.spacing
+        if slot > now:
+            await asyncio.sleep(slot - now)
+
+
+class VoiceCallJob:
+    """One queued outbound call and its delivery status."""
+
+    def __init__(self, batch_id: str, request: Dict[str, Any]) -> None:
+        self.id = uuid.uuid4().hex
+        self.batch_id = batch_id
+        self.request = request
+        self.status = "queued"
+        self.attempts = 0
+        self.call_id: Optional[str] = None
+        self.error: Optional[str] = None
+        self.created_at = time.time()
+        self.updated_at = self.created_at
+
+    def _set(self, status: str) -> None:
+        self.status = status
+        self.updated_at = time.time()
+
+    @property
+    def finished(self) -> bool:
+        return self.status in ("succeeded", "failed", "unknown")
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "jobId": self.id,
+            "batchId": self.batch_id,
+            "incidentId": self.request.get("incident_id"),
+            "status": self.status,
+            "attempts": self.attempts,
+            "callId": self.call_id,
+            "error": self.error,
+            "createdAt": self.created_at,
+            "updatedAt": self.updated_at,
+        }
+
+
+class VoiceCallQueue:
+    """Places queued calls with bounded concurrency, a rate limit and retries.
+
+    ``VAPI_CALL_CONCURRENCY`` workers take jobs from an asyncio queue; each
+    attempt waits for a slot from the shared rate limiter. Connection
+    failures, 429s and 503s are retried with exponential backoff and jitter
+    (or the server's Retry-After) up to ``VAPI_CALL_MAX_ATTEMPTS``; a request
+    that went out but got no answer ends as ``unknown`` rather than risk a
+    second call, and other errors fail immediately.
+    """
+
+    def __init__(
+        self,
+        *,
+        concurrency: int = VAPI_CALL_CONCURRENCY,
+        calls_per_minute: float = VAPI_CALLS_PER_MINUTE,
+        max_attempts: int = VAPI_CALL_MAX_ATTEMPTS,
+    ) -> None:
+        self.concurrency = max(1, concurrency)
+        self.max_attempts = max(1, max_attempts)
+        self._limiter = _RateLimiter(calls_per_minute)
+        self._jobs: "OrderedDict[str, VoiceCallJob]" = OrderedDict()
+        self._queue: Optional["asyncio.Queue[VoiceCallJob]"] = None
+        self._workers: List["asyncio.Task[None]"] = []
+
+    def start(self) -> None:
+        if self._workers:
+            return
+        self._queue = asyncio.Queue()
+        self._workers = [asyncio.ensure_future(self._work()) for _ in range(self.concurrency)]
+
+    async def stop(self) -> None:
+        for worker in self._workers:
+            worker.cancel()
+        for worker in self._workers:
+            try:
+                await worker
+            except (asyncio.CancelledError, Exception):
+                pass
+        self._workers = []
+
+    def submit(self, requests: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """Queue one job per call request; returns the batch id and initial job states.
+
+        Raises VoiceCallRequestError or VoiceCallConfigurationError without
+        queueing anything if any request cannot be placed.
+        """
+        for request in requests:
+            # Configuration and phone number problems fail the whole batch up front.
+            _build_call_request(**request)
+        self.start()
+        batch_id = uuid.uuid4().hex
+        jobs = [VoiceCallJob(batch_id, request) for request in requests]
+        for job in jobs:
+            self._jobs[job.id] = job
+            self._queue.put_nowait(job)
+        self._prune()
+        return {"batchId": batch_id, "jobs": [job.to_dict() for job in jobs]}
+
+    def job(self, job_id: str) -> Optional[Dict[str, Any]]:
+        job = self._jobs.get(job_id)
+        return job.to_dict() if job else None
+
+    def batch(self, batch_id: str) -> List[Dict[str, Any]]:
+        return [job.to_dict() for job in self._jobs.values() if job.batch_id == batch_id]
+
+    def _prune(self) -> None:
+        excess = len(self._jobs) - VAPI_JOB_HISTORY
+        if excess <= 0:
+            return
+        for job_id in [job_id for job_id, job in self._jobs.items() if job.finished][:excess]:
+            del self._jobs[job_id]
+
+    async def _work(self) -> None:
+        while True:
+            job = await self._queue.get()
+            try:
+                await self._place(job)
+            finally:
+                self._queue.task_done()
+
+    async def _place(self, job: VoiceCallJob) -> None:
+        while True:
+            job.attempts += 1
+            job._set("in_progress")
+            await self._limiter.acquire()
+            try:
+                result = await start_voice_call(**job.request)
+            except VoiceCallUpstreamError as exc:
+                job.error = str(exc)
+                if job.attempts >= self.max_attempts:
+                    job._set("failed")
+                    return
+                delay = exc.retry_after
+                if delay is None:
+                    delay = min(VAPI_RETRY_MAX_SECONDS, VAPI_RETRY_BASE_SECONDS * 2 ** (job.attempts - 1))
+                    delay *= 0.5 + random.random() / 2
+                job._set("retrying")
+                await asyncio.sleep(delay)
+                continue
+            except VoiceCallOutcomeUnknownError as exc:
+                # Vapi may have placed the call; retrying could ring the customer twice.
+                job.error = str(exc)
+                job._set("unknown")
+                return
+            except (VoiceCallRequestError, VoiceCallConfigurationError) as exc:
+                job.error = str(exc)
+                job._set("failed")
+                return
+            except Exception as exc:  # pragma: no cover - defensive logging
+                print(f"Voice call job {job.id} failed: {exc}")
+                job.error = str(exc)
+                job._set("failed")
+                return
+
+            job.call_id = result.get("callId")
+            job.error = None
+            job._set("succeeded")
+            return
@@ -0,0 +1,260 @@
+"""Benchmarks for the ingestion, triage and feed-filter hot paths.
+
+Synthetic sheets are generated from the police-report CSVs in ``data/`` and
+every hot path is timed at each requested size. ``import_cases_from_sheet``
+runs end to end against an in-process stand-in for the Composio client, so no
+network access or credentials are needed.
+
+Run from the ``agent`` directory::
+
+    uv run python -m benchmarks.bench_hot_paths --sizes 1000 100000 1000000 --output bench.json
+
+The on-disk sheet cache is disabled for the whole run, and every
+``import_cases_from_sheet`` repeat starts from empty in-memory caches so it
+times a cold import; the no-change re-import is timed under its own label.
+
+Results are written as JSON (one record per benchmark and size) so runs can
+be diffed or loaded into a tracking dashboard.
+"""
+
+from __future__ import annotations
+
+import argparse
+import csv
+import gc
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+# Keep benchmark snapshots (up to millions of rows) out of agent/.cache; must be
+# set before the agent modules read it.
+os.environ["SHEETS_CACHE_PATH"] = ""
+
+from agent import sheets_integration  # noqa: E402
+from agent.feed_filter import (  # noqa: E402
+    _apply_feed_filter_to_cases,
+    _case_indexes,
+    _case_indexes_lock,
+    get_case_index,
+)
+from agent.sheets_integration import (  # noqa: E402
+    EXPECTED_COLUMNS,
+    evaluate_triage,
+    import_cases_from_sheet,
+    parse_case_store,
+    parse_cases_from_sheet,
+    row_to_case,
+    summarize_cases,
+)
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+SEED_FILES = (
+    REPO_ROOT / "data" / "claude_police_reports_updated.csv",
+    REPO_ROOT / "data" / "chatgpt_police_reports_updated.csv",
+)
+DEFAULT_SIZES = (1_000, 100_000, 1_000_000)
+
+TRIAGE_PREFERENCES: Dict[str, Any] = {
+    "categoriesOfInterest": [],
+    "requireInjury": False,
+    "includePropertyDamage": True,
+    "citiesOfInterest": ["San Francisco", "Oakland", "Fremont", "San Jose", "Berkeley", "Hayward"],
+}
+FEED_FILTERS: Dict[str, Dict[str, Any]] = {
+    "text": {"searchText": "collision neck"},
+    "facets": {"jurisdictions": ["SF"], "injury": True, "propertyDamage": None},
+}
+
+
+def load_seed_rows() -> List[List[str]]:
+    """Data rows from the seed CSVs, reordered to EXPECTED_COLUMNS."""
+    rows: List[List[str]] = []
+    for path in SEED_FILES:
+        with path.open(newline="", encoding="utf-8") as handle:
+            for record in csv.DictReader(handle):
+                rows.append([record.get(column, "") or "" for column in EXPECTED_COLUMNS])
+    return rows
+
+
+def synthetic_sheet(seed_rows: List[List[str]], size: int) -> List[List[str]]:
+    """A header row plus ``size`` data rows cycled from the seeds with unique incident ids."""
+    id_index = EXPECTED_COLUMNS.index("incident_id")
+    rows: List[List[str]] = [list(EXPECTED_COLUMNS)]
+    for number in range(size):
+        row = list(seed_rows[number % len(seed_rows)])
+        prefix = row[id_index].split("-", 1)[0] or "SYN"
+        row[id_index] = f"{prefix}-{number:08d}"
+        rows.append(row)
+    return rows
+
+
+class FakeComposio:
+    """Answers the two Google Sheets tool slugs used by get_sheet_data."""
+
+    def __init__(self, rows: List[List[str]], sheet_name: str = "Reports") -> None:
+        self.rows = rows
+        self.sheet_name = sheet_name
+        self.tools = self
+
+    def execute(self, user_id: str, slug: str, arguments: Dict[str, Any]) -> Dict[str, Any]:
+        if slug == "GOOGLESHEETS_GET_SPREADSHEET_INFO":
+            return {
+                "successful": True,
+                "data": {
+                    "response_data": {
+                        "properties": {"title": "Benchmark"},
+                        "sheets": [
+                            {
+                                "properties": {
+                                    "title": self.sheet_name,
+                                    "gridProperties": {"rowCount": len(self.rows)},
+                                }
+                            }
+                        ],
+                    }
+                },
+            }
+        if slug == "GOOGLESHEETS_BATCH_GET":
+            return {"successful": True, "data": {"valueRanges": [{"values": self.rows}]}}
+        return {"successful": False, "error": f"unsupported slug {slug}"}
+
+
+def install_fake_client(rows: List[List[str]]) -> None:
+    sheets_integration._composio_client = FakeComposio(rows)
+    sheets_integration._composio_user_id = "benchmark"
+    sheets_integration.invalidate_spreadsheet_info()
+
+
+def reset_sheet_state() -> None:
+    """Forget every parsed snapshot, spreadsheet info entry and case index."""
+    with sheets_integration._snapshot_lock:
+        sheets_integration._sheet_snapshots.clear()
+        sheets_integration._sheet_version_history.clear()
+        sheets_integration._snapshot_aliases.clear()
+    sheets_integration.invalidate_spreadsheet_info()
+    sheets_integration._sheet_cache.clear()
+    with _case_indexes_lock:
+        _case_indexes.clear()
+
+
+def time_call(
+    fn: Callable[[], Any], repeats: int, setup: Optional[Callable[[], Any]] = None
+) -> List[float]:
+    timings: List[float] = []
+    for _ in range(repeats):
+        if setup is not None:
+            setup()
+        gc.collect()
+        started = time.perf_counter()
+        fn()
+        timings.append(time.perf_counter() - started)
+    return timings
+
+
+def record(name: str, size: int, timings: List[float]) -> Dict[str, Any]:
+    best = min(timings)
+    return {
+        "name": name,
+        "rows": size,
+        "repeats": len(timings),
+        "bestSeconds": best,
+        "meanSeconds": statistics.mean(timings),
+        "rowsPerSecond": (size / best) if best else None,
+    }
+
+
+def run_size(seed_rows: List[List[str]], size: int, repeats: int) -> List[Dict[str, Any]]:
+    rows = synthetic_sheet(seed_rows, size)
+    sheet_data = {"rows": rows}
+    headers = list(EXPECTED_COLUMNS)
+    cases = parse_cases_from_sheet(sheet_data)
+    store = parse_case_store(sheet_data)
+    results: List[Dict[str, Any]] = []
+
+    def bench(name: str, fn: Callable[[], Any], setup: Optional[Callable[[], Any]] = None) -> None:
+        results.append(record(name, size, time_call(fn, repeats, setup)))
+        print(f"  {name:<40} {results[-1]['bestSeconds']:.4f}s", file=sys.stderr)
+
+    bench("parse_cases_from_sheet", lambda: parse_cases_from_sheet(sheet_data))
+    bench("parse_case_store", lambda: parse_case_store(sheet_data))
+    bench("row_to_case", lambda: [row_to_case(row, headers) for row in rows[1:]])
+    bench("evaluate_triage[list]", lambda: evaluate_triage(cases, TRIAGE_PREFERENCES))
+    bench("evaluate_triage[store]", lambda: evaluate_triage(store, TRIAGE_PREFERENCES))
+    bench("summarize_cases[list]", lambda: summarize_cases(cases))
+    bench("summarize_cases[store]", lambda: summarize_cases(store))
+    # Cold runs bind a new sync version so every call builds its own index;
+    # warm runs reuse the index built here.
+    get_case_index(cases)
+    for label, feed_filter in FEED_FILTERS.items():
+        bench(
+            f"feed_filter[{label},cold]",
+            lambda feed_filter=feed_filter: _apply_feed_filter_to_cases(
+                cases, feed_filter, {"syncVersion": f"cold-{time.perf_counter()}"}
+            ),
+        )
+        bench(
+            f"feed_filter[{label},warm]",
+            lambda feed_filter=feed_filter: _apply_feed_filter_to_cases(cases, feed_filter),
+        )
+
+    install_fake_client(rows)
+
+    def run_import() -> Any:
+        return import_cases_from_sheet("benchmark-sheet", triage_preferences=TRIAGE_PREFERENCES)
+
+    bench("import_cases_from_sheet[cold]", run_import, setup=reset_sheet_state)
+    # Re-importing an unchanged sheet takes the incremental path (every row reused).
+    reset_sheet_state()
+    run_import()
+    bench("import_cases_from_sheet[unchanged]", run_import)
+    reset_sheet_state()
+    return results
+
+
+def git_commit() -> Optional[str]:
+    try:
+        return subprocess.check_output(
+            ["git", "rev-parse", "HEAD"], cwd=REPO_ROOT, text=True, stderr=subprocess.DEVNULL
+        ).strip()
+    except Exception:
+        return None
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=list(DEFAULT_SIZES))
+    parser.add_argument("--repeats", type=int, default=3)
+    parser.add_argument("--output", type=Path, help="Write JSON results here instead of stdout.")
+    args = parser.parse_args(argv)
+
+    seed_rows = load_seed_rows()
+    results: List[Dict[str, Any]] = []
+    for size in args.sizes:
+        print(f"{size} rows", file=sys.stderr)
+        results.extend(run_size(seed_rows, size, args.repeats))
+
+    report = {
+        "createdAt": datetime.utcnow().isoformat(),
+        "gitCommit": git_commit(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "seedRows": len(seed_rows),
+        "results": results,
+    }
+    payload = json.dumps(report, indent=2)
+    if args.output:
+        args.output.write_text(payload + "\n", encoding="utf-8")
+    else:
+        print(payload)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,85 @@
+"""Local stand-in for the Vapi ``POST /call`` API.
+
+Accepts outbound-call requests without dialing anyone, so the voice call
+endpoints and the batch queue can be exercised offline. A configurable share
+of requests is answered with 429 or 503 to exercise retries, and every
+accepted payload is kept for inspection at ``GET /calls``.
+
+Run from the ``agent`` directory and point the backend at it::
+
+    uv run python -m benchmarks.vapi_stub --port 8787 --fail-rate 0.2
+    VAPI_API_BASE_URL=http://127.0.0.1:8787 VAPI_API_KEY=test VAPI_ASSISTANT_ID=test \\
+        VAPI_PHONE_NUMBER_ID=test uv run dev
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import random
+import time
+import uuid
+from typing import Any, Dict, List
+
+import uvicorn
+from fastapi import FastAPI, Request
+from fastapi.responses import JSONResponse
+
+
+def create_app(*, fail_rate: float = 0.0, latency_seconds: float = 0.05) -> FastAPI:
+    app = FastAPI()
+    calls: List[Dict[str, Any]] = []
+    counters = {"requests": 0, "rejected": 0, "inFlight": 0, "maxInFlight": 0}
+
+    @app.post("/call")
+    async def create_call(request: Request):
+        counters["requests"] += 1
+        counters["inFlight"] += 1
+        counters["maxInFlight"] = max(counters["maxInFlight"], counters["inFlight"])
+        try:
+            await asyncio.sleep(latency_seconds)
+            if not request.headers.get("authorization", "").startswith("Bearer "):
+                return JSONResponse(status_code=401, content={"message": "Missing bearer token"})
+            if random.random() < fail_rate:
+                counters["rejected"] += 1
+                if random.random() < 0.5:
+                    return JSONResponse(
+                        status_code=429,
+                        content={"message": "Too many requests"},
+                        headers={"Retry-After": "1"},
+                    )
+                return JSONResponse(status_code=503, content={"message": "Service unavailable"})
+
+            payload = await request.json()
+            call = {
+                "id": uuid.uuid4().hex,
+                "status": "queued",
+                "createdAt": time.time(),
+                "assistantId": payload.get("assistantId"),
+                "customer": payload.get("customer"),
+                "metadata": payload.get("metadata"),
+            }
+            calls.append(call)
+            return JSONResponse(status_code=201, content=call)
+        finally:
+            counters["inFlight"] -= 1
+
+    @app.get("/calls")
+    async def list_calls():
+        return {"calls": calls, **counters}
+
+    return app
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8787)
+    parser.add_argument("--fail-rate", type=float, default=0.0, help="Share of requests answered with 429/503.")
+    parser.add_argument("--latency", type=float, default=0.05, help="Seconds each request takes.")
+    args = parser.parse_args()
+    uvicorn.run(create_app(fail_rate=args.fail_rate, latency_seconds=args.latency), host=args.host, port=args.port)
+
+
+if __name__ == "__main__":
+    main()
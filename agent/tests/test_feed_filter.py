@@ -0,0 +1,60 @@
+import pytest
+
+from agent.feed_filter import InvalidCursorError, _decode_cursor, _encode_cursor, query_cases
+
+
+def _cases(count=5):
+    return [
+        {
+            "incidentId": f"C{position}",
+            "incidentDate": f"2024-01-{position + 1:02d}",
+            "incidentTime": f"{9 + position:02d}:00",
+            "incidentCategory": "Traffic",
+        }
+        for position in range(count)
+    ]
+
+
+def test_cursor_pages_through_sorted_matches():
+    cases = _cases()
+    first = query_cases(cases, {}, sort_fields=["incidentDate"], limit=2)
+    second = query_cases(cases, {}, sort_fields=["incidentDate"], limit=2, cursor=first["nextCursor"])
+    assert [case["incidentId"] for case in first["cases"] + second["cases"]] == ["C0", "C1", "C2", "C3"]
+
+
+@pytest.mark.parametrize(
+    "sort_fields, descending",
+    [
+        ((), False),
+        (("incidentTime",), False),
+        (("incidentDate", "incidentTime"), False),
+        (("incidentDate",), True),
+    ],
+)
+def test_cursor_rejected_for_another_sort(sort_fields, descending):
+    cases = _cases()
+    cursor = query_cases(cases, {}, sort_fields=["incidentDate"], limit=2)["nextCursor"]
+    with pytest.raises(InvalidCursorError):
+        query_cases(cases, {}, sort_fields=sort_fields, descending=descending, limit=2, cursor=cursor)
+
+
+def test_cursor_rejected_for_another_filter():
+    cases = _cases()
+    cursor = query_cases(cases, {}, sort_fields=["incidentDate"], limit=2)["nextCursor"]
+    with pytest.raises(InvalidCursorError):
+        query_cases(cases, {"searchText": "traffic"}, sort_fields=["incidentDate"], limit=2, cursor=cursor)
+
+
+@pytest.mark.parametrize("key", [[1], ["2024-01-02", "C1"], ["2024-01-02", "C1", "1"], ["2024-01-02", "C1", True]])
+def test_cursor_key_must_match_sort_shape(key):
+    cases = _cases()
+    cursor = query_cases(cases, {}, sort_fields=["incidentDate"], limit=2)["nextCursor"]
+    forged = _encode_cursor({**_decode_cursor(cursor), "k": key})
+    with pytest.raises(InvalidCursorError):
+        query_cases(cases, {}, sort_fields=["incidentDate"], limit=2, cursor=forged)
+
+
+@pytest.mark.parametrize("cursor", ["not base64!", _encode_cursor({"q": "x"}), "bnVsbA"])
+def test_malformed_cursor_rejected(cursor):
+    with pytest.raises(InvalidCursorError):
+        query_cases(_cases(), {}, limit=2, cursor=cursor)
@@ -0,0 +1,127 @@
+from datetime import datetime
+from itertools import product
+
+import pytest
+
+from agent.sheets_integration import (
+    _DATE_PARSERS,
+    _TIME_PARSERS,
+    DATE_FORMATS,
+    TIME_FORMATS,
+    ColumnParsers,
+    diff_case_fingerprints,
+    normalize_date,
+    normalize_time,
+    parse_cases_incrementally,
+)
+
+HEADER = ["Incident ID", "Full Name", "Incident Category", "Location"]
+
+
+def _rows(*cases):
+    return [HEADER, *([incident_id, name, "Traffic", "Main St"] for incident_id, name in cases)]
+
+
+def _ids(cases):
+    return [case["incidentId"] for case in cases]
+
+
+def test_diff_reports_added_changed_and_removed():
+    base = parse_cases_incrementally(_rows(("C1", "Ann"), ("C2", "Bo"), ("C3", "Cy")))
+    current = parse_cases_incrementally(_rows(("C1", "Ann"), ("C3", "Cyrus"), ("C4", "Di")), base)
+
+    delta = diff_case_fingerprints(current["cases"], current["fingerprints"], base["fingerprints"])
+
+    assert _ids(delta["added"]) == ["C4"]
+    assert _ids(delta["changed"]) == ["C3"]
+    assert delta["changed"][0]["fullName"] == "Cyrus"
+    assert delta["removed"] == ["C2"]
+
+
+def test_diff_of_unchanged_tab_is_empty():
+    base = parse_cases_incrementally(_rows(("C1", "Ann"), ("C2", "Bo")))
+    current = parse_cases_incrementally(_rows(("C1", "Ann"), ("C2", "Bo")), base)
+
+    delta = diff_case_fingerprints(current["cases"], current["fingerprints"], base["fingerprints"])
+
+    assert delta == {"added": [], "changed": [], "removed": []}
+
+
+def test_diff_accepts_case_lists():
+    base = parse_cases_incrementally(_rows(("C1", "Ann")))
+    current = parse_cases_incrementally(_rows(("C1", "Ann"), ("C2", "Bo")), base)
+
+    delta = diff_case_fingerprints(current["cases"][:], current["fingerprints"], base["fingerprints"])
+
+    assert _ids(delta["added"]) == ["C2"]
+
+
+def test_diff_rejects_duplicate_incident_ids():
+    base = parse_cases_incrementally(_rows(("C1", "Ann"), ("C2", "Bo")))
+    current = parse_cases_incrementally(_rows(("C1", "Ann"), ("C2", "Bo"), ("C1", "Ann B")), base)
+
+    with pytest.raises(ValueError):
+        diff_case_fingerprints(current["cases"], current["fingerprints"], base["fingerprints"])
+
+
+# --------------------------------------------------------------------------- #
+# Regex date/time parsers against strptime
+# --------------------------------------------------------------------------- #
+
+YEARS = ["2024", "2023", "2000", "2100", "1900", "0999", "0001", "0000", "999", "20245", " 2024"]
+NUMBERS = ["0", "00", "1", "01", " 1", "1 ", "9", "09", "10", "12", "13", "19", "20", "23", "24", "28",
+           "29", "30", "31", "32", "59", "60", "001", " 12", "x"]
+MERIDIEMS = ["am", "pm", "AM", "Pm", "a.m.", "xm", ""]
+
+
+def _strptime(value, fmt, output):
+    try:
+        return datetime.strptime(value, fmt).strftime(output)
+    except ValueError:
+        return None
+
+
+def _date_values(fmt):
+    for year, month, day in product(YEARS, NUMBERS, NUMBERS):
+        yield fmt.replace("%Y", year).replace("%m", month).replace("%d", day)
+
+
+def _time_values(fmt):
+    minutes = NUMBERS if "%M" in fmt else [""]
+    seconds = ["00", "5", "59", "60", "61"] if "%S" in fmt else [""]
+    meridiems = MERIDIEMS if "%p" in fmt else [""]
+    for hour, minute, second, meridiem in product(NUMBERS, minutes, seconds, meridiems):
+        value = fmt.replace("%H", hour).replace("%I", hour).replace("%M", minute).replace("%S", second)
+        value = value.replace("%p", meridiem)
+        yield from (value, f" {value} ", value.replace(" ", "  "))
+
+
+@pytest.mark.parametrize("fmt", DATE_FORMATS)
+def test_date_parser_matches_strptime(fmt):
+    parse = _DATE_PARSERS[fmt]
+    column = ColumnParsers(date_format=fmt).incident_date
+    for value in _date_values(fmt):
+        expected = _strptime(value, fmt, "%Y-%m-%d")
+        # Years before 1000 are handed to the strptime fallback.
+        assert parse(value) in (expected, None), value
+        assert expected is not None or parse(value) is None, value
+        if parse(value) is None:
+            assert column(value) == normalize_date(value), value
+
+
+@pytest.mark.parametrize("fmt", TIME_FORMATS)
+def test_time_parser_matches_strptime(fmt):
+    parse = _TIME_PARSERS[fmt]
+    column = ColumnParsers(time_format=fmt).incident_time
+    for value in _time_values(fmt):
+        assert parse(value) == _strptime(value.strip(), fmt, "%H:%M"), value
+        assert column(value) == normalize_time(value), value
+
+
+def test_date_parser_checks_leap_years():
+    parse = _DATE_PARSERS["%Y-%m-%d"]
+    assert parse("2024-02-29") == "2024-02-29"
+    assert parse("2000-02-29") == "2000-02-29"
+    assert parse("2023-02-29") is None
+    assert parse("2100-02-29") is None
+    assert parse("2024-04-31") is None
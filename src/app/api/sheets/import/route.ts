@@ -10,6 +10,7 @@ export async function POST(request: NextRequest) {
       sheet_name,
       visibleCaseLimit,
       triagePreferences,
+      sinceVersion,
     } = body;
 
     const effectiveSheetId = sheetId ?? sheet_id;
@@ -24,19 +25,27 @@ export async function POST(request: NextRequest) {
 
     // Make request to Python agent's import endpoint
     const agentUrl = process.env.AGENT_URL || 'http://localhost:9000';
+    const ifNoneMatch = request.headers.get('if-none-match');
     const response = await fetch(`${agentUrl}/sheets/sync`, {
       method: 'POST',
       headers: {
         'Content-Type': 'application/json',
+        ...(ifNoneMatch ? { 'If-None-Match': ifNoneMatch } : {}),
       },
       body: JSON.stringify({
         sheet_id: effectiveSheetId,
         sheet_name: effectiveSheetName,
         visible_case_limit: visibleCaseLimit ?? 97,
         triage_preferences: triagePreferences,
+        since_version: sinceVersion,
       }),
     });
 
+    const etag = response.headers.get('etag');
+    if (response.status === 304) {
+      return new NextResponse(null, { status: 304, headers: etag ? { ETag: etag } : undefined });
+    }
+
     if (!response.ok) {
       const errorText = await response.text();
       console.error('Agent import failed:', errorText);
@@ -47,7 +56,7 @@ export async function POST(request: NextRequest) {
     }
 
     const result = await response.json();
-    return NextResponse.json(result);
+    return NextResponse.json(result, etag ? { headers: { ETag: etag } } : undefined);
 
   } catch (error) {
     console.error('Import error:', error);
@@ -10,7 +10,12 @@ import { CaseFeed } from "@/components/dashboard/CaseFeed";
 import { NotificationsPanel } from "@/components/dashboard/NotificationsPanel";
 import { SummarySection } from "@/components/dashboard/SummarySection";
 import { TriagePreferencesForm } from "@/components/dashboard/TriagePreferencesForm";
-import type { DashboardState, NotificationEntry, TriagePreferences } from "@/lib/dashboard/types";
+import type {
+  CaseRecord,
+  DashboardState,
+  NotificationEntry,
+  TriagePreferences,
+} from "@/lib/dashboard/types";
 import { initialDashboardState, initialFeedFilterState } from "@/lib/dashboard/types";
 import {
   applyFeedFilter,
@@ -23,6 +28,7 @@ import {
   triggerVoiceCall,
   updateTriagePreferences,
 } from "@/lib/dashboard/api";
+import type { ImportCasesResponse } from "@/lib/dashboard/api";
 import { cn } from "@/lib/utils";
 const HARDCODED_SHEET_ID = "1Dam-5BADE3dYCib1uFdhSNJ8aGkUMJCOEwYCQifsfbk";
 
@@ -46,6 +52,25 @@ function mergeNotifications(
   );
 }
 
+function mergeCaseDelta(
+  cases: CaseRecord[],
+  queuedCases: CaseRecord[],
+  response: ImportCasesResponse
+): { cases: CaseRecord[]; queuedCases: CaseRecord[] } {
+  const removed = new Set(response.removed ?? []);
+  const changed = new Map((response.changed ?? []).map((item) => [item.incidentId, item]));
+  const update = (items: CaseRecord[]) =>
+    items
+      .filter((item) => !removed.has(item.incidentId))
+      .map((item) => changed.get(item.incidentId) ?? item);
+
+  // Added cases wait in the queue until the live feed releases them.
+  return {
+    cases: update(cases),
+    queuedCases: [...update(queuedCases), ...(response.added ?? [])],
+  };
+}
+
 export default function LawyerDashboardPage() {
   const { state, setState } = useCoAgent<DashboardState>({
     name: "lawyer_copilot",
@@ -129,31 +154,39 @@ export default function LawyerDashboardPage() {
       setIsImporting(true);
       setStatusMessage(null);
       try {
+        const sameSheet =
+          viewState.sheet.sheetId === sheetId && viewState.sheet.sheetName === sheetName;
         const response = await importCases({
           sheetId,
           sheetName,
           triagePreferences: viewState.profile.triagePreferences,
           visibleCaseLimit: Math.max(viewState.liveFeed.nextCaseIndex, 97),
+          sinceVersion: sameSheet ? viewState.sheet.syncVersion : undefined,
         });
 
         setState((previous) => {
           const current = previous || initialDashboardState;
+          const { cases, queuedCases } =
+            response.syncMode === "delta"
+              ? mergeCaseDelta(current.cases, current.queuedCases, response)
+              : { cases: response.cases ?? [], queuedCases: response.queuedCases ?? [] };
           return {
             ...current,
-            cases: response.cases,
-            queuedCases: response.queuedCases,
-            activeCaseId: response.cases[0]?.incidentId ?? current.activeCaseId,
+            cases,
+            queuedCases,
+            activeCaseId: cases[0]?.incidentId ?? current.activeCaseId,
             profile: response.profile,
             sheet: {
               sheetId: response.sheet.sheetId,
               sheetName: response.sheet.sheetName,
               lastSyncedAt: response.sheet.lastSyncedAt,
+              syncVersion: response.syncVersion,
             },
             notifications: mergeNotifications(current.notifications, response.notifications),
             metrics: response.metrics,
             liveFeed: {
               ...current.liveFeed,
-              nextCaseIndex: response.cases.length,
+              nextCaseIndex: cases.length,
             },
             lastAction: `Imported ${response.totalCases} cases from Google Sheets`,
           };
@@ -169,7 +202,14 @@ export default function LawyerDashboardPage() {
         setIsImporting(false);
       }
     },
-    [setState, viewState.liveFeed.nextCaseIndex, viewState.profile.triagePreferences]
+    [
+      setState,
+      viewState.liveFeed.nextCaseIndex,
+      viewState.profile.triagePreferences,
+      viewState.sheet.sheetId,
+      viewState.sheet.sheetName,
+      viewState.sheet.syncVersion,
+    ]
   );
 
   useEffect(() => {
@@ -17,12 +17,21 @@ export interface ImportCasesPayload {
   sheetName?: string;
   visibleCaseLimit?: number;
   triagePreferences?: TriagePreferences;
+  /** syncVersion from a previous import; the backend then answers with a delta. */
+  sinceVersion?: string;
 }
 
 export interface ImportCasesResponse {
   success: boolean;
-  cases: CaseRecord[];
-  queuedCases: CaseRecord[];
+  syncMode?: "full" | "delta";
+  syncVersion?: string;
+  baseVersion?: string;
+  /** Present on full syncs; delta syncs send added/changed/removed instead. */
+  cases?: CaseRecord[];
+  queuedCases?: CaseRecord[];
+  added?: CaseRecord[];
+  changed?: CaseRecord[];
+  removed?: string[];
   sheet: SheetMetadata;
   profile: LawyerProfile;
   notifications: NotificationEntry[];
@@ -40,6 +49,7 @@ export async function importCases(payload: ImportCasesPayload): Promise<ImportCa
       sheetName: payload.sheetName,
       visibleCaseLimit: payload.visibleCaseLimit ?? 97,
       triagePreferences: payload.triagePreferences,
+      sinceVersion: payload.sinceVersion,
     }),
   });
 
@@ -46,7 +46,7 @@ export function applyFeedFilter(cases: CaseRecord[], rawFilter: FeedFilterState
   const normalizedJurisdictions = filter.jurisdictions.map(normalize);
   const normalizedIncidentIds = filter.incidentIds.map(normalize);
 
-  return cases.filter((record) => {
+  const matches = cases.filter((record) => {
     if (normalizedIncidentIds.length > 0 && !normalizedIncidentIds.includes(normalize(record.incidentId))) {
       return false;
     }
@@ -86,6 +86,17 @@ export function applyFeedFilter(cases: CaseRecord[], rawFilter: FeedFilterState
 
     return true;
   });
+
+  return filter.sort === "relevance" ? orderByRank(matches, filter.rankedIncidentIds) : matches;
+}
+
+// Ranked cases first, best match first; the rest keep sheet order.
+function orderByRank(cases: CaseRecord[], rankedIncidentIds: string[]): CaseRecord[] {
+  const rank = new Map(rankedIncidentIds.map((incidentId, index) => [incidentId, index]));
+  const ranked = cases
+    .filter((record) => rank.has(record.incidentId))
+    .sort((a, b) => (rank.get(a.incidentId) ?? 0) - (rank.get(b.incidentId) ?? 0));
+  return [...ranked, ...cases.filter((record) => !rank.has(record.incidentId))];
 }
 
 export function summarizeFeedFilter(filter: FeedFilterState): string {
@@ -123,5 +134,9 @@ export function summarizeFeedFilter(filter: FeedFilterState): string {
     parts.push(`Text contains "${filter.searchText.trim()}"`);
   }
 
+  if (filter.sort === "relevance") {
+    parts.push("Ranked by relevance");
+  }
+
   return parts.join(" • ") || "Custom filter";
 }
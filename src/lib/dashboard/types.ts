@@ -52,12 +52,16 @@ export interface FeedFilterState {
   injury: boolean | null;
   propertyDamage: boolean | null;
   incidentIds: string[];
+  sort: "relevance" | null;
+  rankedIncidentIds: string[];
 }
 
 export interface SheetBinding {
   sheetId: string;
   sheetName?: string;
   lastSyncedAt?: string;
+  /** Version of the sync the cases in state came from; keys the agent's case index. */
+  syncVersion?: string;
 }
 
 export interface DashboardMetrics {
@@ -65,6 +69,11 @@ export interface DashboardMetrics {
   injuryCount: number;
   propertyDamageCount: number;
   casesByCategory: Record<string, number>;
+  casesByJurisdiction?: Record<string, number>;
+  casesByFaultDetermination?: Record<string, number>;
+  casesByResolution?: Record<string, number>;
+  casesByDay?: Record<string, number>;
+  casesByHour?: Record<string, number>;
 }
 
 export interface DashboardState {
@@ -101,6 +110,8 @@ export const initialFeedFilterState: FeedFilterState = {
   injury: null,
   propertyDamage: null,
   incidentIds: [],
+  sort: null,
+  rankedIncidentIds: [],
 };
 
 export const initialDashboardState: DashboardState = {